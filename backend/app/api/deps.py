@@ -21,33 +21,149 @@ from sqlalchemy.orm import Session
 from app.core.config import get_settings
 from app.core.permissions import can_review_public_content
 from app.core.security import decode_access_token, oauth2_scheme
-from app.db.session import get_db
+from app.db.session import SessionLocal, get_db
 from app.schemas.auth import CurrentPrincipal
 from app.services.admin_review_service import AdminReviewService
 from app.services.ai.api_ai_service import ApiAiService
 from app.services.ai.local_ai_service import LocalAiService
+from app.services.archive_service import ArchiveService
 from app.services.artifact_service import ArtifactService
 from app.services.auth_service import AuthService
 from app.services.caching_service import CachingService
+from app.services.circuit_breaker import CircuitBreakerRegistry
 from app.services.dashboard_service import DashboardService
+from app.services.domain_blocklist_index import DomainBlocklistIndex
+from app.services.enrichment.domain_blocklist_client import DomainBlocklistClient
+from app.services.enrichment.geoip_client import GeoIpClient
+from app.services.enrichment.ip_range_client import IpRangeClient
+from app.services.enrichment.local_hash_client import LocalHashClient
+from app.services.enrichment.local_intel_client import LocalIntelClient
 from app.services.enrichment.source_a_client import SourceAClient
 from app.services.enrichment.source_b_client import SourceBClient
 from app.services.enrichment.source_c_client import SourceCClient
 from app.services.enrichment.virustotal_client import VirusTotalClient
+from app.services.feed_import_service import FeedImportService
+from app.services.geoip_database import GeoIpDatabase
+from app.services.http_pool import HttpClientPool
+from app.services.index_reloader import ReloadingIndex
 from app.services.ioc_extraction_service import IocExtractionService
+from app.services.ip_range_index import IpRangeIndex
+from app.services.local_hash_index import LocalHashIndex
 from app.services.normalization_service import NormalizationService
 from app.services.public_sharing_service import PublicSharingService
+from app.services.rate_limiter import EnrichmentRateLimiter
 from app.services.report_service import ReportService
+from app.services.retro_hunt_service import RetroHuntService
 from app.services.sanitization_service import SanitizationService
+from app.services.scan_job_engine import DatabaseScanJobEngine, ScanJobEngine
+from app.services.scan_job_queue import DatabaseScanJobQueue
 from app.services.scan_orchestrator import ScanOrchestrator
+from app.services.scan_stream_service import ScanStreamService
+from app.services.upload_scan_service import UploadScanService
+
+
+@lru_cache
+def _build_scan_job_queue() -> DatabaseScanJobQueue:
+    """Build the durable scan job queue shared by the API and worker processes."""
+    settings = get_settings()
+    return DatabaseScanJobQueue(
+        session_factory=SessionLocal,
+        lease_seconds=settings.scan_job_lease_seconds,
+        max_attempts=settings.scan_job_max_attempts,
+        ioc_extraction_service=IocExtractionService(),
+    )
 
 
 @lru_cache
 def _build_report_service() -> ReportService:
-    """Build shared in-memory report service."""
+    """Build shared report service; database mode also reads reports written by workers."""
+    if get_settings().scan_job_backend == "database":
+        return ReportService(report_loader=_build_scan_job_queue().get_report)
     return ReportService()
 
 
+@lru_cache
+def _build_caching_service() -> CachingService:
+    """Build the shared bounded scan and enrichment caches."""
+    settings = get_settings()
+    return CachingService(
+        max_entries=settings.scan_cache_max_entries,
+        max_bytes=settings.scan_cache_max_mb * 1024 * 1024,
+        clean_ttl_seconds=settings.scan_cache_clean_ttl_seconds,
+        suspicious_ttl_seconds=settings.scan_cache_suspicious_ttl_seconds,
+        malicious_ttl_seconds=settings.scan_cache_malicious_ttl_seconds,
+        enrichment_max_entries=settings.enrichment_cache_max_entries,
+        enrichment_max_bytes=settings.enrichment_cache_max_mb * 1024 * 1024,
+        enrichment_ttl_seconds=settings.enrichment_cache_ttl_seconds,
+        enrichment_ttl_overrides=settings.enrichment_cache_ttl_overrides,
+    )
+
+
+@lru_cache
+def _build_http_client_pool() -> HttpClientPool:
+    """Build the keep-alive HTTP client pool shared by every enrichment adapter."""
+    settings = get_settings()
+    return HttpClientPool(
+        max_connections=settings.http_pool_max_connections,
+        max_keepalive_connections=settings.http_pool_max_keepalive_connections,
+        keepalive_expiry_seconds=settings.http_pool_keepalive_expiry_seconds,
+        timeout_seconds=settings.http_timeout_seconds,
+        http2_enabled=settings.http_pool_http2_enabled,
+    )
+
+
+@lru_cache
+def _build_enrichment_rate_limiter() -> EnrichmentRateLimiter:
+    """Build per-adapter quota buckets from `ENRICHMENT_RATE_LIMITS`."""
+    return EnrichmentRateLimiter(get_settings().enrichment_rate_limits)
+
+
+@lru_cache
+def _build_circuit_breakers() -> CircuitBreakerRegistry:
+    """Build per-adapter circuit breakers with the shared rolling-window settings."""
+    settings = get_settings()
+    return CircuitBreakerRegistry(
+        window_size=settings.circuit_breaker_window_size,
+        min_calls=settings.circuit_breaker_min_calls,
+        failure_rate_threshold=settings.circuit_breaker_failure_rate,
+        open_seconds=settings.circuit_breaker_open_seconds,
+        min_timeout_seconds=settings.circuit_breaker_min_timeout_seconds,
+    )
+
+
+@lru_cache
+def _build_local_hash_index() -> ReloadingIndex[LocalHashIndex]:
+    """Map the compiled known-bad hash corpus and pick up rebuilt files without a restart."""
+    settings = get_settings()
+    return ReloadingIndex(
+        settings.local_hash_index_path,
+        LocalHashIndex,
+        check_interval_seconds=settings.local_index_reload_seconds,
+    )
+
+
+@lru_cache
+def _build_domain_blocklist() -> ReloadingIndex[DomainBlocklistIndex]:
+    """Map the compiled domain blocklist and pick up rebuilt files without a restart."""
+    settings = get_settings()
+    return ReloadingIndex(
+        settings.domain_blocklist_path,
+        DomainBlocklistIndex,
+        check_interval_seconds=settings.local_index_reload_seconds,
+    )
+
+
+@lru_cache
+def _build_geoip_database() -> ReloadingIndex[GeoIpDatabase]:
+    """Map the compiled GeoIP/ASN database read-only; every worker process shares its pages."""
+    settings = get_settings()
+    return ReloadingIndex(
+        settings.geoip_database_path,
+        GeoIpDatabase,
+        check_interval_seconds=settings.local_index_reload_seconds,
+    )
+
+
 @lru_cache
 def _build_scan_orchestrator() -> ScanOrchestrator:
     """Build the shared scan orchestrator and its adapters."""
@@ -59,6 +175,7 @@ def _build_scan_orchestrator() -> ScanOrchestrator:
                 api_key=settings.virustotal_api_key,
                 base_url=settings.virustotal_base_url,
                 timeout_seconds=settings.http_timeout_seconds,
+                http_pool=_build_http_client_pool(),
             )
         )
     if settings.source_a_enabled:
@@ -67,6 +184,16 @@ def _build_scan_orchestrator() -> ScanOrchestrator:
         enrichment_adapters.append(SourceBClient())
     if settings.source_c_enabled:
         enrichment_adapters.append(SourceCClient())
+    if settings.local_hash_index_path:
+        enrichment_adapters.append(LocalHashClient(_build_local_hash_index()))
+    if settings.domain_blocklist_path:
+        enrichment_adapters.append(DomainBlocklistClient(_build_domain_blocklist()))
+    if settings.ip_range_feeds:
+        enrichment_adapters.append(IpRangeClient(IpRangeIndex.from_csv(settings.ip_range_feeds)))
+    if settings.geoip_database_path:
+        enrichment_adapters.append(GeoIpClient(_build_geoip_database()))
+    if settings.local_intel_enabled:
+        enrichment_adapters.append(LocalIntelClient(SessionLocal, NormalizationService()))
 
     ai_services = {
         "local": LocalAiService(enabled=settings.local_ai_enabled),
@@ -80,10 +207,86 @@ def _build_scan_orchestrator() -> ScanOrchestrator:
         artifact_service=ArtifactService(),
         normalization_service=NormalizationService(),
         ioc_extraction_service=IocExtractionService(),
-        caching_service=CachingService(),
+        caching_service=_build_caching_service(),
         enrichment_adapters=enrichment_adapters,
         ai_services=ai_services,
         report_service=_build_report_service(),
+        adapter_timeout_seconds=settings.http_timeout_seconds,
+        enrichment_deadline_seconds=settings.enrichment_deadline_seconds,
+        adapter_timeouts=settings.enrichment_timeout_overrides,
+        rate_limiter=_build_enrichment_rate_limiter(),
+        circuit_breakers=_build_circuit_breakers() if settings.circuit_breaker_enabled else None,
+        early_exit_min_sources=settings.early_exit_min_sources,
+        early_exit_min_confidence=settings.early_exit_min_confidence,
+        batch_window_seconds=settings.enrichment_batch_window_ms / 1000,
+        batch_max_size=settings.enrichment_batch_max_size,
+    )
+
+
+@lru_cache
+def _build_scan_job_engine() -> ScanJobEngine | DatabaseScanJobEngine:
+    """Build the in-process worker pool, or the database handoff used with `app.worker`."""
+    settings = get_settings()
+    if settings.scan_job_backend == "database":
+        return DatabaseScanJobEngine(orchestrator=_build_scan_orchestrator(), queue=_build_scan_job_queue())
+    return ScanJobEngine(
+        orchestrator=_build_scan_orchestrator(),
+        worker_count=settings.scan_worker_count,
+        queue_max_size=settings.scan_queue_max_size,
+    )
+
+
+@lru_cache
+def _build_scan_stream_service() -> ScanStreamService:
+    """Build the NDJSON ingestion service on top of the active scan job engine."""
+    settings = get_settings()
+    return ScanStreamService(
+        engine=_build_scan_job_engine(),
+        batch_size=settings.scan_stream_batch_size,
+        max_line_bytes=settings.scan_stream_max_line_bytes,
+    )
+
+
+@lru_cache
+def _build_upload_scan_service() -> UploadScanService:
+    """Build the streaming file-upload service on top of the active scan job engine."""
+    settings = get_settings()
+    return UploadScanService(
+        engine=_build_scan_job_engine(),
+        ioc_extraction_service=IocExtractionService(),
+        max_upload_bytes=settings.max_upload_size_mb * 1024 * 1024,
+        spool_threshold_bytes=settings.upload_spool_threshold_kb * 1024,
+        archive_service=ArchiveService(
+            IocExtractionService(),
+            max_depth=settings.archive_max_depth,
+            max_members=settings.archive_max_members,
+            max_total_bytes=settings.archive_max_total_mb * 1024 * 1024,
+            spool_threshold_bytes=settings.upload_spool_threshold_kb * 1024,
+        ),
+    )
+
+
+@lru_cache
+def _build_feed_import_service() -> FeedImportService:
+    """Build the bulk threat-feed importer writing to the local indicator table."""
+    settings = get_settings()
+    return FeedImportService(
+        session_factory=SessionLocal,
+        normalization_service=NormalizationService(),
+        batch_size=settings.feed_import_batch_size,
+        max_feed_bytes=settings.feed_import_max_mb * 1024 * 1024,
+        spool_threshold_bytes=settings.upload_spool_threshold_kb * 1024,
+    )
+
+
+@lru_cache
+def _build_retro_hunt_service() -> RetroHuntService:
+    """Build the retro-hunt service; only the database backend indexes scans it can match."""
+    settings = get_settings()
+    return RetroHuntService(
+        session_factory=SessionLocal,
+        batch_size=settings.retro_hunt_batch_size,
+        scans_indexed=settings.scan_job_backend == "database",
     )
 
 
@@ -125,6 +328,56 @@ def get_scan_orchestrator() -> ScanOrchestrator:
     return _build_scan_orchestrator()
 
 
+def get_caching_service() -> CachingService:
+    """Dependency wrapper for cache inspection routes."""
+    return _build_caching_service()
+
+
+def get_http_client_pool() -> HttpClientPool:
+    """Dependency wrapper for the shared enrichment HTTP client pool."""
+    return _build_http_client_pool()
+
+
+def get_enrichment_rate_limiter() -> EnrichmentRateLimiter:
+    """Dependency wrapper for enrichment quota monitoring."""
+    return _build_enrichment_rate_limiter()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Dependency wrapper for adapter circuit breaker monitoring."""
+    return _build_circuit_breakers()
+
+
+def get_scan_job_queue() -> DatabaseScanJobQueue:
+    """Dependency wrapper for the durable scan job queue."""
+    return _build_scan_job_queue()
+
+
+def get_scan_job_engine() -> ScanJobEngine | DatabaseScanJobEngine:
+    """Dependency wrapper for background scan job access."""
+    return _build_scan_job_engine()
+
+
+def get_scan_stream_service() -> ScanStreamService:
+    """Dependency wrapper for streaming NDJSON scan ingestion."""
+    return _build_scan_stream_service()
+
+
+def get_upload_scan_service() -> UploadScanService:
+    """Dependency wrapper for streaming file uploads."""
+    return _build_upload_scan_service()
+
+
+def get_feed_import_service() -> FeedImportService:
+    """Dependency wrapper for bulk threat-feed imports."""
+    return _build_feed_import_service()
+
+
+def get_retro_hunt_service() -> RetroHuntService:
+    """Dependency wrapper for retro-hunts over past scans."""
+    return _build_retro_hunt_service()
+
+
 def get_public_sharing_service() -> PublicSharingService:
     """Dependency wrapper for public sharing service access."""
     return _build_public_sharing_service()
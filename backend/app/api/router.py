@@ -15,6 +15,8 @@ TODO Checklist:
 from fastapi import APIRouter
 
 from app.api.routes import (
+    admin_cache,
+    admin_feeds,
     admin_reviews,
     auth,
     dashboard,
@@ -36,5 +38,7 @@ api_router.include_router(scan_jobs.router)
 api_router.include_router(reports.router)
 api_router.include_router(public_threats.router)
 api_router.include_router(admin_reviews.router)
+api_router.include_router(admin_cache.router)
+api_router.include_router(admin_feeds.router)
 api_router.include_router(dashboard.router)
 api_router.include_router(integrations.router)
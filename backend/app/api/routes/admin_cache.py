@@ -0,0 +1,40 @@
+"""
+Purpose:
+    Admin endpoints to inspect and flush the scan caches.
+Inputs:
+    Optional cache layer name for flushes.
+Outputs:
+    Cache counters and flush acknowledgements.
+Dependencies:
+    Caching service and admin auth dependency.
+TODO Checklist:
+    - [ ] Add per-key invalidation if analysts need to force a single rescan.
+"""
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_caching_service, require_admin
+from app.schemas.auth import CurrentPrincipal
+from app.schemas.cache import CacheFlushResponse, CacheStatsResponse
+from app.services.caching_service import CachingService
+
+router = APIRouter(prefix="/admin-cache", tags=["admin-cache"])
+
+
+@router.get("", response_model=list[CacheStatsResponse])
+async def get_cache_stats(
+    _: CurrentPrincipal = Depends(require_admin),
+    caching_service: CachingService = Depends(get_caching_service),
+) -> list[CacheStatsResponse]:
+    """Return occupancy and hit/miss/eviction counters for each cache layer."""
+    return [CacheStatsResponse(**stats) for stats in caching_service.stats()]
+
+
+@router.delete("", response_model=CacheFlushResponse)
+async def flush_cache(
+    name: str | None = None,
+    _: CurrentPrincipal = Depends(require_admin),
+    caching_service: CachingService = Depends(get_caching_service),
+) -> CacheFlushResponse:
+    """Flush one cache layer (`?name=scan` or `?name=enrichment`) or every layer."""
+    return CacheFlushResponse(flushed_entries=caching_service.flush(name))
@@ -0,0 +1,73 @@
+"""
+Purpose:
+    Admin endpoints to bulk-import threat feeds and retro-hunt past scans against them.
+Inputs:
+    A raw CSV, STIX 2.1 bundle, or MISP JSON request body plus source name and optional format;
+    an import id for retro-hunts.
+Outputs:
+    Import counters and throughput for the run, and retro-hunt match counts.
+Dependencies:
+    Feed import and retro-hunt services and the admin auth dependency.
+TODO Checklist:
+    - [ ] Run very large imports as background jobs with progress polling.
+"""
+
+import asyncio
+import logging
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Request
+
+from app.api.deps import get_feed_import_service, get_retro_hunt_service, require_admin
+from app.schemas.auth import CurrentPrincipal
+from app.schemas.feed_import import FeedImportResponse, RetroHuntResponse
+from app.services.feed_import_service import FeedImportService
+from app.services.retro_hunt_service import RetroHuntService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin-feeds", tags=["admin-feeds"])
+
+
+@router.post("/import", response_model=FeedImportResponse)
+async def import_feed(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    source: str,
+    feed_format: str | None = None,
+    file_name: str | None = None,
+    retro_hunt: bool = True,
+    _: CurrentPrincipal = Depends(require_admin),
+    feed_import_service: FeedImportService = Depends(get_feed_import_service),
+    retro_hunt_service: RetroHuntService = Depends(get_retro_hunt_service),
+) -> FeedImportResponse:
+    """
+    Stream a feed body (`--data-binary @feed.json`) into the local indicator table.
+
+    When the import added or changed indicators, a retro-hunt over past scans runs after
+    the response is sent. The in-memory job backend keeps no scan index, so no hunt is
+    scheduled there and `retro_hunt_scheduled` stays false.
+    """
+    result = await feed_import_service.import_upload(
+        request.stream(),
+        request.headers.get("content-length"),
+        source,
+        feed_format,
+        file_name,
+    )
+    if retro_hunt and (result.inserted or result.updated):
+        if not retro_hunt_service.scans_indexed:
+            logger.info("Skipping retro-hunt for import %s: the scan job backend keeps no scan index", result.import_id)
+            return result
+        background_tasks.add_task(retro_hunt_service.hunt, result.import_id)
+        result = result.model_copy(update={"retro_hunt_scheduled": True})
+    return result
+
+
+@router.post("/retro-hunt/{import_id}", response_model=RetroHuntResponse)
+async def run_retro_hunt(
+    import_id: str,
+    _: CurrentPrincipal = Depends(require_admin),
+    retro_hunt_service: RetroHuntService = Depends(get_retro_hunt_service),
+) -> RetroHuntResponse:
+    """Re-run the retro-hunt for one import; matches already recorded are not flagged twice."""
+    return await asyncio.to_thread(retro_hunt_service.hunt, import_id)
@@ -4,7 +4,7 @@ Purpose:
 Inputs:
     Runtime settings and feature flags.
 Outputs:
-    Lists of enabled sources and future public API status.
+    Lists of enabled sources, future public API status, and adapter HTTP pool, quota, and circuit breaker stats.
 Dependencies:
     Config settings, feature flags, and integration schemas.
 TODO Checklist:
@@ -13,9 +13,25 @@ TODO Checklist:
 
 from fastapi import APIRouter, Depends
 
+from app.api.deps import (
+    get_circuit_breakers,
+    get_enrichment_rate_limiter,
+    get_http_client_pool,
+    require_admin,
+)
 from app.core.config import Settings, get_settings
 from app.core.feature_flags import public_threats_api_enabled
-from app.schemas.integrations import IntegrationCatalogEntry, PublicApiStatusResponse
+from app.schemas.auth import CurrentPrincipal
+from app.schemas.integrations import (
+    CircuitBreakerStatsResponse,
+    HttpPoolStatsResponse,
+    IntegrationCatalogEntry,
+    PublicApiStatusResponse,
+    RateLimitStatsResponse,
+)
+from app.services.circuit_breaker import CircuitBreakerRegistry
+from app.services.http_pool import HttpClientPool
+from app.services.rate_limiter import EnrichmentRateLimiter
 
 router = APIRouter(prefix="/integrations", tags=["integrations"])
 
@@ -78,3 +94,30 @@ async def get_public_api_status(
             "Keep this disabled during MVP unless the team explicitly enters phase 2 work.",
         ],
     )
+
+
+@router.get("/http-pools", response_model=list[HttpPoolStatsResponse])
+async def get_http_pool_stats(
+    _: CurrentPrincipal = Depends(require_admin),
+    http_pool: HttpClientPool = Depends(get_http_client_pool),
+) -> list[HttpPoolStatsResponse]:
+    """Return per-adapter request counters and keep-alive connection usage."""
+    return [HttpPoolStatsResponse(**row) for row in http_pool.stats()]
+
+
+@router.get("/rate-limits", response_model=list[RateLimitStatsResponse])
+async def get_rate_limit_stats(
+    _: CurrentPrincipal = Depends(require_admin),
+    rate_limiter: EnrichmentRateLimiter = Depends(get_enrichment_rate_limiter),
+) -> list[RateLimitStatsResponse]:
+    """Return quota settings, queued calls, and wait times per scan priority."""
+    return [RateLimitStatsResponse(**row) for row in rate_limiter.stats()]
+
+
+@router.get("/circuit-breakers", response_model=list[CircuitBreakerStatsResponse])
+async def get_circuit_breaker_stats(
+    _: CurrentPrincipal = Depends(require_admin),
+    circuit_breakers: CircuitBreakerRegistry = Depends(get_circuit_breakers),
+) -> list[CircuitBreakerStatsResponse]:
+    """Return breaker state, error rate, latency percentiles, and current adaptive timeout."""
+    return [CircuitBreakerStatsResponse(**row) for row in circuit_breakers.stats()]
@@ -7,52 +7,129 @@ Owner:
 Inputs:
     Scan job create payloads and authenticated principal context.
 Outputs:
-    Scan job status responses built by the orchestrator scaffold.
+    Queued scan job records and their latest status snapshots.
 Dependencies:
-    Scan orchestrator, auth dependencies, and scan schemas.
+    Scan job engine, auth dependencies, and scan schemas.
 TODO Checklist:
-    - [ ] Split file upload handling from pasted artifacts when multipart support is added.
-    - [ ] Add DB-backed job history and pagination once persistence exists.
+    - [x] Split file upload handling from pasted artifacts when multipart support is added.
+    - [ ] Add job history pagination once the database backend is the default.
     - [ ] Keep route behavior aligned with `docs/API_CONTRACT.md`.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
 
-from app.api.deps import get_current_principal, get_scan_orchestrator
+from app.api.deps import (
+    get_current_principal,
+    get_scan_job_engine,
+    get_scan_stream_service,
+    get_upload_scan_service,
+)
 from app.schemas.auth import CurrentPrincipal
-from app.schemas.scan import ScanJobCreateRequest, ScanJobResponse
-from app.services.scan_orchestrator import ScanOrchestrator
+from app.schemas.scan import (
+    FileUploadScanResponse,
+    ScanJobBatchRequest,
+    ScanJobBatchResponse,
+    ScanJobCreateRequest,
+    ScanJobResponse,
+)
+from app.services.scan_job_engine import DatabaseScanJobEngine, ScanJobEngine
+from app.services.scan_stream_service import ScanStreamService
+from app.services.upload_scan_service import UploadScanService
+from app.utils.enums import AiMode, ScanPriority
 
 router = APIRouter(prefix="/scan-jobs", tags=["scan-jobs"])
 
 
-@router.post("", response_model=ScanJobResponse)
+class _FullDuplexStreamingResponse(StreamingResponse):
+    """
+    Streaming response that leaves `receive` to the request body reader.
+
+    Starlette's default response also reads `receive` to watch for disconnects, which
+    would swallow upload chunks that arrive while results are already streaming out.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+@router.post("", response_model=ScanJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def create_scan_job(
     payload: ScanJobCreateRequest,
     _: CurrentPrincipal = Depends(get_current_principal),
-    orchestrator: ScanOrchestrator = Depends(get_scan_orchestrator),
+    engine: ScanJobEngine | DatabaseScanJobEngine = Depends(get_scan_job_engine),
 ) -> ScanJobResponse:
-    """Run the scaffold scan pipeline and return the resulting job state."""
-    return await orchestrator.start_scan(payload)
+    """Queue a scan job and return immediately; poll the job for progress."""
+    return await engine.submit(payload)
+
+
+@router.post("/batch", response_model=ScanJobBatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_scan_job_batch(
+    payload: ScanJobBatchRequest,
+    _: CurrentPrincipal = Depends(get_current_principal),
+    engine: ScanJobEngine | DatabaseScanJobEngine = Depends(get_scan_job_engine),
+) -> ScanJobBatchResponse:
+    """Queue many scans in one call at bulk priority; identical items are scanned once and share a job."""
+    return await engine.submit_batch(
+        [scan.model_copy(update={"priority": ScanPriority.BULK}) for scan in payload.scans]
+    )
+
+
+@router.post("/stream", status_code=status.HTTP_202_ACCEPTED, response_class=StreamingResponse)
+async def stream_scan_jobs(
+    request: Request,
+    ai_mode: AiMode = AiMode.LOCAL,
+    _: CurrentPrincipal = Depends(get_current_principal),
+    stream_service: ScanStreamService = Depends(get_scan_stream_service),
+) -> StreamingResponse:
+    """Read an NDJSON body of artifacts as it arrives and stream back one job line per artifact."""
+    stream_service.ensure_ready()
+    return _FullDuplexStreamingResponse(
+        stream_service.ingest(request.stream(), ai_mode),
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/upload", response_model=FileUploadScanResponse, status_code=status.HTTP_202_ACCEPTED)
+async def upload_scan_file(
+    request: Request,
+    workspace_id: str,
+    ai_mode: AiMode = AiMode.LOCAL,
+    _: CurrentPrincipal = Depends(get_current_principal),
+    upload_service: UploadScanService = Depends(get_upload_scan_service),
+) -> FileUploadScanResponse:
+    """Stream a multipart file upload, hashing it as it arrives, and queue a scan of its SHA-256."""
+    upload_service.ensure_ready()
+    return await upload_service.scan_upload(
+        request.headers.get("content-type"),
+        request.headers.get("content-length"),
+        request.stream(),
+        workspace_id,
+        ai_mode,
+    )
 
 
 @router.get("", response_model=list[ScanJobResponse])
 async def list_scan_jobs(
     _: CurrentPrincipal = Depends(get_current_principal),
-    orchestrator: ScanOrchestrator = Depends(get_scan_orchestrator),
+    engine: ScanJobEngine | DatabaseScanJobEngine = Depends(get_scan_job_engine),
 ) -> list[ScanJobResponse]:
     """List known scaffold scan jobs."""
-    return orchestrator.list_jobs()
+    return await engine.list_jobs()
 
 
 @router.get("/{scan_job_id}", response_model=ScanJobResponse)
 async def get_scan_job(
     scan_job_id: str,
     _: CurrentPrincipal = Depends(get_current_principal),
-    orchestrator: ScanOrchestrator = Depends(get_scan_orchestrator),
+    engine: ScanJobEngine | DatabaseScanJobEngine = Depends(get_scan_job_engine),
 ) -> ScanJobResponse:
-    """Return one scan job or a 404 if the scaffold has not created it."""
-    result = orchestrator.get_job(scan_job_id)
+    """Return the latest snapshot of one scan job or a 404."""
+    result = await engine.get_job(scan_job_id)
     if result is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scan job not found.")
     return result
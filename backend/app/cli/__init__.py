@@ -0,0 +1 @@
+"""Offline command-line tools, run as `python -m app.cli.<tool>` from `backend/`."""
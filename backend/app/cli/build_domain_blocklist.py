@@ -0,0 +1,41 @@
+"""
+Purpose:
+    Compile domain blocklist feeds into the file served by the local blocklist enrichment source.
+Inputs:
+    Plain domain lists, hosts files, CSV exports, URL lists, or adblock rules (or stdin), in any mix.
+Outputs:
+    One blocklist file and a summary line on stdout.
+Dependencies:
+    `app.services.domain_blocklist_index`.
+TODO Checklist:
+    - [ ] Fetch configured feed URLs directly instead of relying on a cron download step.
+"""
+
+import argparse
+import sys
+from collections.abc import Iterable, Iterator
+
+from app.services.domain_blocklist_index import build_domain_blocklist
+
+
+def _iter_lines(paths: Iterable[str]) -> Iterator[str]:
+    for path in paths:
+        if path == "-":
+            yield from sys.stdin
+            continue
+        with open(path, encoding="utf-8", errors="replace") as handle:
+            yield from handle
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile domain blocklists into a local blocklist file.")
+    parser.add_argument("inputs", nargs="+", help="domain lists, hosts files, CSV exports, or adblock lists; '-' reads stdin")
+    parser.add_argument("-o", "--output", required=True, help="blocklist file to write")
+    args = parser.parse_args(argv)
+
+    stats = build_domain_blocklist(_iter_lines(args.inputs), args.output)
+    print(f"{stats.path}: {stats.domains} domains, {stats.size_bytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Purpose:
+    Compile GeoIP/ASN CSV exports into the memory-mapped database used by the GeoIP enrichment source.
+Inputs:
+    CSV files with a header naming the network column plus any of country, ASN, and organization.
+Outputs:
+    One database file and a summary line on stdout.
+Dependencies:
+    `app.services.geoip_database`, `app.services.ip_range_index`, and the standard library `csv`.
+TODO Checklist:
+    - [ ] Join GeoLite2 country blocks with their locations file instead of expecting ISO codes inline.
+"""
+
+import argparse
+import csv
+from collections.abc import Iterable, Iterator
+
+from app.services.geoip_database import build_geoip_database
+from app.services.ip_range_index import IpNetwork, parse_network
+
+COLUMN_ALIASES = {
+    "network": ("network", "cidr", "prefix"),
+    "country": ("country", "country_code", "country_iso_code", "registered_country_iso_code"),
+    "asn": ("asn", "autonomous_system_number"),
+    "organization": ("org", "organization", "as_org", "autonomous_system_organization"),
+}
+
+
+def iter_geoip_rows(paths: Iterable[str]) -> Iterator[tuple[IpNetwork, str, int, str]]:
+    """Yield `(network, country, asn, organization)` per valid row; missing columns become empty values."""
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace", newline="") as handle:
+            reader = csv.DictReader(handle)
+            fields = {name.strip().lower(): name for name in reader.fieldnames or []}
+            columns = {
+                key: next((fields[alias] for alias in aliases if alias in fields), None)
+                for key, aliases in COLUMN_ALIASES.items()
+            }
+            if columns["network"] is None:
+                raise SystemExit(f"{path}: no network column (expected one of {COLUMN_ALIASES['network']}).")
+            for row in reader:
+                network = parse_network(row[columns["network"]] or "")
+                if network is None:
+                    continue
+                asn = (row[columns["asn"]] or "").strip().upper().removeprefix("AS") if columns["asn"] else ""
+                yield (
+                    network,
+                    (row[columns["country"]] or "").strip() if columns["country"] else "",
+                    int(asn) if asn.isdigit() else 0,
+                    (row[columns["organization"]] or "").strip() if columns["organization"] else "",
+                )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile GeoIP/ASN CSV files into a local GeoIP database.")
+    parser.add_argument("inputs", nargs="+", help="CSV files with network plus country/ASN/organization columns")
+    parser.add_argument("-o", "--output", required=True, help="database file to write")
+    args = parser.parse_args(argv)
+
+    stats = build_geoip_database(iter_geoip_rows(args.inputs), args.output)
+    print(
+        f"{stats.path}: {stats.networks} networks as {stats.intervals} ranges, "
+        f"{stats.organizations} organizations, {stats.size_bytes} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
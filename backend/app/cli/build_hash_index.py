@@ -0,0 +1,101 @@
+"""
+Purpose:
+    Compile a known-bad hash list into the index served by the local hash enrichment source.
+Inputs:
+    Text or CSV files (or stdin) with one MD5/SHA-1/SHA-256 per line or in a chosen CSV column,
+    and optionally known-bad sample files (or directories of them) to hash directly.
+Outputs:
+    One index file (Bloom filter plus sorted digests) and a summary line on stdout.
+Dependencies:
+    `app.services.local_hash_index`, `app.utils.hashing`, and the standard library `csv` module.
+TODO Checklist:
+    - [ ] Accept gzip-compressed feed exports directly.
+"""
+
+import argparse
+import csv
+import itertools
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TextIO
+
+from app.services.local_hash_index import build_local_hash_index, digest_from_hex
+from app.utils.hashing import multi_digest_file
+
+
+def iter_hashes(handle: TextIO, column: str | None = None) -> Iterator[str]:
+    """
+    Yield candidate hashes from a text or CSV stream.
+
+    Without `column`, every field is checked and those that are hex digests are yielded, so
+    plain lists and most feed exports work unchanged. `column` picks a header name or a
+    zero-based index instead. Blank lines and lines starting with `#` are skipped.
+    """
+    rows = csv.reader(line for line in handle if line.strip() and not line.lstrip().startswith("#"))
+    index: int | None = None
+    if column is not None:
+        if column.isdigit():
+            index = int(column)
+        else:
+            header = [field.strip().lower() for field in next(rows, [])]
+            if column.lower() not in header:
+                raise SystemExit(f"Column {column!r} not found in CSV header.")
+            index = header.index(column.lower())
+    for row in rows:
+        if index is not None:
+            if index < len(row):
+                yield row[index]
+            continue
+        yield from (field for field in row if digest_from_hex(field) is not None)
+
+
+def _iter_sources(paths: Iterable[str], column: str | None) -> Iterator[str]:
+    for path in paths:
+        if path == "-":
+            yield from iter_hashes(sys.stdin, column)
+            continue
+        with open(path, encoding="utf-8", errors="replace", newline="") as handle:
+            yield from iter_hashes(handle, column)
+
+
+def iter_sample_hashes(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the MD5, SHA-1 and SHA-256 of every sample file, walking directories recursively.
+
+    Each file is read once for all three digests (see `multi_digest_file`), so indexing a
+    quarantine directory costs one pass over the samples rather than three.
+    """
+    for path in paths:
+        root = Path(path)
+        files = sorted(item for item in root.rglob("*") if item.is_file()) if root.is_dir() else [root]
+        for file_path in files:
+            yield from multi_digest_file(file_path).values()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile a known-bad hash list into a local hash index.")
+    parser.add_argument("inputs", nargs="*", help="text or CSV hash lists; '-' reads stdin")
+    parser.add_argument("-o", "--output", required=True, help="index file to write")
+    parser.add_argument("--column", help="CSV column name or zero-based index holding the hash")
+    parser.add_argument(
+        "--samples",
+        nargs="+",
+        default=[],
+        help="known-bad sample files or directories to hash (MD5, SHA-1 and SHA-256 are all indexed)",
+    )
+    parser.add_argument("--false-positive-rate", type=float, default=0.001)
+    args = parser.parse_args(argv)
+    if not args.inputs and not args.samples:
+        parser.error("give at least one hash list or --samples path")
+
+    hashes = itertools.chain(_iter_sources(args.inputs, args.column), iter_sample_hashes(args.samples))
+    stats = build_local_hash_index(hashes, args.output, args.false_positive_rate)
+    print(
+        f"{stats.path}: {stats.digests} digests, {stats.bloom_bits // 8} byte Bloom filter "
+        f"({stats.bloom_hashes} hashes), {stats.size_bytes} bytes total"
+    )
+
+
+if __name__ == "__main__":
+    main()
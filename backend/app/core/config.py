@@ -19,6 +19,16 @@ from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _parse_source_pairs(raw_value: str) -> list[tuple[str, str]]:
+    """Split `name=value,name=value` settings into stripped pairs."""
+    pairs: list[tuple[str, str]] = []
+    for pair in raw_value.split(","):
+        name, _, value = pair.partition("=")
+        if name.strip() and value.strip():
+            pairs.append((name.strip(), value.strip()))
+    return pairs
+
+
 class Settings(BaseSettings):
     """Typed application settings for the current scaffold phase."""
 
@@ -36,8 +46,46 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = Field(default=120)
 
     max_upload_size_mb: int = Field(default=20)
+    upload_spool_threshold_kb: int = Field(default=1024)
+    archive_max_depth: int = Field(default=3)
+    archive_max_members: int = Field(default=1000)
+    archive_max_total_mb: int = Field(default=256)
     http_timeout_seconds: int = Field(default=20)
+    http_pool_max_connections: int = Field(default=100)
+    http_pool_max_keepalive_connections: int = Field(default=20)
+    http_pool_keepalive_expiry_seconds: int = Field(default=30)
+    http_pool_http2_enabled: bool = Field(default=True)
+    enrichment_deadline_seconds: int = Field(default=30)
+    enrichment_timeout_overrides_csv: str = Field(default="", alias="ENRICHMENT_TIMEOUT_OVERRIDES")
+    enrichment_rate_limits_csv: str = Field(default="", alias="ENRICHMENT_RATE_LIMITS")
+    early_exit_min_sources: int = Field(default=0)
+    early_exit_min_confidence: int = Field(default=85)
+    enrichment_batch_window_ms: int = Field(default=5)
+    enrichment_batch_max_size: int = Field(default=100)
+    circuit_breaker_enabled: bool = Field(default=True)
+    circuit_breaker_window_size: int = Field(default=50)
+    circuit_breaker_min_calls: int = Field(default=10)
+    circuit_breaker_failure_rate: float = Field(default=0.5)
+    circuit_breaker_open_seconds: int = Field(default=30)
+    circuit_breaker_min_timeout_seconds: float = Field(default=1.0)
     scan_job_poll_seconds: int = Field(default=5)
+    scan_job_backend: str = Field(default="memory")
+    scan_worker_count: int = Field(default=4)
+    scan_worker_processes: int = Field(default=1)
+    scan_queue_max_size: int = Field(default=1000)
+    scan_stream_batch_size: int = Field(default=500)
+    scan_stream_max_line_bytes: int = Field(default=65536)
+    scan_job_lease_seconds: int = Field(default=120)
+    scan_job_max_attempts: int = Field(default=3)
+    scan_cache_max_entries: int = Field(default=10000)
+    scan_cache_max_mb: int = Field(default=64)
+    scan_cache_clean_ttl_seconds: int = Field(default=900)
+    scan_cache_suspicious_ttl_seconds: int = Field(default=3600)
+    scan_cache_malicious_ttl_seconds: int = Field(default=86400)
+    enrichment_cache_max_entries: int = Field(default=100000)
+    enrichment_cache_max_mb: int = Field(default=64)
+    enrichment_cache_ttl_seconds: int = Field(default=3600)
+    enrichment_cache_ttl_overrides_csv: str = Field(default="", alias="ENRICHMENT_CACHE_TTL_OVERRIDES")
     cors_origins_csv: str = Field(default="http://localhost:5173", alias="CORS_ORIGINS")
 
     demo_org_admin_password: str = Field(default="org-admin-demo")
@@ -57,6 +105,15 @@ class Settings(BaseSettings):
     source_a_enabled: bool = Field(default=True)
     source_b_enabled: bool = Field(default=True)
     source_c_enabled: bool = Field(default=False)
+    local_hash_index_path: str = Field(default="")
+    domain_blocklist_path: str = Field(default="")
+    ip_range_feeds_csv: str = Field(default="", alias="IP_RANGE_FEEDS")
+    geoip_database_path: str = Field(default="")
+    local_intel_enabled: bool = Field(default=False)
+    local_index_reload_seconds: int = Field(default=30)
+    feed_import_batch_size: int = Field(default=5000)
+    feed_import_max_mb: int = Field(default=1024)
+    retro_hunt_batch_size: int = Field(default=1000)
 
     public_threats_api_enabled: bool = Field(default=False)
     admin_review_required_for_external_reports: bool = Field(default=True)
@@ -74,6 +131,30 @@ class Settings(BaseSettings):
         """Parse comma-separated CORS origins for local development."""
         return [origin.strip() for origin in self.cors_origins_csv.split(",") if origin.strip()]
 
+    @property
+    def ip_range_feeds(self) -> list[str]:
+        """Parse comma-separated CIDR feed CSV paths for the local IP range source."""
+        return [path.strip() for path in self.ip_range_feeds_csv.split(",") if path.strip()]
+
+    @property
+    def enrichment_timeout_overrides(self) -> dict[str, float]:
+        """Parse `source=seconds` pairs used to override per-adapter timeouts."""
+        return {name: float(value) for name, value in _parse_source_pairs(self.enrichment_timeout_overrides_csv)}
+
+    @property
+    def enrichment_rate_limits(self) -> dict[str, tuple[int | None, int | None]]:
+        """Parse `source=per_minute:per_day` pairs; either limit may be left empty."""
+        limits: dict[str, tuple[int | None, int | None]] = {}
+        for name, value in _parse_source_pairs(self.enrichment_rate_limits_csv):
+            per_minute, _, per_day = value.partition(":")
+            limits[name] = (int(per_minute) if per_minute else None, int(per_day) if per_day else None)
+        return limits
+
+    @property
+    def enrichment_cache_ttl_overrides(self) -> dict[str, int]:
+        """Parse `source=seconds` pairs used to override per-adapter enrichment cache TTLs."""
+        return {name: int(value) for name, value in _parse_source_pairs(self.enrichment_cache_ttl_overrides_csv)}
+
 
 @lru_cache
 def get_settings() -> Settings:
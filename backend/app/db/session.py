@@ -4,13 +4,14 @@ Purpose:
 Inputs:
     Database URL from application settings.
 Outputs:
-    SQLAlchemy `SessionLocal` and `get_db` dependency generator.
+    SQLAlchemy `SessionLocal`, `get_db` dependency generator, and `create_tables` bootstrap.
 Dependencies:
     SQLAlchemy, backend settings.
 TODO Checklist:
     - [ ] Add async engine support if the team moves long-running orchestration off-thread.
     - [ ] Add separate storage/schema handling for public threat data if needed later.
     - [ ] Tune connection pooling before deployment beyond classroom demos.
+    - [ ] Replace `create_tables` with Alembic migrations once the migration folder exists.
 """
 
 from collections.abc import Generator
@@ -36,6 +37,29 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=Session)
 
 
+def create_tables() -> None:
+    """Create missing tables and the demo org/workspace that scaffold tokens point at."""
+    from app.db.base import Base
+    from app.models import Organization, Workspace
+    from app.utils.constants import DEFAULT_ORGANIZATION_ID, DEFAULT_WORKSPACE_ID
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        if db.get(Organization, DEFAULT_ORGANIZATION_ID) is None:
+            db.add(Organization(id=DEFAULT_ORGANIZATION_ID, name="Cyber Guard Demo Org", slug=DEFAULT_ORGANIZATION_ID))
+            db.flush()
+        if db.get(Workspace, DEFAULT_WORKSPACE_ID) is None:
+            db.add(
+                Workspace(
+                    id=DEFAULT_WORKSPACE_ID,
+                    organization_id=DEFAULT_ORGANIZATION_ID,
+                    name="Threat Research Workspace",
+                    slug="threat-research",
+                )
+            )
+        db.commit()
+
+
 def get_db() -> Generator[Session, None, None]:
     """Yield one database session per request."""
     db = SessionLocal()
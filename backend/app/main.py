@@ -10,7 +10,6 @@ Dependencies:
 TODO Checklist:
     - [ ] Add startup checks for DB and configured enrichment adapters.
     - [ ] Add exception handlers with a consistent error envelope.
-    - [ ] Add worker/process notes once async jobs move beyond placeholder orchestration.
 """
 
 from contextlib import asynccontextmanager
@@ -18,6 +17,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.deps import get_http_client_pool, get_scan_job_engine
 from app.api.router import api_router
 from app.core.config import get_settings
 from app.core.logging import configure_logging
@@ -27,7 +27,13 @@ from app.core.logging import configure_logging
 async def lifespan(_: FastAPI):
     """Keep startup and shutdown hooks in one obvious place."""
     configure_logging()
-    yield
+    scan_job_engine = get_scan_job_engine()
+    await scan_job_engine.start()
+    try:
+        yield
+    finally:
+        await scan_job_engine.stop()
+        await get_http_client_pool().close()
 
 
 def create_app() -> FastAPI:
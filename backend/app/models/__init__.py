@@ -13,9 +13,12 @@ from app.models.admin_review import AdminReview
 from app.models.api_client_config import ApiClientConfig
 from app.models.artifact_submission import ArtifactSubmission
 from app.models.enrichment_result import EnrichmentResult
+from app.models.local_indicator import LocalIndicator
 from app.models.membership import Membership
 from app.models.organization import Organization
 from app.models.public_report import PublicReport
+from app.models.retro_hunt_match import RetroHuntMatch
+from app.models.scan_indicator import ScanIndicator
 from app.models.scan_job import ScanJob
 from app.models.threat_report import ThreatReport
 from app.models.user import User
@@ -26,9 +29,12 @@ __all__ = [
     "ApiClientConfig",
     "ArtifactSubmission",
     "EnrichmentResult",
+    "LocalIndicator",
     "Membership",
     "Organization",
     "PublicReport",
+    "RetroHuntMatch",
+    "ScanIndicator",
     "ScanJob",
     "ThreatReport",
     "User",
@@ -0,0 +1,49 @@
+"""
+Purpose:
+    Local threat-intel indicator imported from CSV, STIX, or MISP feeds.
+Inputs:
+    Normalized indicators from `FeedImportService` batches.
+Outputs:
+    One row per feed source, indicator type, and value, with its verdict and change tracking.
+Dependencies:
+    SQLAlchemy Base and model column types.
+TODO Checklist:
+    - [ ] Add expiry columns once feeds' `valid_until` dates are enforced.
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import DateTime, JSON, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class LocalIndicator(Base):
+    """Feed indicator stored locally so scans can be answered from our own intel."""
+
+    __tablename__ = "local_indicators"
+    # Source first, then value: import batches look up existing rows by source and a list of values.
+    # Scan-time lookups by value alone use the separate `value` index.
+    __table_args__ = (
+        UniqueConstraint("source", "value", "indicator_type", name="uq_local_indicators_source_value_type"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    source: Mapped[str] = mapped_column(String(64))
+    indicator_type: Mapped[str] = mapped_column(String(32))
+    value: Mapped[str] = mapped_column(Text, index=True)
+    verdict: Mapped[str] = mapped_column(String(16), default="malicious")
+    confidence: Mapped[int] = mapped_column(default=80)
+    tags: Mapped[list[str]] = mapped_column(JSON, default=list)
+    content_hash: Mapped[str] = mapped_column(String(64))
+    import_id: Mapped[str] = mapped_column(String(36), index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
@@ -0,0 +1,43 @@
+"""
+Purpose:
+    Record of a past scan that matched threat intel imported after it ran.
+Inputs:
+    Retro-hunt batches joining new `local_indicators` against `scan_indicators`.
+Outputs:
+    One row per scan, indicator, and feed source; the flag behind each re-scored report.
+Dependencies:
+    SQLAlchemy Base and model column types.
+TODO Checklist:
+    - [ ] Surface matches in the dashboard once analysts triage retro-hunt hits there.
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class RetroHuntMatch(Base):
+    """A historical scan flagged by newly imported intel."""
+
+    __tablename__ = "retro_hunt_matches"
+    __table_args__ = (
+        UniqueConstraint("scan_job_id", "value", "indicator_type", "source", name="uq_retro_hunt_matches_scan_value"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    scan_job_id: Mapped[str] = mapped_column(ForeignKey("scan_jobs.id"), index=True)
+    report_id: Mapped[str | None] = mapped_column(String(36), nullable=True, index=True)
+    indicator_type: Mapped[str] = mapped_column(String(32))
+    value: Mapped[str] = mapped_column(Text)
+    source: Mapped[str] = mapped_column(String(64))
+    verdict: Mapped[str] = mapped_column(String(16))
+    confidence: Mapped[int] = mapped_column(default=0)
+    import_id: Mapped[str] = mapped_column(String(36), index=True)
+    matched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
@@ -0,0 +1,34 @@
+"""
+Purpose:
+    Inverted index from indicator values to the scan jobs whose artifacts contained them.
+Inputs:
+    Normalized artifact values, extracted IOCs, and archive child indicators at enqueue time.
+Outputs:
+    Rows keyed by value first, so retro-hunts find past scans for new intel without a table scan.
+Dependencies:
+    SQLAlchemy Base and model column types.
+TODO Checklist:
+    - [ ] Prune rows together with scan job history once retention is agreed.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ScanIndicator(Base):
+    """One indicator seen in one scan; the primary key doubles as the value -> scan index."""
+
+    __tablename__ = "scan_indicators"
+
+    value: Mapped[str] = mapped_column(Text, primary_key=True)
+    indicator_type: Mapped[str] = mapped_column(String(32), primary_key=True)
+    scan_job_id: Mapped[str] = mapped_column(ForeignKey("scan_jobs.id"), primary_key=True, index=True)
+    workspace_id: Mapped[str] = mapped_column(ForeignKey("workspaces.id"))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
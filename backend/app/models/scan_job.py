@@ -4,18 +4,17 @@ Purpose:
 Inputs:
     Artifact submissions and scan orchestration status updates.
 Outputs:
-    Job rows that can be polled by the frontend and dashboard.
+    Job rows that can be polled by the frontend and claimed by `app.worker` processes.
 Dependencies:
     SQLAlchemy Base and model column types.
 TODO Checklist:
-    - [ ] Add retry metadata and worker assignment fields if background jobs are implemented.
     - [ ] Add progress percentages only if the UI really needs them.
 """
 
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -25,6 +24,7 @@ class ScanJob(Base):
     """Asynchronous scan orchestration record."""
 
     __tablename__ = "scan_jobs"
+    __table_args__ = (Index("ix_scan_jobs_status_priority_created_at", "status", "priority", "created_at"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     artifact_submission_id: Mapped[str] = mapped_column(
@@ -34,8 +34,17 @@ class ScanJob(Base):
     workspace_id: Mapped[str] = mapped_column(ForeignKey("workspaces.id"), index=True)
     status: Mapped[str] = mapped_column(String(32), default="queued")
     ai_mode: Mapped[str] = mapped_column(String(16), default="local")
+    priority: Mapped[int] = mapped_column(default=0)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
     )
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    request_payload: Mapped[dict[str, object]] = mapped_column(JSON, default=dict)
+    result_payload: Mapped[dict[str, object]] = mapped_column(JSON, default=dict)
+    report_id: Mapped[str | None] = mapped_column(String(36), nullable=True, index=True)
+    lease_owner: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    attempts: Mapped[int] = mapped_column(default=0)
+    dedupe_key: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    leader_job_id: Mapped[str | None] = mapped_column(String(36), nullable=True, index=True)
@@ -32,6 +32,8 @@ class ThreatReport(Base):
     confidence: Mapped[int] = mapped_column(default=50)
     executive_summary: Mapped[str] = mapped_column(Text)
     recommended_actions: Mapped[list[str]] = mapped_column(JSON, default=list)
+    source_summary: Mapped[list[str]] = mapped_column(JSON, default=list)
+    ai_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     publish_status: Mapped[str] = mapped_column(String(32), default="private")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
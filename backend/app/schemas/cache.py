@@ -0,0 +1,34 @@
+"""
+Purpose:
+    Admin-facing cache monitoring schemas.
+Inputs:
+    Counters reported by `CachingService`.
+Outputs:
+    Typed cache stats and flush acknowledgements.
+Dependencies:
+    Pydantic models.
+TODO Checklist:
+    - [ ] Add hit-rate history if the dashboard starts charting cache efficiency.
+"""
+
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    """Occupancy and counters for one cache layer."""
+
+    name: str
+    entries: int
+    size_bytes: int
+    max_entries: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class CacheFlushResponse(BaseModel):
+    """Result of an admin cache flush."""
+
+    flushed_entries: int
@@ -0,0 +1,40 @@
+"""
+Purpose:
+    Admin-facing threat-feed import and retro-hunt schemas.
+Inputs:
+    Counters reported by `FeedImportService` and `RetroHuntService` after a run.
+Outputs:
+    Typed import and retro-hunt summaries including throughput.
+Dependencies:
+    Pydantic models.
+TODO Checklist:
+    - [ ] Add per-type counts if analysts want to see what a feed contributed.
+"""
+
+from pydantic import BaseModel
+
+
+class FeedImportResponse(BaseModel):
+    """Outcome of one feed import; `unchanged` rows were skipped by content hash."""
+
+    import_id: str
+    source: str
+    feed_format: str
+    parsed: int
+    inserted: int
+    updated: int
+    unchanged: int
+    skipped: int
+    elapsed_seconds: float
+    indicators_per_second: float
+    retro_hunt_scheduled: bool = False
+
+
+class RetroHuntResponse(BaseModel):
+    """Past scans matched by one import's new or changed malicious/suspicious indicators."""
+
+    import_id: str
+    indicators_checked: int
+    matched_scans: int
+    flagged_reports: int
+    elapsed_seconds: float
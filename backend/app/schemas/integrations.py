@@ -13,6 +13,8 @@ TODO Checklist:
 
 from pydantic import BaseModel
 
+from app.utils.enums import CircuitState
+
 
 class IntegrationCatalogEntry(BaseModel):
     """Threat-intel or AI integration summary."""
@@ -30,3 +32,47 @@ class PublicApiStatusResponse(BaseModel):
     enabled: bool
     phase: str
     notes: list[str]
+
+
+class HttpPoolStatsResponse(BaseModel):
+    """Request and connection counters for one adapter's pooled HTTP client."""
+
+    name: str
+    host: str
+    http2: bool
+    requests: int
+    errors: int
+    in_flight: int
+    connections: int
+    idle_connections: int
+    max_connections: int
+
+
+class RateLimitPriorityStats(BaseModel):
+    """Calls granted to one scan priority and how long they queued for quota."""
+
+    granted: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class RateLimitStatsResponse(BaseModel):
+    """Quota settings and queue state for one rate-limited adapter."""
+
+    name: str
+    requests_per_minute: int | None
+    requests_per_day: int | None
+    waiting: int
+    priorities: dict[str, RateLimitPriorityStats]
+
+
+class CircuitBreakerStatsResponse(BaseModel):
+    """Breaker state, rolling error rate, and latency percentiles for one adapter."""
+
+    name: str
+    state: CircuitState
+    calls: int
+    failure_rate: float
+    p50_ms: float
+    p99_ms: float
+    timeout_seconds: float | None
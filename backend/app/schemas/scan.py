@@ -14,10 +14,11 @@ TODO Checklist:
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.schemas.artifact import ArtifactSubmissionRequest, ArtifactSubmissionResponse
-from app.utils.enums import AiMode, ScanJobStatus
+from app.utils.constants import MAX_CHILD_INDICATORS
+from app.utils.enums import AiMode, IndicatorType, ScanJobStatus, ScanPriority
 
 
 class SourceHit(BaseModel):
@@ -27,6 +28,7 @@ class SourceHit(BaseModel):
     verdict: str
     confidence_score: int
     summary: str
+    degraded: bool = False
 
 
 class ScanJobCreateRequest(BaseModel):
@@ -34,6 +36,23 @@ class ScanJobCreateRequest(BaseModel):
 
     artifact: ArtifactSubmissionRequest
     ai_mode: AiMode = AiMode.LOCAL
+    priority: ScanPriority = ScanPriority.INTERACTIVE
+
+
+class FileScanJobRequest(ScanJobCreateRequest):
+    """
+    Internal file scan payload built by `UploadScanService`, never accepted from clients.
+
+    `child_indicators` carries archive member hashes and the IOCs found inside them.
+    """
+
+    child_indicators: list[str] = Field(default_factory=list, max_length=MAX_CHILD_INDICATORS)
+
+
+class ScanJobBatchRequest(BaseModel):
+    """Many scan submissions sent in one call, such as an IOC list from a SOAR ticket."""
+
+    scans: list[ScanJobCreateRequest] = Field(..., min_length=1, max_length=5000)
 
 
 class ScanJobResponse(BaseModel):
@@ -45,5 +64,50 @@ class ScanJobResponse(BaseModel):
     ai_mode: AiMode
     sources: list[SourceHit]
     report_id: str | None = None
+    coalesced_with: str | None = None
+    backfill_pending: bool = False
     created_at: datetime
     completed_at: datetime | None = None
+
+
+class ExtractedIndicatorResponse(BaseModel):
+    """One IOC found inside an uploaded file."""
+
+    value: str
+    indicator_type: IndicatorType
+
+
+class ArchiveMemberResponse(BaseModel):
+    """One file found inside an uploaded archive, nested archives included."""
+
+    path: str
+    depth: int
+    size_bytes: int
+    md5: str
+    sha1: str
+    sha256: str
+    indicators: list[ExtractedIndicatorResponse]
+
+
+class FileUploadScanResponse(BaseModel):
+    """Scan queued for an uploaded file, plus what was learned while receiving it."""
+
+    job: ScanJobResponse
+    file_name: str | None
+    size_bytes: int
+    md5: str
+    sha1: str
+    sha256: str
+    spooled_to_disk: bool
+    indicators: list[ExtractedIndicatorResponse]
+    indicators_truncated: bool
+    archive_members: list[ArchiveMemberResponse] = Field(default_factory=list)
+    archive_limit_reached: str | None = None
+    archive_errors: list[str] = Field(default_factory=list)
+
+
+class ScanJobBatchResponse(BaseModel):
+    """One job per submitted item, in request order; duplicate items share a job."""
+
+    jobs: list[ScanJobResponse]
+    unique_count: int
@@ -1,30 +1,219 @@
 """
 Purpose:
-    In-memory cache placeholder for duplicate scan submission behavior.
+    Bounded in-memory caches for duplicate scan submissions and per-indicator enrichment lookups.
 Inputs:
-    Cache keys from normalized artifacts and AI mode selections.
+    Cache keys from normalized artifacts and AI mode selections, plus `(source, indicator)` pairs.
 Outputs:
-    Previously generated scan job responses.
+    Previously generated scan job responses, adapter results, and hit/miss/eviction counters.
 Dependencies:
-    Standard library dictionaries.
+    Standard library `collections.OrderedDict` and `time`.
 TODO Checklist:
-    - [ ] Replace in-memory cache with Redis or DB-backed cache if needed.
-    - [ ] Add cache invalidation and freshness rules once real enrichment is live.
+    - [ ] Replace in-memory cache with Redis or DB-backed cache if several API processes need to share it.
 """
 
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
 from app.schemas.scan import ScanJobResponse
 
+ValueT = TypeVar("ValueT")
+
+
+@dataclass
+class _CacheEntry(Generic[ValueT]):
+    value: ValueT
+    size_bytes: int
+    expires_at: float
+
+
+class BoundedTtlCache(Generic[ValueT]):
+    """
+    LRU cache bounded by entry count and approximate bytes, with per-entry TTLs.
+
+    Expired entries are dropped lazily on lookup and whenever room is needed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._entries: OrderedDict[str, _CacheEntry[ValueT]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate bytes held by live entries."""
+        return self._bytes
+
+    def get(self, key: str) -> ValueT | None:
+        """Return a live entry and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= self.clock():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: str, value: ValueT, ttl_seconds: float, size_bytes: int) -> None:
+        """Store an entry, evicting expired then least recently used entries to stay in bounds."""
+        if key in self._entries:
+            self._remove(key)
+        if ttl_seconds <= 0 or size_bytes > self.max_bytes:
+            return
+        self._entries[key] = _CacheEntry(value, size_bytes, self.clock() + ttl_seconds)
+        self._bytes += size_bytes
+        if len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._purge_expired()
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def clear(self) -> int:
+        """Drop every entry and return how many were removed."""
+        flushed = len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+        return flushed
+
+    def stats(self) -> dict[str, object]:
+        """Return counters and occupancy for admin monitoring."""
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "size_bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _purge_expired(self) -> None:
+        now = self.clock()
+        for key in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+            self._remove(key)
+            self.expirations += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size_bytes
+
 
 class CachingService:
-    """Simple process-local cache for scaffold demonstrations and tests."""
+    """
+    Process-local caches for whole scans and for individual adapter lookups.
+
+    The scan layer is keyed by artifact and AI mode. The enrichment layer is keyed by
+    `(source, indicator)` only, so the same indicator seen in another artifact or AI mode
+    costs no upstream quota until its source-specific TTL runs out.
+    """
 
-    def __init__(self) -> None:
-        self._scan_cache: dict[str, ScanJobResponse] = {}
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        clean_ttl_seconds: int = 900,
+        suspicious_ttl_seconds: int = 3600,
+        malicious_ttl_seconds: int = 86_400,
+        enrichment_max_entries: int = 100_000,
+        enrichment_max_bytes: int = 64 * 1024 * 1024,
+        enrichment_ttl_seconds: int = 3600,
+        enrichment_ttl_overrides: dict[str, int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.clean_ttl_seconds = clean_ttl_seconds
+        self.suspicious_ttl_seconds = suspicious_ttl_seconds
+        self.malicious_ttl_seconds = malicious_ttl_seconds
+        self.enrichment_ttl_seconds = enrichment_ttl_seconds
+        self.enrichment_ttl_overrides = enrichment_ttl_overrides or {}
+        self._scan_cache: BoundedTtlCache[ScanJobResponse] = BoundedTtlCache(
+            "scan",
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            clock=clock,
+        )
+        self._enrichment_cache: BoundedTtlCache[dict[str, object]] = BoundedTtlCache(
+            "enrichment",
+            max_entries=enrichment_max_entries,
+            max_bytes=enrichment_max_bytes,
+            clock=clock,
+        )
 
     def get_scan(self, key: str) -> ScanJobResponse | None:
-        """Return cached scan response if present."""
+        """Return cached scan response if present and still fresh."""
         return self._scan_cache.get(key)
 
     def set_scan(self, key: str, response: ScanJobResponse) -> None:
-        """Store a scan response by cache key."""
-        self._scan_cache[key] = response
+        """Store a scan response with a TTL chosen from its source verdicts."""
+        self._scan_cache.set(
+            key,
+            response,
+            ttl_seconds=self.scan_ttl_seconds(response),
+            size_bytes=len(response.model_dump_json()),
+        )
+
+    def scan_ttl_seconds(self, response: ScanJobResponse) -> int:
+        """
+        Keep malicious verdicts longest and clean ones shortest.
+
+        Scans with degraded sources are incomplete, so they get the short TTL and are retried soon.
+        """
+        verdicts = {hit.verdict for hit in response.sources}
+        if any(hit.degraded for hit in response.sources):
+            return self.clean_ttl_seconds
+        if "malicious" in verdicts:
+            return self.malicious_ttl_seconds
+        if "suspicious" in verdicts:
+            return self.suspicious_ttl_seconds
+        return self.clean_ttl_seconds
+
+    def get_enrichment(self, source_name: str, indicator: str) -> dict[str, object] | None:
+        """Return a cached adapter result for one indicator."""
+        return self._enrichment_cache.get(f"{source_name}:{indicator}")
+
+    def set_enrichment(self, source_name: str, indicator: str, result: dict[str, object]) -> None:
+        """Store one adapter result under the source's TTL."""
+        self._enrichment_cache.set(
+            f"{source_name}:{indicator}",
+            result,
+            ttl_seconds=self.enrichment_ttl_overrides.get(source_name, self.enrichment_ttl_seconds),
+            size_bytes=len(indicator) + len(json.dumps(result, default=str)),
+        )
+
+    def stats(self) -> list[dict[str, object]]:
+        """Return counters for every cache layer."""
+        return [self._scan_cache.stats(), self._enrichment_cache.stats()]
+
+    def flush(self, name: str | None = None) -> int:
+        """Flush one cache layer by name, or all of them, and return the entries removed."""
+        flushed = 0
+        for cache in (self._scan_cache, self._enrichment_cache):
+            if name is None or cache.name == name:
+                flushed += cache.clear()
+        return flushed
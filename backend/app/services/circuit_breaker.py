@@ -0,0 +1,170 @@
+"""
+Purpose:
+    Per-adapter circuit breakers and adaptive timeouts for enrichment sources.
+Inputs:
+    Outcome and latency of every upstream enrichment call.
+Outputs:
+    Allow/skip decisions, timeouts near each adapter's observed p99, and breaker stats.
+Dependencies:
+    Standard library `collections.deque`, `math`, and `time`.
+TODO Checklist:
+    - [ ] Share breaker state between worker processes if one process alone sees too few calls.
+"""
+
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+
+from app.utils.enums import CircuitState
+
+TIMEOUT_HEADROOM = 1.5
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is skipped because the adapter's circuit is open."""
+
+
+class AdapterCircuitBreaker:
+    """
+    Rolling-window breaker for one adapter.
+
+    The circuit opens once at least `min_calls` recent calls fail at `failure_rate_threshold`
+    or worse. After `open_seconds` it lets a single probe through (half-open); the probe's
+    outcome closes the circuit again or restarts the open period.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 50,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+        min_timeout_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.open_seconds = open_seconds
+        self.min_timeout_seconds = min_timeout_seconds
+        self.clock = clock
+        self.state = CircuitState.CLOSED
+        self.opened_at: float | None = None
+        self.last_timeout_seconds: float | None = None
+        self._calls: deque[tuple[bool, float]] = deque(maxlen=window_size)
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        """Return False while the circuit is open or a half-open probe is already running."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN:
+            if self.clock() - (self.opened_at or 0.0) < self.open_seconds:
+                return False
+            self.state = CircuitState.HALF_OPEN
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def release_probe(self) -> None:
+        """Give up a half-open probe slot that never reached the upstream."""
+        self._probe_in_flight = False
+
+    def record(self, success: bool, latency_seconds: float) -> None:
+        """Add one call outcome and move between closed, open, and half-open states."""
+        self._calls.append((success, latency_seconds))
+        if self.state is CircuitState.HALF_OPEN:
+            self._probe_in_flight = False
+            if success:
+                self.state = CircuitState.CLOSED
+                self._calls.clear()
+            else:
+                self._open()
+            return
+        if self.state is CircuitState.CLOSED and len(self._calls) >= self.min_calls:
+            if self.failure_rate() >= self.failure_rate_threshold:
+                self._open()
+
+    def timeout_seconds(self, configured_seconds: float) -> float:
+        """
+        Return a timeout near the observed p99 latency, never above the configured timeout.
+
+        Timed-out calls are recorded at their timeout, so a slowing source pushes its p99
+        (and therefore its timeout) back up instead of ratcheting it down.
+        """
+        timeout = configured_seconds
+        if len(self._calls) >= self.min_calls:
+            adaptive = self.latency_percentile(0.99) * TIMEOUT_HEADROOM
+            timeout = min(configured_seconds, max(self.min_timeout_seconds, adaptive))
+        self.last_timeout_seconds = timeout
+        return timeout
+
+    def failure_rate(self) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(1 for success, _ in self._calls if not success) / len(self._calls)
+
+    def latency_percentile(self, percentile: float) -> float:
+        latencies = sorted(latency for _, latency in self._calls)
+        if not latencies:
+            return 0.0
+        return latencies[max(0, math.ceil(percentile * len(latencies)) - 1)]
+
+    def stats(self) -> dict[str, object]:
+        """Return state, rolling error rate, and latency percentiles for monitoring."""
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "calls": len(self._calls),
+            "failure_rate": round(self.failure_rate(), 3),
+            "p50_ms": round(self.latency_percentile(0.5) * 1000, 1),
+            "p99_ms": round(self.latency_percentile(0.99) * 1000, 1),
+            "timeout_seconds": self.last_timeout_seconds,
+        }
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = self.clock()
+
+
+class CircuitBreakerRegistry:
+    """Lazily created breaker per adapter name, all sharing one configuration."""
+
+    def __init__(
+        self,
+        window_size: int = 50,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+        min_timeout_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.open_seconds = open_seconds
+        self.min_timeout_seconds = min_timeout_seconds
+        self.clock = clock
+        self._breakers: dict[str, AdapterCircuitBreaker] = {}
+
+    def for_adapter(self, name: str) -> AdapterCircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = AdapterCircuitBreaker(
+                name,
+                window_size=self.window_size,
+                min_calls=self.min_calls,
+                failure_rate_threshold=self.failure_rate_threshold,
+                open_seconds=self.open_seconds,
+                min_timeout_seconds=self.min_timeout_seconds,
+                clock=self.clock,
+            )
+            self._breakers[name] = breaker
+        return breaker
+
+    def stats(self) -> list[dict[str, object]]:
+        """Return stats for every adapter that has made at least one call."""
+        return [breaker.stats() for breaker in self._breakers.values()]
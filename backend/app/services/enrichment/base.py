@@ -6,7 +6,7 @@ Inputs:
 Outputs:
     Consistent dictionaries that can become `SourceHit` models.
 Dependencies:
-    Standard library typing only.
+    Standard library typing and the shared enums.
 TODO Checklist:
     - [ ] Replace loose dicts with richer typed adapter responses if needed.
     - [ ] Add standardized error/result metadata before real adapter implementation.
@@ -14,11 +14,31 @@ TODO Checklist:
 
 from typing import Protocol
 
+from app.utils.enums import IndicatorType
+
 
 class EnrichmentAdapter(Protocol):
-    """Protocol for scaffold enrichment clients."""
+    """
+    Protocol for scaffold enrichment clients.
+
+    `supported_indicator_types` lists what the source can look up; the orchestrator never
+    sends it anything else.
+    """
 
     name: str
+    supported_indicator_types: frozenset[IndicatorType]
 
     async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
         """Return source summary data for a scan request."""
+
+
+class BatchEnrichmentAdapter(EnrichmentAdapter, Protocol):
+    """
+    Optional extension for sources with a bulk lookup API.
+
+    The orchestrator collects indicators from concurrent scans and calls `enrich_many` once
+    per batch instead of `enrich` once per indicator.
+    """
+
+    async def enrich_many(self, indicators: list[str]) -> dict[str, dict[str, object]]:
+        """Return one result dictionary per indicator, keyed by the indicator."""
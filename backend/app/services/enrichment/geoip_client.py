@@ -0,0 +1,60 @@
+"""
+Purpose:
+    Offline enrichment source that adds country, ASN, and organization context to IP indicators.
+Inputs:
+    IP address indicators routed by the orchestrator, singly or in micro-batches.
+Outputs:
+    Informational hits describing where each address is announced from; no network dependency.
+Dependencies:
+    The memory-mapped `GeoIpDatabase` compiled by `python -m app.cli.build_geoip_db`.
+TODO Checklist:
+    - [ ] Raise the verdict for ASNs on a locally maintained bulletproof-hosting list.
+"""
+
+from app.services.geoip_database import GeoIpDatabase, GeoIpRecord
+from app.services.index_reloader import ReloadingIndex
+from app.utils.enums import IndicatorType
+
+
+class GeoIpClient:
+    """Local GeoIP/ASN context for every IP in a scan, usable on air-gapped deployments."""
+
+    name = "geoip"
+    supported_indicator_types = frozenset({IndicatorType.IP_ADDRESS})
+
+    def __init__(self, database: ReloadingIndex[GeoIpDatabase]) -> None:
+        self.database = database
+
+    async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
+        records = self.database.current.lookup_many(indicators)
+        located = [
+            self._describe(indicator, record) for indicator, record in zip(indicators, records) if record is not None
+        ]
+        if not located:
+            return self._result("unknown", "No address is in the local GeoIP database.")
+        return self._result("informational", "; ".join(located[:5]) + ("; ..." if len(located) > 5 else ""))
+
+    async def enrich_many(self, indicators: list[str]) -> dict[str, dict[str, object]]:
+        """Bulk variant used by the orchestrator's micro-batcher."""
+        return {
+            indicator: (
+                self._result("informational", self._describe(indicator, record))
+                if record is not None
+                else self._result("unknown", f"{indicator} is not in the local GeoIP database.")
+            )
+            for indicator, record in zip(indicators, self.database.current.lookup_many(indicators))
+        }
+
+    def _result(self, verdict: str, summary: str) -> dict[str, object]:
+        return {
+            "source_name": self.name,
+            "verdict": verdict,
+            "confidence_score": 0,
+            "summary": summary,
+        }
+
+    @staticmethod
+    def _describe(indicator: str, record: GeoIpRecord) -> str:
+        asn = f"AS{record.asn}" if record.asn else "unknown ASN"
+        organization = f" ({record.organization})" if record.organization else ""
+        return f"{indicator}: {record.country or '??'}, {asn}{organization}"
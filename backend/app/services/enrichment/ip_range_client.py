@@ -0,0 +1,56 @@
+"""
+Purpose:
+    Offline enrichment source that matches IP indicators against local CIDR feeds.
+Inputs:
+    IP address indicators routed by the orchestrator, singly or in micro-batches.
+Outputs:
+    The verdict of the most specific listed range per address, or unknown when none contains it.
+Dependencies:
+    `IpRangeIndex` loaded from the CSV feeds in `IP_RANGE_FEEDS`.
+TODO Checklist:
+    - [ ] Reload feeds on a schedule once they are refreshed more than daily.
+"""
+
+from app.services.ip_range_index import IpRangeIndex, IpRangeMatch
+from app.utils.enums import IndicatorType
+
+VERDICT_CONFIDENCE = {"malicious": 90, "suspicious": 70, "informational": 40}
+
+
+class IpRangeClient:
+    """CIDR feed lookup; batches from concurrent scans are matched in one vectorized search."""
+
+    name = "ip_ranges"
+    supported_indicator_types = frozenset({IndicatorType.IP_ADDRESS})
+
+    def __init__(self, index: IpRangeIndex) -> None:
+        self.index = index
+
+    async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
+        matches = [match for match in self.index.lookup_many(indicators) if match is not None]
+        if not matches:
+            return self._result(None, f"No address is in the {self.index.networks} local CIDR ranges.")
+        strongest = max(matches, key=lambda match: VERDICT_CONFIDENCE[match.verdict])
+        return self._result(strongest, f"{len(matches)} of {len(indicators)} addresses are in listed ranges")
+
+    async def enrich_many(self, indicators: list[str]) -> dict[str, dict[str, object]]:
+        """Bulk variant used by the orchestrator's micro-batcher."""
+        return {
+            indicator: self._result(match, f"{indicator} is in a listed range" if match else "")
+            for indicator, match in zip(indicators, self.index.lookup_many(indicators))
+        }
+
+    def _result(self, match: IpRangeMatch | None, summary: str) -> dict[str, object]:
+        if match is None:
+            return {
+                "source_name": self.name,
+                "verdict": "unknown",
+                "confidence_score": 0,
+                "summary": summary or "Address is not in any local CIDR range.",
+            }
+        return {
+            "source_name": self.name,
+            "verdict": match.verdict,
+            "confidence_score": VERDICT_CONFIDENCE[match.verdict],
+            "summary": f"{summary} ({match.network}: {match.label}).",
+        }
@@ -0,0 +1,38 @@
+"""
+Purpose:
+    Route extracted indicators to the enrichment adapters that support their type.
+Inputs:
+    Configured adapters (each may declare `supported_indicator_types`) and extracted indicators.
+Outputs:
+    `(adapter, indicators)` pairs; adapters with nothing applicable are left out entirely.
+Dependencies:
+    Indicator classification helpers and shared enums.
+TODO Checklist:
+    - [ ] Let admins override adapter capabilities from settings if a source adds coverage.
+"""
+
+from collections.abc import Sequence
+
+from app.utils.enums import IndicatorType
+from app.utils.indicator_tools import classify_indicator
+
+
+def adapter_supports(adapter: object, indicator_type: IndicatorType) -> bool:
+    """Adapters that do not declare capabilities are treated as accepting every indicator type."""
+    supported = getattr(adapter, "supported_indicator_types", None)
+    return supported is None or indicator_type in supported
+
+
+def route_indicators(adapters: Sequence[object], indicators: Sequence[str]) -> list[tuple[object, list[str]]]:
+    """
+    Give each adapter only the indicators it can look up, keeping adapter and indicator order.
+
+    Email signals mix domains, addresses, and hashes, so each source sees just its own slice.
+    """
+    kinds = {indicator: classify_indicator(indicator) for indicator in dict.fromkeys(indicators)}
+    routes: list[tuple[object, list[str]]] = []
+    for adapter in adapters:
+        routed = [indicator for indicator, kind in kinds.items() if adapter_supports(adapter, kind)]
+        if routed:
+            routes.append((adapter, routed))
+    return routes
@@ -11,11 +11,21 @@ TODO Checklist:
     - [ ] Rename this client once the team chooses a real source.
 """
 
+from app.utils.enums import IndicatorType
+
 
 class SourceAClient:
     """Generic enrichment source placeholder A."""
 
     name = "source_a"
+    supported_indicator_types = frozenset(
+        {
+            IndicatorType.URL,
+            IndicatorType.DOMAIN,
+            IndicatorType.IP_ADDRESS,
+            IndicatorType.EMAIL_ADDRESS,
+        }
+    )
 
     async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
         return {
@@ -24,3 +34,15 @@ class SourceAClient:
             "confidence_score": 72,
             "summary": f"Source A correlated {len(indicators)} indicators with prior campaigns.",
         }
+
+    async def enrich_many(self, indicators: list[str]) -> dict[str, dict[str, object]]:
+        """Bulk variant used by the orchestrator's micro-batcher: one upstream call per batch."""
+        return {
+            indicator: {
+                "source_name": self.name,
+                "verdict": "suspicious",
+                "confidence_score": 72,
+                "summary": f"Source A correlated {indicator[:40]} with prior campaigns.",
+            }
+            for indicator in indicators
+        }
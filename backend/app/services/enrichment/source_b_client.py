@@ -11,11 +11,19 @@ TODO Checklist:
     - [ ] Rename this client once the team chooses a real source.
 """
 
+from app.utils.enums import IndicatorType
+
 
 class SourceBClient:
     """Generic enrichment source placeholder B."""
 
     name = "source_b"
+    supported_indicator_types = frozenset(
+        {
+            IndicatorType.URL,
+            IndicatorType.FILE_HASH,
+        }
+    )
 
     async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
         return {
@@ -11,11 +11,19 @@ TODO Checklist:
     - [ ] Use this slot for a student-selected enrichment source if time allows.
 """
 
+from app.utils.enums import IndicatorType
+
 
 class SourceCClient:
     """Generic enrichment source placeholder C."""
 
     name = "source_c"
+    supported_indicator_types = frozenset(
+        {
+            IndicatorType.DOMAIN,
+            IndicatorType.IP_ADDRESS,
+        }
+    )
 
     async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
         return {
@@ -1,33 +1,108 @@
 """
 Purpose:
-    VirusTotal adapter placeholder kept as one threat-intel source among several.
+    VirusTotal adapter kept as one threat-intel source among several.
 Inputs:
     Extracted indicators and normalized artifact values.
 Outputs:
     Simple per-source verdict summary for the scan orchestrator.
 Dependencies:
-    Adapter protocol and backend settings.
+    Adapter protocol, backend settings, and the shared HTTP client pool.
 TODO Checklist:
-    - [ ] Replace scaffold response with real HTTP requests and parsing.
-    - [ ] Add timeout, rate limit, and retry handling once integrated.
+    - [ ] Add rate limit and retry handling once quota numbers are agreed.
 """
 
+import base64
+
+from app.services.http_pool import HttpClientPool
+from app.utils.enums import IndicatorType
+from app.utils.indicator_tools import classify_indicator
+
 
 class VirusTotalClient:
-    """Threat-intel adapter placeholder for VirusTotal."""
+    """
+    Threat-intel adapter for VirusTotal's v3 API.
+
+    Without an API key or HTTP pool it returns a deterministic scaffold response instead.
+    """
 
     name = "virustotal"
+    supported_indicator_types = frozenset(
+        {
+            IndicatorType.URL,
+            IndicatorType.DOMAIN,
+            IndicatorType.IP_ADDRESS,
+            IndicatorType.EMAIL_ADDRESS,
+            IndicatorType.FILE_HASH,
+        }
+    )
 
-    def __init__(self, api_key: str, base_url: str, timeout_seconds: int) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        timeout_seconds: int,
+        http_pool: HttpClientPool | None = None,
+    ) -> None:
         self.api_key = api_key
-        self.base_url = base_url
+        self.base_url = base_url.rstrip("/")
         self.timeout_seconds = timeout_seconds
+        self.http_pool = http_pool
 
     async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
-        """Return a deterministic scaffold response without calling the network."""
+        """Look up the first indicator, or return the scaffold response when not configured."""
+        if not self.api_key or self.http_pool is None:
+            return {
+                "source_name": self.name,
+                "verdict": "observed",
+                "confidence_score": 65,
+                "summary": f"VirusTotal placeholder hit count for {artifact_value[:40]}.",
+            }
+
+        indicator = indicators[0] if indicators else artifact_value
+        response = await self.http_pool.request(
+            self.name,
+            "GET",
+            f"{self.base_url}/{self._object_path(indicator)}",
+            headers={"x-apikey": self.api_key},
+            timeout=self.timeout_seconds,
+        )
+        if response.status_code == 404:
+            return {
+                "source_name": self.name,
+                "verdict": "unknown",
+                "confidence_score": 0,
+                "summary": f"VirusTotal has no record of {indicator[:40]}.",
+            }
+        response.raise_for_status()
+
+        stats = response.json()["data"]["attributes"].get("last_analysis_stats", {})
+        malicious = int(stats.get("malicious", 0))
+        suspicious = int(stats.get("suspicious", 0))
+        total = sum(int(count) for count in stats.values()) or 1
+        if malicious:
+            verdict = "malicious"
+        elif suspicious:
+            verdict = "suspicious"
+        else:
+            verdict = "clean"
+        # Confidence tracks threat: the share of engines that flagged it, so clean results score 0.
         return {
             "source_name": self.name,
-            "verdict": "observed",
-            "confidence_score": 65,
-            "summary": f"VirusTotal placeholder hit count for {artifact_value[:40]}.",
+            "verdict": verdict,
+            "confidence_score": round(100 * (malicious + suspicious) / total),
+            "summary": f"VirusTotal: {malicious} malicious and {suspicious} suspicious of {total} engines.",
         }
+
+    @staticmethod
+    def _object_path(indicator: str) -> str:
+        """Map an indicator onto the matching v3 collection."""
+        value = indicator.strip()
+        indicator_type = classify_indicator(value)
+        if indicator_type is IndicatorType.URL:
+            url_id = base64.urlsafe_b64encode(value.encode("utf-8")).decode("ascii").rstrip("=")
+            return f"urls/{url_id}"
+        if indicator_type is IndicatorType.FILE_HASH:
+            return f"files/{value.lower()}"
+        if indicator_type is IndicatorType.IP_ADDRESS:
+            return f"ip_addresses/{value}"
+        return f"domains/{value.rsplit('@', 1)[-1].lower()}"
@@ -0,0 +1,229 @@
+"""
+Purpose:
+    Stream indicators out of threat-feed exports: CSV lists, STIX 2.1 bundles, and MISP events.
+Inputs:
+    Text streams of feed files, plus the feed format (or a file name and head bytes to detect it).
+Outputs:
+    `FeedIndicator` records with raw values, one per indicator, in file order.
+Dependencies:
+    Standard library `csv` and `re`; the incremental JSON walker in `app.utils.json_stream`.
+TODO Checklist:
+    - [ ] Parse STIX patterns with AND/comparison operators other than `=` if feeds start using them.
+    - [ ] Carry `valid_until` / MISP decay scores through once indicators expire in the local store.
+"""
+
+import csv
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TextIO
+
+from app.utils.enums import IndicatorType
+from app.utils.json_stream import ANY_ITEM, iter_json_array_items
+
+FEED_FORMATS = ("csv", "stix", "misp")
+FEED_VERDICTS = ("malicious", "suspicious", "informational")
+DEFAULT_CONFIDENCE = 80
+
+STIX_PATHS = [("objects",)]
+MISP_PATHS = [
+    (*prefix, *path)
+    for prefix in [(), (ANY_ITEM,), ("response", ANY_ITEM)]
+    for path in [("Event", "Attribute"), ("Event", "Object", ANY_ITEM, "Attribute")]
+]
+
+# STIX cyber-observable types (as pattern objects or bare SCOs) and MISP attribute types.
+_TYPE_ALIASES = {
+    "url": IndicatorType.URL,
+    "uri": IndicatorType.URL,
+    "link": IndicatorType.URL,
+    "domain": IndicatorType.DOMAIN,
+    "domain-name": IndicatorType.DOMAIN,
+    "hostname": IndicatorType.DOMAIN,
+    "ip": IndicatorType.IP_ADDRESS,
+    "ipv4": IndicatorType.IP_ADDRESS,
+    "ipv6": IndicatorType.IP_ADDRESS,
+    "ipv4-addr": IndicatorType.IP_ADDRESS,
+    "ipv6-addr": IndicatorType.IP_ADDRESS,
+    "ip-src": IndicatorType.IP_ADDRESS,
+    "ip-dst": IndicatorType.IP_ADDRESS,
+    "email": IndicatorType.EMAIL_ADDRESS,
+    "email-addr": IndicatorType.EMAIL_ADDRESS,
+    "email-src": IndicatorType.EMAIL_ADDRESS,
+    "email-dst": IndicatorType.EMAIL_ADDRESS,
+    "md5": IndicatorType.FILE_HASH,
+    "sha1": IndicatorType.FILE_HASH,
+    "sha256": IndicatorType.FILE_HASH,
+    "hash": IndicatorType.FILE_HASH,
+    "file": IndicatorType.FILE_HASH,
+    **{indicator_type.value: indicator_type for indicator_type in IndicatorType},
+}
+# `[ipv4-addr:value = '203.0.113.7']`, `[file:hashes.'SHA-256' = '...']`, joined by OR.
+_STIX_COMPARISON = re.compile(r"([a-z0-9-]+):([\w.'-]+)\s*=\s*'((?:[^'\\]|\\.)*)'", re.IGNORECASE)
+_STIX_VERDICTS = {
+    "malicious-activity": "malicious",
+    "compromised": "malicious",
+    "attribution": "malicious",
+    "anomalous-activity": "suspicious",
+    "unknown": "suspicious",
+    "benign": "informational",
+}
+_CSV_VALUE_COLUMNS = ("value", "indicator", "ioc", "observable")
+_CSV_TYPE_COLUMNS = ("type", "indicator_type")
+_CSV_TAG_COLUMNS = ("tags", "labels")
+
+
+@dataclass(frozen=True, slots=True)
+class FeedIndicator:
+    """One indicator as the feed states it; the type is None when the feed leaves it implicit."""
+
+    indicator_type: IndicatorType | None
+    value: str
+    verdict: str = "malicious"
+    confidence: int = DEFAULT_CONFIDENCE
+    tags: tuple[str, ...] = ()
+
+
+def detect_feed_format(name: str | None, head: bytes) -> str:
+    """Pick a feed format from the file name or, for JSON, from keys near the top of the document."""
+    if name and name.lower().endswith((".csv", ".txt")):
+        return "csv"
+    stripped = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if not stripped.startswith((b"{", b"[")):
+        return "csv"
+    if b'"spec_version"' in head or b'"objects"' in head:
+        return "stix"
+    if b'"Event"' in head or b'"response"' in head:
+        return "misp"
+    raise ValueError("Could not tell whether the JSON feed is a STIX bundle or a MISP export.")
+
+
+def iter_feed_indicators(handle: TextIO, feed_format: str) -> Iterator[FeedIndicator]:
+    if feed_format == "csv":
+        return iter_csv_indicators(handle)
+    if feed_format == "stix":
+        return iter_stix_indicators(handle)
+    if feed_format == "misp":
+        return iter_misp_indicators(handle)
+    raise ValueError(f"Unsupported feed format {feed_format!r}; expected one of {', '.join(FEED_FORMATS)}.")
+
+
+def iter_csv_indicators(handle: TextIO) -> Iterator[FeedIndicator]:
+    """
+    Yield indicators from a CSV or plain-text list.
+
+    With a header row naming a `value`/`indicator`/`ioc` column, optional `type`, `verdict`,
+    `confidence`, and `tags` columns are read too. Without one, the first field of each row is
+    the indicator. Blank lines and `#` comments are skipped.
+    """
+    rows = csv.reader(line for line in handle if line.strip() and not line.lstrip().startswith("#"))
+    first = next(rows, None)
+    if first is None:
+        return
+    header = [field.strip().lower() for field in first]
+    value_column = next((header.index(name) for name in _CSV_VALUE_COLUMNS if name in header), None)
+    if value_column is None:
+        yield FeedIndicator(None, first[0])
+        for row in rows:
+            if row and row[0].strip():
+                yield FeedIndicator(None, row[0])
+        return
+
+    def column(names: tuple[str, ...]) -> int | None:
+        return next((header.index(name) for name in names if name in header), None)
+
+    type_column = column(_CSV_TYPE_COLUMNS)
+    verdict_column = column(("verdict",))
+    confidence_column = column(("confidence",))
+    tags_column = column(_CSV_TAG_COLUMNS)
+
+    def field(row: list[str], index: int | None) -> str:
+        return row[index].strip() if index is not None and index < len(row) else ""
+
+    for row in rows:
+        value = field(row, value_column)
+        if not value:
+            continue
+        yield FeedIndicator(
+            _TYPE_ALIASES.get(field(row, type_column).lower()),
+            value,
+            _verdict(field(row, verdict_column).lower()),
+            _confidence(field(row, confidence_column)),
+            _split_tags(field(row, tags_column)),
+        )
+
+
+def iter_stix_indicators(handle: TextIO) -> Iterator[FeedIndicator]:
+    """
+    Yield indicators from a STIX 2.1 bundle: `indicator` objects with STIX patterns, plus bare
+    URL/domain/IP/email observables. Revoked indicators and non-STIX patterns are skipped.
+    """
+    for item in iter_json_array_items(handle, STIX_PATHS):
+        if not isinstance(item, dict):
+            continue
+        object_type = item.get("type")
+        if object_type != "indicator":
+            indicator_type = _TYPE_ALIASES.get(str(object_type)) if object_type != "file" else None
+            if indicator_type is not None and isinstance(item.get("value"), str):
+                yield FeedIndicator(indicator_type, item["value"])
+            continue
+        if item.get("revoked") or item.get("pattern_type", "stix") != "stix":
+            continue
+        indicator_types = [str(kind) for kind in item.get("indicator_types") or []]
+        verdict = next((_STIX_VERDICTS[kind] for kind in indicator_types if kind in _STIX_VERDICTS), "malicious")
+        confidence = _confidence(item.get("confidence"))
+        tags = tuple(str(label) for label in item.get("labels") or [])
+        for object_type, object_path, value in _STIX_COMPARISON.findall(str(item.get("pattern", ""))):
+            object_type = object_type.lower()
+            if object_type == "file" and not object_path.startswith("hashes."):
+                continue
+            indicator_type = _TYPE_ALIASES.get(object_type)
+            if indicator_type is not None:
+                yield FeedIndicator(indicator_type, value.replace("\\'", "'"), verdict, confidence, tags)
+
+
+def iter_misp_indicators(handle: TextIO) -> Iterator[FeedIndicator]:
+    """
+    Yield indicators from a MISP event export (single event, event list, or `response` wrapper).
+
+    Attributes inside MISP objects are included. Deleted attributes are skipped; attributes
+    without the `to_ids` flag come through as suspicious rather than malicious. Composite
+    types such as `ip-dst|port` and `filename|sha256` keep the part that is an indicator.
+    """
+    for item in iter_json_array_items(handle, MISP_PATHS):
+        if not isinstance(item, dict) or item.get("deleted") or not isinstance(item.get("value"), str):
+            continue
+        attribute_type = str(item.get("type", "")).lower()
+        value = item["value"]
+        if "|" in attribute_type:
+            first_type, second_type = attribute_type.split("|", 1)
+            first_value, _, second_value = value.partition("|")
+            attribute_type, value = (
+                (first_type, first_value) if first_type in _TYPE_ALIASES else (second_type, second_value)
+            )
+        indicator_type = _TYPE_ALIASES.get(attribute_type)
+        if indicator_type is None:
+            continue
+        to_ids = item.get("to_ids") in (True, 1, "1", "true")
+        yield FeedIndicator(
+            indicator_type,
+            value,
+            "malicious" if to_ids else "suspicious",
+            DEFAULT_CONFIDENCE if to_ids else 50,
+            tuple(str(tag["name"]) for tag in item.get("Tag") or [] if isinstance(tag, dict) and "name" in tag),
+        )
+
+
+def _verdict(value: str) -> str:
+    return value if value in FEED_VERDICTS else "malicious"
+
+
+def _confidence(value: object) -> int:
+    try:
+        return max(0, min(100, int(value)))
+    except (TypeError, ValueError):
+        return DEFAULT_CONFIDENCE
+
+
+def _split_tags(value: str) -> tuple[str, ...]:
+    return tuple(tag.strip() for tag in re.split(r"[;|]", value) if tag.strip())
@@ -0,0 +1,166 @@
+"""
+Purpose:
+    Offline GeoIP/ASN database: country, ASN, and organization per IP from one memory-mapped file.
+Inputs:
+    CSV rows keyed by network (country, ASN, and organization columns) when compiling; IPs when serving.
+Outputs:
+    A compiled database file and `GeoIpRecord` lookups for single addresses or whole batches.
+Dependencies:
+    Standard library `mmap`, `struct`, `array`, and `bisect`; CIDR flattening from `ip_range_index`;
+    NumPy for zero-copy vectorized batches.
+TODO Checklist:
+    - [ ] Add city/region columns if analysts ask for more than country-level context.
+"""
+
+import bisect
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.services.ip_range_index import IpNetwork, address_bytes, flatten_networks
+from app.services.local_hash_index import FixedWidthRecords
+
+MAGIC = b"CGGEOIP1"
+# magic, interval count, organization count; then start keys, end keys, records, org offsets, org names.
+_HEADER = struct.Struct("<8sQQ")
+# country code, ASN, organization id.
+_RECORD = struct.Struct("<2s2xII")
+_KEY_BYTES = 16
+
+
+@dataclass(frozen=True, slots=True)
+class GeoIpRecord:
+    country: str
+    asn: int
+    organization: str
+
+
+@dataclass(frozen=True, slots=True)
+class GeoIpDatabaseStats:
+    path: str
+    networks: int
+    intervals: int
+    organizations: int
+    size_bytes: int
+
+
+class GeoIpDatabase:
+    """
+    Read-only view over a compiled GeoIP/ASN database.
+
+    The file is mapped read-only, so every worker process reads the same page-cache pages
+    and nothing is copied per process. Single lookups binary-search the 16-byte start keys
+    in place. The key tables are also wrapped as zero-copy NumPy arrays over the mapping,
+    and `lookup_many` resolves a batch with one `searchsorted` call.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], use_numpy: bool = True) -> None:
+        self.path = str(path)
+        with open(path, "rb") as handle:
+            self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, organizations = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a compiled GeoIP database")
+        starts_offset = _HEADER.size
+        ends_offset = starts_offset + count * _KEY_BYTES
+        self._records_offset = ends_offset + count * _KEY_BYTES
+        org_offsets_offset = self._records_offset + count * _RECORD.size
+        self._org_blob_offset = org_offsets_offset + (organizations + 1) * 4
+        self._starts = FixedWidthRecords(self._buffer, starts_offset, _KEY_BYTES, count)
+        self._ends = FixedWidthRecords(self._buffer, ends_offset, _KEY_BYTES, count)
+        self._org_offsets = memoryview(self._buffer)[org_offsets_offset : self._org_blob_offset].cast("I")
+        self._organizations: dict[int, str] = {}
+
+        self._np_starts = self._np_ends = None
+        if use_numpy and count:
+            self._np_starts = np.frombuffer(self._buffer, dtype="S16", count=count, offset=starts_offset)
+            self._np_ends = np.frombuffer(self._buffer, dtype="S16", count=count, offset=ends_offset)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def lookup(self, address: str) -> GeoIpRecord | None:
+        key = address_bytes(address)
+        if key is None:
+            return None
+        index = bisect.bisect_right(self._starts, key) - 1
+        if index < 0 or key > self._ends[index]:
+            return None
+        return self._record(index)
+
+    def lookup_many(self, addresses: list[str]) -> list[GeoIpRecord | None]:
+        """Resolve a batch of addresses; invalid or unlisted addresses map to None."""
+        if self._np_starts is None:
+            return [self.lookup(address) for address in addresses]
+        keys = [address_bytes(address) for address in addresses]
+        queries = np.array([key or bytes(_KEY_BYTES) for key in keys], dtype="S16")
+        indexes = np.searchsorted(self._np_starts, queries, side="right") - 1
+        hits = (indexes >= 0) & (queries <= self._np_ends[np.maximum(indexes, 0)])
+        return [
+            self._record(index) if hit and key is not None else None
+            for key, index, hit in zip(keys, indexes.tolist(), hits.tolist())
+        ]
+
+    def _record(self, index: int) -> GeoIpRecord:
+        country, asn, org_id = _RECORD.unpack_from(self._buffer, self._records_offset + index * _RECORD.size)
+        organization = self._organizations.get(org_id)
+        if organization is None:
+            start = self._org_blob_offset + self._org_offsets[org_id]
+            end = self._org_blob_offset + self._org_offsets[org_id + 1]
+            organization = self._organizations[org_id] = self._buffer[start:end].decode("utf-8")
+        return GeoIpRecord(country.decode("ascii").rstrip("\0"), asn, organization)
+
+
+def build_geoip_database(
+    networks: Iterable[tuple[IpNetwork, str, int, str]],
+    output_path: str | os.PathLike[str],
+) -> GeoIpDatabaseStats:
+    """
+    Compile `(network, country, asn, organization)` rows into a database file.
+
+    Nested networks are flattened so the most specific row wins. Identical records share one
+    payload, so neighbouring intervals of the same ASN merge and organization names are
+    stored once. The file is written next to `output_path` and renamed over it.
+    """
+    payloads: dict[tuple[str, int, str], tuple[str, int, str]] = {}
+
+    def shared_payloads() -> Iterator[tuple[IpNetwork, tuple[str, int, str]]]:
+        for network, country, asn, organization in networks:
+            payload = (country.upper()[:2], asn, organization)
+            yield network, payloads.setdefault(payload, payload)
+
+    flattened = flatten_networks(shared_payloads())
+    organization_ids: dict[str, int] = {}
+    records = bytearray()
+    for country, asn, organization in flattened.payloads:
+        org_id = organization_ids.setdefault(organization, len(organization_ids))
+        records += _RECORD.pack(country.encode("ascii", errors="replace"), asn, org_id)
+    names = [name.encode("utf-8") for name in organization_ids]
+    org_offsets = array("I", [0])
+    for name in names:
+        org_offsets.append(org_offsets[-1] + len(name))
+
+    output = Path(output_path)
+    partial = output.with_name(output.name + ".partial")
+    with partial.open("wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, len(flattened.starts), len(names)))
+        handle.write(b"".join(key.to_bytes(_KEY_BYTES, "big") for key in flattened.starts))
+        handle.write(b"".join(key.to_bytes(_KEY_BYTES, "big") for key in flattened.ends))
+        handle.write(records)
+        handle.write(org_offsets.tobytes())
+        handle.write(b"".join(names))
+    os.replace(partial, output)
+    return GeoIpDatabaseStats(
+        str(output),
+        flattened.networks,
+        len(flattened.starts),
+        len(names),
+        output.stat().st_size,
+    )
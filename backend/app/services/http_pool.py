@@ -0,0 +1,121 @@
+"""
+Purpose:
+    App-lifetime pooled HTTP clients shared by enrichment adapters, one client per upstream host.
+Inputs:
+    Absolute request URLs plus the name of the adapter making each call.
+Outputs:
+    `httpx` responses over keep-alive connections, and per-adapter pool statistics.
+Dependencies:
+    httpx (HTTP/2 is used only when the optional `h2` package is installed).
+TODO Checklist:
+    - [ ] Add per-host connection limits if one upstream starts starving the others.
+"""
+
+import importlib.util
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass
+class _SourceCounters:
+    host: str
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+
+
+class HttpClientPool:
+    """
+    Lazily created `httpx.AsyncClient` per scheme/host/port, reused for the app's lifetime.
+
+    Clients bind to the event loop that first uses them, so `close()` must run on that loop
+    (the API lifespan or the worker's `asyncio.run`) before another loop reuses the pool.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_seconds: float = 30.0,
+        timeout_seconds: float = 20.0,
+        http2_enabled: bool = True,
+    ) -> None:
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self.timeout_seconds = timeout_seconds
+        self.http2 = http2_enabled and importlib.util.find_spec("h2") is not None
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._counters: dict[str, _SourceCounters] = {}
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        """Return the shared client for the URL's origin, creating it on first use."""
+        origin = self._origin(httpx.URL(url))
+        client = self._clients.get(origin)
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=self.timeout_seconds,
+                http2=self.http2,
+            )
+            self._clients[origin] = client
+        return client
+
+    async def request(self, source_name: str, method: str, url: str, **kwargs: object) -> httpx.Response:
+        """Send one request through the pooled client and record it against `source_name`."""
+        counters = self._counters.setdefault(source_name, _SourceCounters(host=self._origin(httpx.URL(url))))
+        counters.requests += 1
+        counters.in_flight += 1
+        try:
+            return await self.client_for(url).request(method, url, **kwargs)
+        except httpx.HTTPError:
+            counters.errors += 1
+            raise
+        finally:
+            counters.in_flight -= 1
+
+    def stats(self) -> list[dict[str, object]]:
+        """Return request counters per adapter plus connection counts of the host it uses."""
+        rows: list[dict[str, object]] = []
+        for source_name, counters in sorted(self._counters.items()):
+            connections, idle_connections = _connection_counts(self._clients.get(counters.host))
+            rows.append(
+                {
+                    "name": source_name,
+                    "host": counters.host,
+                    "http2": self.http2,
+                    "requests": counters.requests,
+                    "errors": counters.errors,
+                    "in_flight": counters.in_flight,
+                    "connections": connections,
+                    "idle_connections": idle_connections,
+                    "max_connections": self.limits.max_connections,
+                }
+            )
+        return rows
+
+    async def close(self) -> None:
+        """Close every client; the next request after this opens fresh connections."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    @staticmethod
+    def _origin(url: httpx.URL) -> str:
+        port = f":{url.port}" if url.port else ""
+        return f"{url.scheme}://{url.host}{port}"
+
+
+def _connection_counts(client: httpx.AsyncClient | None) -> tuple[int, int]:
+    """
+    Read open/idle connection counts from httpcore's pool.
+
+    httpx does not expose pool state publicly, so custom transports simply report zero.
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    return len(connections), sum(1 for connection in connections if connection.is_idle())
@@ -0,0 +1,71 @@
+"""
+Purpose:
+    Hot-swap memory-mapped lookup indexes when their compiled file is rebuilt on disk.
+Inputs:
+    An index file path and the function that opens it.
+Outputs:
+    The current index object, reopened after a builder renames a new file over the path.
+Dependencies:
+    Standard library `os` and `time`.
+TODO Checklist:
+    - [ ] Trigger reloads from a file watcher instead of polling if check intervals get too coarse.
+"""
+
+import os
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+IndexT = TypeVar("IndexT")
+
+
+class ReloadingIndex(Generic[IndexT]):
+    """
+    Hold a memory-mapped index and swap in a new one when its file is replaced.
+
+    Builders write a new file and rename it over the old path, so a changed inode or mtime
+    means a complete new build. The check is a `stat` call at most every
+    `check_interval_seconds`. Lookups already holding the old index keep using it until
+    they finish, and its mapping closes once nothing references it.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        opener: Callable[[str], IndexT],
+        check_interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = str(path)
+        self.opener = opener
+        self.check_interval_seconds = check_interval_seconds
+        self.clock = clock
+        self._stamp = self._file_stamp()
+        self._index = opener(self.path)
+        self._checked_at = clock()
+        self.reloads = 0
+
+    @property
+    def current(self) -> IndexT:
+        now = self.clock()
+        if now - self._checked_at >= self.check_interval_seconds:
+            self._checked_at = now
+            self.reload_if_changed()
+        return self._index
+
+    def reload_if_changed(self) -> bool:
+        """Open the file again if it was replaced; a broken replacement keeps the old index."""
+        try:
+            stamp = self._file_stamp()
+            if stamp == self._stamp:
+                return False
+            index = self.opener(self.path)
+        except (OSError, ValueError):
+            return False
+        self._index, self._stamp = index, stamp
+        self.reloads += 1
+        return True
+
+    def _file_stamp(self) -> tuple[int, int, int]:
+        stat = os.stat(self.path)
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
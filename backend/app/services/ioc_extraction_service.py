@@ -2,24 +2,220 @@
 Purpose:
     Extract IOC-like values from normalized artifacts.
 Inputs:
-    Normalized artifact value and artifact type.
+    Normalized artifact value and artifact type, or a byte stream for large files and email bodies.
 Outputs:
-    Small list of indicators that enrichment adapters can consume.
+    Deduplicated, typed indicators (URLs, emails, IPs, hashes, domains) for enrichment adapters.
 Dependencies:
-    Scaffold enums only.
+    Standard library `re`, `ipaddress`, and `codecs`, hashing and URL helpers, and shared enums.
 TODO Checklist:
-    - [ ] Add regex-based extraction for URLs, domains, hashes, and email headers.
+    - [x] Add regex-based extraction for URLs, domains, hashes, and email headers.
     - [ ] Separate extractor modules if email parsing becomes a real feature.
 """
 
-from app.utils.enums import ArtifactType
+import codecs
+import ipaddress
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from app.utils.enums import ArtifactType, IndicatorType
+from app.utils.hashing import sha256_chunks
+from app.utils.url_tools import normalize_url
+
+_DOT = r"(?:\.|\[\.\]|\(\.\)|\[dot\]|\(dot\))"
+_LABEL = r"[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?"
+_HOST = rf"(?:{_LABEL}{_DOT})+[a-z]{{2,63}}(?![a-z0-9-])"
+
+# Cheap single pass over the whole text: whitespace-delimited tokens that contain a character
+# every IOC form needs (dot, colon, @, bracket, slash, "=") or that are a bare hex digest. Plain
+# prose words fail after one scan of the word, so the full pattern below only sees candidates.
+_CANDIDATE_PATTERN = re.compile(
+    r"""(?<!\S)(?:[^\s.:@\[(/=]*[.:@\[(/=]\S*|["'<]?[0-9a-f]{32,64}(?![0-9a-z]))""",
+    re.IGNORECASE,
+)
+
+# Every branch starts with a negative lookbehind so it can only begin at a token boundary,
+# which keeps matching linear instead of retrying each branch from every character.
+_IOC_PATTERN = re.compile(
+    rf"""
+    (?P<url>(?<![\w])(?:h(?:tt|xx)ps?|ftp)(?::|\[:\])//[^\s<>"'`]+)
+    | (?P<email>(?<![\w.%+-])[a-z0-9._%+-]{{1,64}}(?:@|\[@\]|\[at\]){_HOST})
+    | (?P<ipv4>(?<![\w.])(?:\d{{1,3}}{_DOT}){{3}}\d{{1,3}}(?!\w|\.\d))
+    | (?P<ipv6>(?<![\w:])(?:[0-9a-f]{{0,4}}:){{2,7}}[0-9a-f]{{0,4}}(?![\w:]))
+    | (?P<hash>(?<![0-9a-z])(?:[0-9a-f]{{64}}|[0-9a-f]{{40}}|[0-9a-f]{{32}})(?![0-9a-z]))
+    | (?P<domain>(?<![\w.@-]){_HOST})
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_DEFANGED = re.compile(r"\[\.\]|\(\.\)|\[dot\]|\(dot\)|\[@\]|\[at\]|\[:\]|^hxxp", re.IGNORECASE)
+_REFANGED = {
+    "[.]": ".",
+    "(.)": ".",
+    "[dot]": ".",
+    "(dot)": ".",
+    "[@]": "@",
+    "[at]": "@",
+    "[:]": ":",
+    "hxxp": "http",
+}
+_URL_TRAILING = ".,;:!?)]}>'\""
+
+# Common file extensions that also look like TLDs; "invoice.pdf" in an email body is not a domain.
+FILE_EXTENSION_TLDS = frozenset(
+    "exe dll bat cmd scr js vbs ps1 pdf doc docx docm xls xlsx xlsm ppt pptx txt csv rtf htm html "
+    "png jpg jpeg gif bmp iso img lnk msi jar rar gz 7z eml msg".split()
+)
+_GROUP_TYPES = {
+    "url": IndicatorType.URL,
+    "email": IndicatorType.EMAIL_ADDRESS,
+    "ipv4": IndicatorType.IP_ADDRESS,
+    "ipv6": IndicatorType.IP_ADDRESS,
+    "hash": IndicatorType.FILE_HASH,
+    "domain": IndicatorType.DOMAIN,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractedIndicator:
+    value: str
+    indicator_type: IndicatorType
+
+
+@dataclass(frozen=True, slots=True)
+class StreamExtraction:
+    sha256: str
+    size_bytes: int
+    indicators: list[ExtractedIndicator]
+    truncated: bool
+
+
+class StreamingIocExtractor:
+    """
+    Incremental extractor fed with raw byte chunks.
+
+    Candidates are whitespace-delimited tokens, so each chunk is scanned up to its last
+    whitespace and only the trailing partial token is carried into the next one. That keeps
+    indicators split across chunk boundaries intact while holding at most one token in memory.
+    A token longer than `max_token_chars` is scanned as it stands and not carried further.
+    """
+
+    def __init__(
+        self,
+        max_token_chars: int = 8192,
+        max_indicators: int = 10_000,
+        encoding: str = "utf-8",
+    ) -> None:
+        self.max_token_chars = max_token_chars
+        self.max_indicators = max_indicators
+        self.truncated = False
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._tail = ""
+        self._found: dict[str, ExtractedIndicator] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        """Scan every complete token in `chunk` plus whatever was carried from the previous one."""
+        text = self._tail + self._decoder.decode(chunk)
+        cut = _last_token_start(text, self.max_token_chars)
+        self._scan(text[:cut])
+        self._tail = text[cut:]
+
+    def close(self) -> list[ExtractedIndicator]:
+        """Flush the final token and return everything found, in first-seen order."""
+        self._scan(self._tail + self._decoder.decode(b"", final=True))
+        self._tail = ""
+        return list(self._found.values())
+
+    def _scan(self, text: str) -> None:
+        if text and not self.truncated:
+            self.truncated = _scan(text, self._found, self.max_indicators)
 
 
 class IocExtractionService:
-    """Return lightweight extracted indicators for the scaffold pipeline."""
+    """Return extracted indicators for the scan pipeline."""
+
+    def __init__(self, max_token_chars: int = 8192, max_indicators: int = 10_000) -> None:
+        self.max_token_chars = max_token_chars
+        self.max_indicators = max_indicators
 
     def extract(self, artifact_type: ArtifactType, normalized_value: str) -> list[str]:
-        """Extract a small set of dedupe-friendly indicators."""
+        """Extract dedupe-friendly indicator values; single-value artifacts are their own indicator."""
         if artifact_type == ArtifactType.EMAIL_SIGNAL:
-            return [segment for segment in normalized_value.split() if "." in segment or "@" in segment]
+            return [indicator.value for indicator in self.extract_typed(normalized_value)]
         return [normalized_value]
+
+    def extract_typed(self, text: str) -> list[ExtractedIndicator]:
+        """
+        Scan free text once and return refanged, normalized indicators in first-seen order.
+
+        Defanged forms such as `hxxp://`, `example[.]org`, and `user[at]example.org` are
+        recognized and returned in their live form so they share cache entries with normal input.
+        """
+        found: dict[str, ExtractedIndicator] = {}
+        _scan(text, found, self.max_indicators)
+        return list(found.values())
+
+    def streaming_extractor(self) -> StreamingIocExtractor:
+        """Return an incremental extractor for callers that receive bytes asynchronously."""
+        return StreamingIocExtractor(max_token_chars=self.max_token_chars, max_indicators=self.max_indicators)
+
+    def extract_stream(self, chunks: Iterable[bytes]) -> StreamExtraction:
+        """
+        Hash and extract a file or email body in one pass without loading it into memory.
+
+        Memory stays bounded by the chunk size, one carried token, and `max_indicators`;
+        `truncated` reports whether the indicator cap was hit.
+        """
+        extractor = self.streaming_extractor()
+        size_bytes = 0
+
+        def feed_through() -> Iterator[bytes]:
+            nonlocal size_bytes
+            for chunk in chunks:
+                size_bytes += len(chunk)
+                extractor.feed(chunk)
+                yield chunk
+
+        digest = sha256_chunks(feed_through())
+        indicators = extractor.close()
+        return StreamExtraction(digest, size_bytes, indicators, extractor.truncated)
+
+
+def _scan(text: str, found: dict[str, ExtractedIndicator], max_indicators: int) -> bool:
+    """Add indicators from `text` to `found`; returns True once `max_indicators` is reached."""
+    for candidate in _CANDIDATE_PATTERN.finditer(text):
+        for match in _IOC_PATTERN.finditer(text, candidate.start(), candidate.end()):
+            kind = match.lastgroup
+            value = _normalize(kind, match.group())
+            if value is not None and value not in found:
+                if len(found) >= max_indicators:
+                    return True
+                found[value] = ExtractedIndicator(value, _GROUP_TYPES[kind])
+    return False
+
+
+def _last_token_start(text: str, max_token_chars: int) -> int:
+    """Index just past the last whitespace, looking back at most `max_token_chars` characters."""
+    stop = max(-1, len(text) - max_token_chars - 1)
+    for index in range(len(text) - 1, stop, -1):
+        if text[index].isspace():
+            return index + 1
+    return len(text) if len(text) > max_token_chars else 0
+
+
+def _normalize(kind: str, raw: str) -> str | None:
+    """Refang and canonicalize one match; returns None for matches that turn out not to be IOCs."""
+    value = raw
+    if "[" in raw or "(" in raw or raw[:4].lower() == "hxxp":
+        value = _DEFANGED.sub(lambda match: _REFANGED[match.group().lower()], raw)
+    if kind == "url":
+        return normalize_url(value.rstrip(_URL_TRAILING))
+    if kind in ("ipv4", "ipv6"):
+        try:
+            address = ipaddress.ip_address(value)
+        except ValueError:
+            return None
+        return None if address.is_unspecified else str(address)
+    value = value.lower()
+    if kind == "domain" and value.rstrip(".").rsplit(".", 1)[-1] in FILE_EXTENSION_TLDS:
+        return None
+    return value.rstrip(".")
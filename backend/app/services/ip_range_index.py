@@ -0,0 +1,200 @@
+"""
+Purpose:
+    Match IPv4 and IPv6 addresses against large CIDR feeds (C2 ranges, Tor exits, hosting ASNs).
+Inputs:
+    CSV rows of `network,label[,verdict]` when loading; single addresses or batches when looking up.
+Outputs:
+    The label and verdict of the most specific listed network containing each address.
+Dependencies:
+    Standard library `ipaddress`, `socket`, `bisect`, and `csv`; NumPy for vectorized batches.
+TODO Checklist:
+    - [ ] Persist the flattened intervals to an mmap file if feed loading shows up in startup time.
+"""
+
+import bisect
+import csv
+import ipaddress
+import os
+import socket
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+import numpy as np
+
+PayloadT = TypeVar("PayloadT")
+IpNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+IP_RANGE_VERDICTS = ("malicious", "suspicious", "informational")
+# IPv4 addresses live in the IPv4-mapped IPv6 block so one 128-bit keyspace covers both families.
+_IPV4_MAPPED = 0xFFFF << 32
+_IPV4_MAPPED_PREFIX = bytes(10) + b"\xff\xff"
+
+
+@dataclass(frozen=True, slots=True)
+class IpRangeMatch:
+    network: str
+    label: str
+    verdict: str
+
+
+def address_bytes(value: str) -> bytes | None:
+    """Return the 16-byte big-endian key of an IPv4 or IPv6 address, or None if it is not one."""
+    value = value.strip()
+    try:
+        return _IPV4_MAPPED_PREFIX + socket.inet_pton(socket.AF_INET, value)
+    except OSError:
+        pass
+    try:
+        return socket.inet_pton(socket.AF_INET6, value)
+    except OSError:
+        return None
+
+
+def address_key(value: str) -> int | None:
+    """Return the 128-bit integer key of an IPv4 or IPv6 address, or None if it is not one."""
+    packed = address_bytes(value)
+    return None if packed is None else int.from_bytes(packed, "big")
+
+
+def _network_bounds(network: IpNetwork) -> tuple[int, int]:
+    if network.version == 4:
+        return _IPV4_MAPPED | int(network.network_address), _IPV4_MAPPED | int(network.broadcast_address)
+    return int(network.network_address), int(network.broadcast_address)
+
+
+@dataclass(slots=True)
+class FlattenedNetworks(Generic[PayloadT]):
+    starts: list[int]
+    ends: list[int]
+    payloads: list[PayloadT]
+    networks: int
+
+
+def parse_network(value: str) -> IpNetwork | None:
+    """Parse a CIDR or bare address (host bits allowed), or return None."""
+    try:
+        return ipaddress.ip_network(value.strip(), strict=False)
+    except ValueError:
+        return None
+
+
+def flatten_networks(networks: Iterable[tuple[IpNetwork, PayloadT]]) -> FlattenedNetworks[PayloadT]:
+    """
+    Turn `(network, payload)` pairs into sorted, non-overlapping `[start, end]` address intervals.
+
+    CIDR blocks are either nested or disjoint, so a stack walk over blocks sorted by start
+    (widest first) gives every address the payload of the most specific block holding it.
+    For identical blocks the later one wins.
+    """
+    blocks = []
+    for order, (network, payload) in enumerate(networks):
+        start, end = _network_bounds(network)
+        blocks.append((start, -end, order, payload))
+    blocks.sort(key=lambda block: block[:3])
+
+    result: FlattenedNetworks[PayloadT] = FlattenedNetworks([], [], [], len(blocks))
+
+    def emit(start: int, end: int, payload: PayloadT) -> int:
+        if start <= end:
+            if result.payloads and result.payloads[-1] is payload and result.ends[-1] == start - 1:
+                result.ends[-1] = end
+            else:
+                result.starts.append(start)
+                result.ends.append(end)
+                result.payloads.append(payload)
+        return end + 1
+
+    stack: list[tuple[int, PayloadT]] = []
+    cursor = 0
+    for start, negative_end, _, payload in blocks:
+        while stack and stack[-1][0] < start:
+            end, enclosing = stack.pop()
+            cursor = emit(cursor, end, enclosing)
+        if stack:
+            emit(cursor, start - 1, stack[-1][1])
+        stack.append((-negative_end, payload))
+        cursor = start
+    while stack:
+        end, enclosing = stack.pop()
+        cursor = emit(cursor, end, enclosing)
+    return result
+
+
+class IpRangeIndex:
+    """
+    Sorted, non-overlapping address intervals built from CIDR feeds.
+
+    Loading flattens the feeds so the most specific block wins (a /32 C2 host inside a /16
+    hosting range reports the C2 label). A lookup is then one binary search for the last
+    interval starting at or before the address. `lookup_many` runs that search for a whole batch with `numpy.searchsorted`
+    over 16-byte big-endian keys, or with `bisect` when built with `use_numpy=False`.
+    """
+
+    def __init__(self, networks: Iterable[tuple[str, str, str]], use_numpy: bool = True) -> None:
+        self.skipped = 0
+
+        def parsed() -> Iterator[tuple[IpNetwork, IpRangeMatch]]:
+            for value, label, verdict in networks:
+                network = parse_network(value)
+                if network is None:
+                    self.skipped += 1
+                    continue
+                yield network, IpRangeMatch(str(network), label, verdict)
+
+        flattened = flatten_networks(parsed())
+        self._starts, self._ends, self._matches = flattened.starts, flattened.ends, flattened.payloads
+        self.networks = flattened.networks
+
+        self._np_starts = self._np_ends = None
+        if use_numpy:
+            self._np_starts = np.array([key.to_bytes(16, "big") for key in self._starts], dtype="S16")
+            self._np_ends = np.array([key.to_bytes(16, "big") for key in self._ends], dtype="S16")
+
+    @classmethod
+    def from_csv(cls, paths: Iterable[str | os.PathLike[str]], use_numpy: bool = True) -> "IpRangeIndex":
+        """
+        Load `network,label[,verdict]` rows from one or more CSV feeds.
+
+        A header row, blank lines, and `#` comments are skipped; the verdict defaults to
+        `suspicious`, and the label defaults to the feed's file name.
+        """
+
+        def rows():
+            for path in paths:
+                with open(path, encoding="utf-8", errors="replace", newline="") as handle:
+                    lines = (line for line in handle if line.strip() and not line.lstrip().startswith("#"))
+                    for row in csv.reader(lines):
+                        if not row or row[0].strip().lower() in {"network", "cidr", "range"}:
+                            continue
+                        label = row[1].strip() if len(row) > 1 and row[1].strip() else os.path.basename(path)
+                        verdict = row[2].strip().lower() if len(row) > 2 else "suspicious"
+                        yield row[0], label, verdict if verdict in IP_RANGE_VERDICTS else "suspicious"
+
+        return cls(rows(), use_numpy=use_numpy)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def lookup(self, address: str) -> IpRangeMatch | None:
+        key = address_key(address)
+        if key is None:
+            return None
+        index = bisect.bisect_right(self._starts, key) - 1
+        if index >= 0 and key <= self._ends[index]:
+            return self._matches[index]
+        return None
+
+    def lookup_many(self, addresses: list[str]) -> list[IpRangeMatch | None]:
+        """Match a batch of addresses in one vectorized search; invalid addresses map to None."""
+        if self._np_starts is None or not self._starts:
+            return [self.lookup(address) for address in addresses]
+        keys = [address_bytes(address) for address in addresses]
+        queries = np.array([key or bytes(16) for key in keys], dtype="S16")
+        indexes = np.searchsorted(self._np_starts, queries, side="right") - 1
+        safe = np.maximum(indexes, 0)
+        hits = (indexes >= 0) & (queries <= self._np_ends[safe])
+        return [
+            self._matches[index] if hit and key is not None else None
+            for key, index, hit in zip(keys, indexes.tolist(), hits.tolist())
+        ]
@@ -0,0 +1,177 @@
+"""
+Purpose:
+    Memory-mapped known-bad file hash corpus: Bloom filter for fast misses, sorted digests for hits.
+Inputs:
+    Hex MD5/SHA-1/SHA-256 digests when building; hex digests to look up when serving.
+Outputs:
+    A single compiled index file and constant-memory membership checks against it.
+Dependencies:
+    Standard library `mmap`, `struct`, `bisect`, and `math`.
+TODO Checklist:
+    - [ ] Switch the builder to an external merge sort if corpora outgrow builder memory.
+"""
+
+import bisect
+import math
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+MAGIC = b"CGHASH01"
+# magic, bloom bit count, bloom hash count, then one record count per digest width.
+_HEADER = struct.Struct("<8sQI4xQQQ")
+DIGEST_WIDTHS = (16, 20, 32)  # MD5, SHA-1, SHA-256
+_HEX_LENGTHS = {width * 2: width for width in DIGEST_WIDTHS}
+
+
+@dataclass(frozen=True, slots=True)
+class HashIndexStats:
+    path: str
+    digests: int
+    bloom_bits: int
+    bloom_hashes: int
+    size_bytes: int
+
+
+def digest_from_hex(value: str) -> bytes | None:
+    """Return raw digest bytes for a hex MD5/SHA-1/SHA-256, or None for anything else."""
+    value = value.strip()
+    if len(value) not in _HEX_LENGTHS:
+        return None
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        return None
+
+
+def bloom_parameters(count: int, false_positive_rate: float) -> tuple[int, int]:
+    """Bit count (a multiple of 64) and hash count for `count` entries at the target FP rate."""
+    count = max(count, 1)
+    bits = math.ceil(-count * math.log(false_positive_rate) / math.log(2) ** 2)
+    bits = max(64, (bits + 63) // 64 * 64)
+    hashes = max(1, round(bits / count * math.log(2)))
+    return bits, hashes
+
+
+def _bloom_positions(digest: bytes, bits: int, hashes: int) -> Iterable[int]:
+    """Double hashing straight from the digest bytes, which are already uniformly distributed."""
+    first = int.from_bytes(digest[:8], "little")
+    step = int.from_bytes(digest[8:16], "little") | 1
+    return ((first + index * step) % bits for index in range(hashes))
+
+
+class FixedWidthRecords:
+    """Sequence view over fixed-width records in the mapping so `bisect` can search it in place."""
+
+    def __init__(self, buffer: mmap.mmap, offset: int, width: int, count: int) -> None:
+        self._buffer = buffer
+        self._offset = offset
+        self._width = width
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> bytes:
+        start = self._offset + index * self._width
+        return self._buffer[start : start + self._width]
+
+
+class LocalHashIndex:
+    """
+    Read-only view over a compiled index file.
+
+    Nothing is loaded up front: the Bloom filter and digest tables are read through the
+    mapping, so the OS page cache holds the hot parts and many worker processes share them.
+    Most lookups are misses and end in the Bloom filter after `bloom_hashes` bit reads;
+    the rest are confirmed by binary search over the sorted digests of the same width.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = str(path)
+        with open(path, "rb") as handle:
+            self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.bloom_bits, self.bloom_hashes, *counts = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a compiled hash index")
+        self._bloom_offset = _HEADER.size
+        offset = self._bloom_offset + self.bloom_bits // 8
+        self._tables: dict[int, FixedWidthRecords] = {}
+        for width, count in zip(DIGEST_WIDTHS, counts):
+            self._tables[width] = FixedWidthRecords(self._buffer, offset, width, count)
+            offset += width * count
+        self.bloom_rejections = 0
+        self.lookups = 0
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
+
+    def __contains__(self, hex_digest: str) -> bool:
+        return self.contains(hex_digest)
+
+    def contains(self, hex_digest: str) -> bool:
+        """Return True when the digest is in the corpus; non-hash strings are never present."""
+        digest = digest_from_hex(hex_digest)
+        if digest is None:
+            return False
+        self.lookups += 1
+        buffer = self._buffer
+        for position in _bloom_positions(digest, self.bloom_bits, self.bloom_hashes):
+            if not buffer[self._bloom_offset + (position >> 3)] & (1 << (position & 7)):
+                self.bloom_rejections += 1
+                return False
+        table = self._tables[len(digest)]
+        index = bisect.bisect_left(table, digest)
+        return index < len(table) and table[index] == digest
+
+    def stats(self) -> dict[str, object]:
+        """Return corpus size and how many lookups the Bloom filter answered alone."""
+        return {
+            "path": self.path,
+            "digests": len(self),
+            "lookups": self.lookups,
+            "bloom_rejections": self.bloom_rejections,
+        }
+
+    def close(self) -> None:
+        self._buffer.close()
+
+
+def build_local_hash_index(
+    hex_digests: Iterable[str],
+    output_path: str | os.PathLike[str],
+    false_positive_rate: float = 0.001,
+) -> HashIndexStats:
+    """
+    Compile hex digests into an index file; invalid values are skipped and duplicates removed.
+
+    The file is written next to `output_path` and renamed over it, so running services
+    that reopen the path never see a half-written index.
+    """
+    tables: dict[int, set[bytes]] = {width: set() for width in DIGEST_WIDTHS}
+    for value in hex_digests:
+        digest = digest_from_hex(value)
+        if digest is not None:
+            tables[len(digest)].add(digest)
+
+    total = sum(len(table) for table in tables.values())
+    bits, hashes = bloom_parameters(total, false_positive_rate)
+    bloom = bytearray(bits // 8)
+    for table in tables.values():
+        for digest in table:
+            for position in _bloom_positions(digest, bits, hashes):
+                bloom[position >> 3] |= 1 << (position & 7)
+
+    output = Path(output_path)
+    partial = output.with_name(output.name + ".partial")
+    with partial.open("wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, bits, hashes, *(len(tables[width]) for width in DIGEST_WIDTHS)))
+        handle.write(bloom)
+        for width in DIGEST_WIDTHS:
+            handle.write(b"".join(sorted(tables[width])))
+    os.replace(partial, output)
+    return HashIndexStats(str(output), total, bits, hashes, output.stat().st_size)
@@ -0,0 +1,128 @@
+"""
+Purpose:
+    Group indicator lookups from concurrent scans into bulk calls for adapters with batch APIs.
+Inputs:
+    Indicator lists from individual scans, their priority, and an async bulk dispatch function.
+Outputs:
+    Per-indicator adapter results (or the exception that failed them), routed back to each scan.
+Dependencies:
+    asyncio and scan priority ranks.
+TODO Checklist:
+    - [ ] Size the collection window from observed arrival rates instead of a fixed setting.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from app.utils.constants import SCAN_PRIORITY_RANKS
+from app.utils.enums import ScanPriority
+
+BatchDispatch = Callable[[list[str], ScanPriority], Awaitable[dict[str, dict[str, object]]]]
+
+
+class MicroBatcher:
+    """
+    Collect indicators for one adapter for `window_seconds`, then look them up in one call.
+
+    The same indicator requested by several scans inside one window is sent once. A batch is
+    flushed early when it reaches `max_batch_size`, and it runs at the most urgent priority
+    of the scans waiting on it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dispatch: BatchDispatch,
+        window_seconds: float = 0.005,
+        max_batch_size: int = 100,
+    ) -> None:
+        self.name = name
+        self.dispatch = dispatch
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._pending: dict[str, asyncio.Future[dict[str, object]]] = {}
+        self._priority: ScanPriority | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self.batches = 0
+        self.indicators = 0
+
+    async def lookup(
+        self,
+        indicators: list[str],
+        priority: ScanPriority = ScanPriority.INTERACTIVE,
+    ) -> list[dict[str, object] | BaseException]:
+        """
+        Return one result per indicator, in order, with failures as exception objects.
+
+        Cancelling the caller (for example on timeout) does not cancel the shared batch.
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for indicator in indicators:
+            future = self._pending.get(indicator)
+            if future is None:
+                future = loop.create_future()
+                future.add_done_callback(_retrieve_exception)
+                self._pending[indicator] = future
+            futures.append(future)
+        if self._priority is None or SCAN_PRIORITY_RANKS[priority.value] < SCAN_PRIORITY_RANKS[self._priority.value]:
+            self._priority = priority
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+        return await asyncio.gather(*(asyncio.shield(future) for future in futures), return_exceptions=True)
+
+    def stats(self) -> dict[str, object]:
+        """Return how many bulk calls were made and how many indicators they carried."""
+        return {
+            "name": self.name,
+            "batches": self.batches,
+            "indicators": self.indicators,
+            "pending": len(self._pending),
+        }
+
+    def _flush(self) -> None:
+        """Dispatch everything collected so far in chunks of at most `max_batch_size`."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = list(self._pending.items()), {}
+        priority, self._priority = self._priority or ScanPriority.INTERACTIVE, None
+        for start in range(0, len(pending), self.max_batch_size):
+            task = asyncio.get_running_loop().create_task(
+                self._dispatch(dict(pending[start : start + self.max_batch_size]), priority)
+            )
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, batch: dict[str, asyncio.Future[dict[str, object]]], priority: ScanPriority) -> None:
+        self.batches += 1
+        self.indicators += len(batch)
+        try:
+            results = await self.dispatch(list(batch), priority)
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for indicator, future in batch.items():
+            if future.done():
+                continue
+            result = results.get(indicator)
+            if result is None:
+                future.set_exception(LookupError(f"{self.name} returned no result for {indicator}"))
+            else:
+                future.set_result(result)
+
+
+def _retrieve_exception(future: asyncio.Future[dict[str, object]]) -> None:
+    """Mark batch failures as seen so scans that already timed out do not log warnings."""
+    if not future.cancelled():
+        future.exception()
@@ -2,18 +2,20 @@
 Purpose:
     Normalize incoming artifacts before caching, IOC extraction, and enrichment.
 Inputs:
-    Raw artifact type and user-provided value.
+    Raw artifact type and user-provided value, or a typed indicator from a threat feed.
 Outputs:
     Normalized string representation safe for dedupe and downstream services.
 Dependencies:
-    URL/email helper utilities.
+    URL/email helper utilities and standard library `ipaddress`.
 TODO Checklist:
     - [ ] Add stronger per-type validation and canonicalization rules.
     - [ ] Add MIME/attachment handling when raw email or file uploads are implemented.
 """
 
+import ipaddress
+
 from app.utils.email_tools import normalize_email_signal
-from app.utils.enums import ArtifactType
+from app.utils.enums import ArtifactType, IndicatorType
 from app.utils.url_tools import normalize_url
 
 
@@ -27,3 +29,15 @@ class NormalizationService:
         if artifact_type == ArtifactType.EMAIL_SIGNAL:
             return normalize_email_signal(raw_value)
         return raw_value.strip().lower()
+
+    def normalize_indicator(self, indicator_type: IndicatorType, raw_value: str) -> str:
+        """Return the canonical form IOC extraction produces, so feed entries and scan indicators compare equal."""
+        value = raw_value.strip()
+        if indicator_type == IndicatorType.URL:
+            return normalize_url(value)
+        if indicator_type == IndicatorType.IP_ADDRESS:
+            try:
+                return str(ipaddress.ip_address(value))
+            except ValueError:
+                return value
+        return value.lower().rstrip(".")
@@ -0,0 +1,181 @@
+"""
+Purpose:
+    Per-source token buckets that keep enrichment calls inside upstream quotas.
+Inputs:
+    Requests-per-minute/day limits per adapter and the priority of the scan asking for a call.
+Outputs:
+    Granted call slots (interactive scans first) plus wait-time metrics for monitoring.
+Dependencies:
+    asyncio, heapq, and scan priority enums.
+TODO Checklist:
+    - [ ] Share buckets through Redis or the database if several worker hosts hit the same quota.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.utils.constants import SCAN_PRIORITY_RANKS
+from app.utils.enums import ScanPriority
+
+
+class TokenBucket:
+    """Bucket holding up to `capacity` calls, refilled evenly over `period_seconds`."""
+
+    def __init__(self, capacity: int, period_seconds: float, now: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = capacity / period_seconds
+        self.tokens = float(capacity)
+        self.updated_at = now
+
+    def wait_seconds(self, now: float) -> float:
+        """Return how long until one token is available (0 when it already is)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.refill_per_second
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+@dataclass
+class _PriorityMetrics:
+    granted: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+@dataclass(order=True)
+class _Waiter:
+    rank: int
+    sequence: int
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class SourceRateLimiter:
+    """
+    Quota gate for one adapter.
+
+    Callers take a token immediately when nobody is queued; otherwise they join a priority
+    heap that a single dispatcher task drains as the buckets refill.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int | None,
+        requests_per_day: int | None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.requests_per_day = requests_per_day
+        self.clock = clock
+        now = clock()
+        self._buckets = [
+            TokenBucket(limit, period, now)
+            for limit, period in ((requests_per_minute, 60.0), (requests_per_day, 86_400.0))
+            if limit
+        ]
+        self._waiters: list[_Waiter] = []
+        self._sequence = itertools.count()
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._metrics = {priority: _PriorityMetrics() for priority in ScanPriority}
+
+    async def acquire(self, priority: ScanPriority = ScanPriority.INTERACTIVE) -> float:
+        """Wait for a call slot and return the seconds spent queued."""
+        started = self.clock()
+        if not self._live_waiters() and self._wait_seconds(started) == 0:
+            self._take()
+            self._record(priority, 0.0)
+            return 0.0
+
+        loop = asyncio.get_running_loop()
+        if self._dispatcher is not None and self._dispatcher.get_loop() is not loop:
+            self._waiters.clear()
+            self._dispatcher = None
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self._waiters, _Waiter(SCAN_PRIORITY_RANKS[priority.value], next(self._sequence), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch(), name=f"rate-limit-{self.name}")
+        await future
+        waited = self.clock() - started
+        self._record(priority, waited)
+        return waited
+
+    def stats(self) -> dict[str, object]:
+        """Return limits, queue depth, and wait-time counters per priority."""
+        return {
+            "name": self.name,
+            "requests_per_minute": self.requests_per_minute,
+            "requests_per_day": self.requests_per_day,
+            "waiting": self._live_waiters(),
+            "priorities": {
+                priority.value: {
+                    "granted": metrics.granted,
+                    "wait_seconds_total": round(metrics.wait_seconds_total, 3),
+                    "wait_seconds_max": round(metrics.wait_seconds_max, 3),
+                }
+                for priority, metrics in self._metrics.items()
+            },
+        }
+
+    async def _dispatch(self) -> None:
+        """Hand out tokens to the best-ranked live waiter until the heap is empty."""
+        while self._waiters:
+            if self._waiters[0].future.done():
+                heapq.heappop(self._waiters)
+                continue
+            wait = self._wait_seconds(self.clock())
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            waiter = heapq.heappop(self._waiters)
+            self._take()
+            waiter.future.set_result(None)
+
+    def _wait_seconds(self, now: float) -> float:
+        return max((bucket.wait_seconds(now) for bucket in self._buckets), default=0.0)
+
+    def _take(self) -> None:
+        for bucket in self._buckets:
+            bucket.take()
+
+    def _live_waiters(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.future.done())
+
+    def _record(self, priority: ScanPriority, waited: float) -> None:
+        metrics = self._metrics[priority]
+        metrics.granted += 1
+        metrics.wait_seconds_total += waited
+        metrics.wait_seconds_max = max(metrics.wait_seconds_max, waited)
+
+
+class EnrichmentRateLimiter:
+    """Registry of per-adapter limiters; adapters without configured limits are never delayed."""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[int | None, int | None]],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limiters = {
+            name: SourceRateLimiter(name, per_minute, per_day, clock=clock)
+            for name, (per_minute, per_day) in limits.items()
+        }
+
+    async def acquire(self, source_name: str, priority: ScanPriority = ScanPriority.INTERACTIVE) -> float:
+        """Wait for one call slot on `source_name` and return the seconds spent queued."""
+        limiter = self._limiters.get(source_name)
+        if limiter is None:
+            return 0.0
+        return await limiter.acquire(priority)
+
+    def stats(self) -> list[dict[str, object]]:
+        """Return stats for every rate-limited adapter."""
+        return [limiter.stats() for limiter in self._limiters.values()]
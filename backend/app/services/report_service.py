@@ -12,6 +12,7 @@ TODO Checklist:
     - [ ] Add section versioning only if analyst editing becomes part of scope.
 """
 
+from collections.abc import Callable
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -24,8 +25,9 @@ from app.utils.enums import PublicShareStatus, ThreatSeverity
 class ReportService:
     """Create and retain scaffold threat reports in memory."""
 
-    def __init__(self) -> None:
+    def __init__(self, report_loader: Callable[[str], ThreatReportResponse | None] | None = None) -> None:
         self._reports: dict[str, ThreatReportResponse] = {}
+        self.report_loader = report_loader
 
     async def build_report(
         self,
@@ -35,13 +37,7 @@ class ReportService:
         ai_summary: str | None,
     ) -> ThreatReportResponse:
         """Build a private threat report from source hits and optional AI output."""
-        max_score = max((hit.confidence_score for hit in source_hits), default=20)
-        severity = ThreatSeverity.MEDIUM
-        if max_score >= 80:
-            severity = ThreatSeverity.HIGH
-        elif max_score < 35:
-            severity = ThreatSeverity.LOW
-
+        severity, max_score = self._score(source_hits)
         report = ThreatReportResponse(
             report_id=str(uuid4()),
             scan_job_id=scan_job_id,
@@ -61,6 +57,39 @@ class ReportService:
         self._reports[report.report_id] = report
         return report
 
+    def refresh_sources(self, report_id: str, source_hits: list[SourceHit]) -> ThreatReportResponse | None:
+        """Re-score a report once late source hits have been backfilled."""
+        report = self._reports.get(report_id)
+        if report is None:
+            return None
+        severity, max_score = self._score(source_hits)
+        report = report.model_copy(
+            update={
+                "severity": severity,
+                "confidence": max_score,
+                "source_summary": [hit.summary for hit in source_hits],
+            }
+        )
+        self._reports[report_id] = report
+        return report
+
+    @staticmethod
+    def _score(source_hits: list[SourceHit]) -> tuple[ThreatSeverity, int]:
+        max_score = max((hit.confidence_score for hit in source_hits), default=20)
+        severity = ThreatSeverity.MEDIUM
+        if max_score >= 80:
+            severity = ThreatSeverity.HIGH
+        elif max_score < 35:
+            severity = ThreatSeverity.LOW
+        return severity, max_score
+
+    def discard_report(self, report_id: str) -> None:
+        """Drop a cached report once it has been persisted elsewhere."""
+        self._reports.pop(report_id, None)
+
     def get_report(self, report_id: str) -> ThreatReportResponse | None:
-        """Return a previously built report if it exists."""
-        return self._reports.get(report_id)
+        """Return a previously built report, falling back to reports stored by worker processes."""
+        report = self._reports.get(report_id)
+        if report is None and self.report_loader is not None:
+            report = self.report_loader(report_id)
+        return report
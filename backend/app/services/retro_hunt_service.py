@@ -0,0 +1,189 @@
+"""
+Purpose:
+    Retro-hunt: match newly imported threat intel against scans that already ran.
+Inputs:
+    The `import_id` of a feed import; its new or changed malicious/suspicious `local_indicators`.
+Outputs:
+    `retro_hunt_matches` rows, re-scored `threat_reports`, and a `RetroHuntResponse` summary.
+Dependencies:
+    SQLAlchemy session factory plus the local indicator, scan indicator, scan job, and report models.
+TODO Checklist:
+    - [ ] Notify workspace owners when one of their reports is raised by a retro-hunt.
+"""
+
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+
+from app.models.local_indicator import LocalIndicator
+from app.models.retro_hunt_match import RetroHuntMatch
+from app.models.scan_indicator import ScanIndicator
+from app.models.scan_job import ScanJob
+from app.models.threat_report import ThreatReport
+from app.schemas.feed_import import RetroHuntResponse
+from app.utils.enums import ThreatSeverity
+
+HUNTED_VERDICTS = ("malicious", "suspicious")
+_SEVERITY_RANKS = {severity.value: rank for rank, severity in enumerate(ThreatSeverity)}
+
+
+def _hit_severity(verdict: str, confidence: int) -> ThreatSeverity:
+    """Same thresholds as live scoring: a confident malicious listing is high, anything else medium."""
+    if verdict == "malicious" and confidence >= 80:
+        return ThreatSeverity.HIGH
+    return ThreatSeverity.MEDIUM
+
+
+class RetroHuntService:
+    """
+    Incremental re-matching of historical scans against one feed import.
+
+    Only the import's delta is read: rows of `local_indicators` that the import inserted or
+    changed, in primary-key pages of `batch_size`. Each page is one `IN` lookup on the
+    value-first primary key of `scan_indicators`, so the cost follows the number of new
+    indicators and their matches, never the size of the scan history. Matches are recorded
+    once per scan, indicator, and source, so re-running a hunt does not re-flag anything.
+
+    `scans_indexed` is False when scans never reach `scan_indicators` (the in-memory job
+    backend); callers then skip the hunt instead of reporting one that cannot match.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 1000,
+        scans_indexed: bool = True,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.scans_indexed = scans_indexed
+
+    def hunt(self, import_id: str) -> RetroHuntResponse:
+        """
+        Match one import's delta against the scan history.
+
+        Scans still running when the hunt reaches them are recorded without a report; their
+        live enrichment decides their verdict.
+        """
+        started = time.perf_counter()
+        checked = matched_scans = 0
+        flagged_reports: set[str] = set()
+        with self.session_factory() as db:
+            for table in (ScanIndicator.__table__, RetroHuntMatch.__table__):
+                table.create(bind=db.get_bind(), checkfirst=True)
+            last_id = ""
+            while True:
+                page = db.execute(
+                    select(
+                        LocalIndicator.id,
+                        LocalIndicator.indicator_type,
+                        LocalIndicator.value,
+                        LocalIndicator.source,
+                        LocalIndicator.verdict,
+                        LocalIndicator.confidence,
+                    )
+                    .where(
+                        LocalIndicator.import_id == import_id,
+                        LocalIndicator.verdict.in_(HUNTED_VERDICTS),
+                        LocalIndicator.id > last_id,
+                    )
+                    .order_by(LocalIndicator.id)
+                    .limit(self.batch_size)
+                ).all()
+                if not page:
+                    break
+                last_id = page[-1].id
+                checked += len(page)
+                scans, reports = self._match_page(db, import_id, page)
+                matched_scans += scans
+                flagged_reports.update(reports)
+
+        elapsed = time.perf_counter() - started
+        return RetroHuntResponse(
+            import_id=import_id,
+            indicators_checked=checked,
+            matched_scans=matched_scans,
+            flagged_reports=len(flagged_reports),
+            elapsed_seconds=round(elapsed, 3),
+        )
+
+    def _match_page(self, db: Session, import_id: str, page: Sequence[Row]) -> tuple[int, set[str]]:
+        """Match one page of new intel, record the matches, and re-score their reports."""
+        intel: dict[tuple[str, str], list[Row]] = {}
+        for row in page:
+            intel.setdefault((row.indicator_type, row.value), []).append(row)
+        hits = db.execute(
+            select(ScanIndicator.scan_job_id, ScanIndicator.indicator_type, ScanIndicator.value).where(
+                ScanIndicator.value.in_({value for _, value in intel})
+            )
+        ).all()
+        hits = [hit for hit in hits if (hit.indicator_type, hit.value) in intel]
+        if not hits:
+            return 0, set()
+
+        scan_job_ids = {hit.scan_job_id for hit in hits}
+        report_ids = dict(
+            db.execute(select(ScanJob.id, ScanJob.report_id).where(ScanJob.id.in_(scan_job_ids))).all()
+        )
+        recorded = set(
+            db.execute(
+                select(
+                    RetroHuntMatch.scan_job_id,
+                    RetroHuntMatch.indicator_type,
+                    RetroHuntMatch.value,
+                    RetroHuntMatch.source,
+                ).where(RetroHuntMatch.scan_job_id.in_(scan_job_ids))
+            ).all()
+        )
+        now = datetime.now(timezone.utc)
+        matches: list[dict[str, object]] = []
+        for hit in hits:
+            for indicator in intel[(hit.indicator_type, hit.value)]:
+                if (hit.scan_job_id, hit.indicator_type, hit.value, indicator.source) in recorded:
+                    continue
+                matches.append(
+                    {
+                        "id": str(uuid4()),
+                        "scan_job_id": hit.scan_job_id,
+                        "report_id": report_ids.get(hit.scan_job_id),
+                        "indicator_type": hit.indicator_type,
+                        "value": hit.value,
+                        "source": indicator.source,
+                        "verdict": indicator.verdict,
+                        "confidence": indicator.confidence,
+                        "import_id": import_id,
+                        "matched_at": now,
+                    }
+                )
+        if not matches:
+            return 0, set()
+        db.execute(RetroHuntMatch.__table__.insert(), matches)
+
+        by_report: dict[str, list[dict[str, object]]] = {}
+        for match in matches:
+            if match["report_id"] is not None:
+                by_report.setdefault(match["report_id"], []).append(match)
+        for report in db.scalars(select(ThreatReport).where(ThreatReport.id.in_(by_report))):
+            self._rescore(report, by_report[report.id])
+        db.commit()
+        return len({match["scan_job_id"] for match in matches}), set(by_report)
+
+    @staticmethod
+    def _rescore(report: ThreatReport, matches: list[dict[str, object]]) -> None:
+        """Raise severity and confidence (never lower them) and note each new listing in the report."""
+        severity = report.severity
+        for match in matches:
+            candidate = _hit_severity(match["verdict"], match["confidence"]).value
+            if _SEVERITY_RANKS[candidate] > _SEVERITY_RANKS.get(severity, 0):
+                severity = candidate
+        report.severity = severity
+        report.confidence = max(report.confidence, *(match["confidence"] for match in matches))
+        notes = (
+            f"Retro-hunt: {match['value']} is now listed as {match['verdict']} by {match['source']}."
+            for match in matches
+        )
+        report.source_summary = list(dict.fromkeys([*report.source_summary, *notes]))
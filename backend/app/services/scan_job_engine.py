@@ -0,0 +1,218 @@
+"""
+Purpose:
+    Run scan jobs in the background so API requests return as soon as a job is queued.
+Inputs:
+    Scan job create payloads accepted by the scan job routes.
+Outputs:
+    Queued job records plus status transitions written by the orchestrator.
+Dependencies:
+    asyncio, scan orchestrator, database scan job queue, and scan schemas.
+TODO Checklist:
+    - [ ] Add retry metadata once failed jobs can be resubmitted.
+    - [ ] Expose queue depth on the dashboard if operators need it.
+"""
+
+import asyncio
+import itertools
+import logging
+
+from fastapi import HTTPException, status
+
+from app.db.session import create_tables
+from app.schemas.scan import ScanJobBatchResponse, ScanJobCreateRequest, ScanJobResponse
+from app.services.scan_job_queue import DatabaseScanJobQueue
+from app.services.scan_orchestrator import ScanOrchestrator
+from app.utils.constants import SCAN_PRIORITY_RANKS
+from app.utils.enums import ScanJobStatus
+
+logger = logging.getLogger(__name__)
+
+
+def _dedupe_batch(
+    orchestrator: ScanOrchestrator,
+    payloads: list[ScanJobCreateRequest],
+) -> tuple[list[tuple[ScanJobCreateRequest, str]], list[int]]:
+    """
+    Normalize every item once and collapse identical scans.
+
+    Returns the unique `(payload, normalized_value)` pairs and, for each input item,
+    the position of the unique pair it maps to.
+    """
+    unique: list[tuple[ScanJobCreateRequest, str]] = []
+    positions: dict[tuple[str, str, str], int] = {}
+    mapping: list[int] = []
+    for payload in payloads:
+        normalized_value = orchestrator.normalize_payload(payload)
+        key = (payload.artifact.artifact_type.value, normalized_value, payload.ai_mode.value)
+        if key not in positions:
+            positions[key] = len(unique)
+            unique.append((payload, normalized_value))
+        mapping.append(positions[key])
+    return unique, mapping
+
+
+class ScanJobEngine:
+    """Bounded in-process priority queue drained by a fixed pool of asyncio workers."""
+
+    def __init__(self, orchestrator: ScanOrchestrator, worker_count: int, queue_max_size: int) -> None:
+        self.orchestrator = orchestrator
+        self.worker_count = worker_count
+        self.queue_max_size = queue_max_size
+        self._queue: asyncio.PriorityQueue[tuple[int, int, str, ScanJobCreateRequest]] | None = None
+        self._sequence = itertools.count()
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        """Return True while workers are attached to the current event loop."""
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """Create the queue and worker tasks on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.PriorityQueue(maxsize=self.queue_max_size)
+        self._workers = [
+            asyncio.create_task(self._worker_loop(), name=f"scan-worker-{index}")
+            for index in range(self.worker_count)
+        ]
+        logger.info("Started %s scan workers (queue size %s)", self.worker_count, self.queue_max_size)
+
+    async def stop(self) -> None:
+        """Cancel workers and fail any job that was still waiting in the queue."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, scan_job_id, _ = self._queue.get_nowait()
+                self.orchestrator.fail_job(scan_job_id)
+        self._queue = None
+
+    async def submit(self, payload: ScanJobCreateRequest) -> ScanJobResponse:
+        """Register a job and queue it for the worker pool without waiting for the pipeline."""
+        self._require_queue()
+        job = self.orchestrator.create_job(payload)
+        if job.status is not ScanJobStatus.QUEUED or job.coalesced_with is not None:
+            return job
+        if self._queue.full():
+            self.orchestrator.discard_job(job.scan_job_id)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Scan queue is full; retry shortly.",
+                headers={"Retry-After": "5"},
+            )
+        self._queue.put_nowait(self._queue_item(job, payload))
+        return job
+
+    async def submit_batch(self, payloads: list[ScanJobCreateRequest]) -> ScanJobBatchResponse:
+        """
+        Queue the unique items of a batch, waiting for queue space instead of rejecting.
+
+        The worker pool still bounds how many pipelines run at once; a batch larger than the
+        free queue space simply holds the request open until workers catch up.
+        """
+        queue = self._require_queue()
+        unique, mapping = _dedupe_batch(self.orchestrator, payloads)
+        jobs: list[ScanJobResponse] = []
+        for payload, normalized_value in unique:
+            job = self.orchestrator.create_job(payload, normalized_value)
+            if job.status is ScanJobStatus.QUEUED and job.coalesced_with is None:
+                try:
+                    await queue.put(self._queue_item(job, payload))
+                except asyncio.CancelledError:
+                    self.orchestrator.discard_job(job.scan_job_id)
+                    raise
+            jobs.append(job)
+        return ScanJobBatchResponse(jobs=[jobs[index] for index in mapping], unique_count=len(unique))
+
+    async def get_job(self, scan_job_id: str) -> ScanJobResponse | None:
+        """Return the latest snapshot of one job."""
+        return self.orchestrator.get_job(scan_job_id)
+
+    async def list_jobs(self) -> list[ScanJobResponse]:
+        """Return the latest snapshot of every known job."""
+        return self.orchestrator.list_jobs()
+
+    def _queue_item(
+        self,
+        job: ScanJobResponse,
+        payload: ScanJobCreateRequest,
+    ) -> tuple[int, int, str, ScanJobCreateRequest]:
+        """Order interactive scans ahead of bulk ones, FIFO within a priority."""
+        return SCAN_PRIORITY_RANKS[payload.priority.value], next(self._sequence), job.scan_job_id, payload
+
+    def _require_queue(self) -> asyncio.PriorityQueue[tuple[int, int, str, ScanJobCreateRequest]]:
+        if self._queue is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Scan job engine is not running.",
+            )
+        return self._queue
+
+    async def _worker_loop(self) -> None:
+        """Pull queued jobs forever; the orchestrator records per-job failures itself."""
+        assert self._queue is not None
+        while True:
+            _, _, scan_job_id, payload = await self._queue.get()
+            try:
+                await self.orchestrator.execute_job(scan_job_id, payload)
+            finally:
+                self._queue.task_done()
+
+
+class DatabaseScanJobEngine:
+    """API-side engine that hands jobs to `python -m app.worker` processes through `scan_jobs`."""
+
+    running = True
+
+    def __init__(self, orchestrator: ScanOrchestrator, queue: DatabaseScanJobQueue) -> None:
+        self.orchestrator = orchestrator
+        self.queue = queue
+
+    async def start(self) -> None:
+        """Make sure the queue tables exist before the API accepts jobs."""
+        await asyncio.to_thread(create_tables)
+
+    async def stop(self) -> None:
+        """Workers own in-flight jobs, so there is nothing to drain in the API process."""
+
+    async def submit(self, payload: ScanJobCreateRequest) -> ScanJobResponse:
+        """Normalize in the API process, then persist the queued job for any worker to claim."""
+        job = self.orchestrator.create_job(payload)
+        if job.status is not ScanJobStatus.QUEUED:
+            return job
+        self.orchestrator.discard_job(job.scan_job_id)
+        return await asyncio.to_thread(
+            self.queue.enqueue,
+            job,
+            payload,
+            self.orchestrator.coalesce_key(job),
+        )
+
+    async def submit_batch(self, payloads: list[ScanJobCreateRequest]) -> ScanJobBatchResponse:
+        """Persist the unique items of a batch in a single transaction."""
+        unique, mapping = _dedupe_batch(self.orchestrator, payloads)
+        jobs: list[ScanJobResponse | None] = []
+        pending: list[tuple[ScanJobResponse, ScanJobCreateRequest, str]] = []
+        for payload, normalized_value in unique:
+            job = self.orchestrator.create_job(payload, normalized_value)
+            if job.status is not ScanJobStatus.QUEUED:
+                jobs.append(job)
+                continue
+            self.orchestrator.discard_job(job.scan_job_id)
+            pending.append((job, payload, self.orchestrator.coalesce_key(job)))
+            jobs.append(None)
+
+        stored = iter(await asyncio.to_thread(self.queue.enqueue_many, pending))
+        resolved = [job if job is not None else next(stored) for job in jobs]
+        return ScanJobBatchResponse(jobs=[resolved[index] for index in mapping], unique_count=len(unique))
+
+    async def get_job(self, scan_job_id: str) -> ScanJobResponse | None:
+        """Return the latest snapshot written by whichever worker owns the job."""
+        return await asyncio.to_thread(self.queue.get_job, scan_job_id)
+
+    async def list_jobs(self) -> list[ScanJobResponse]:
+        """Return recent job snapshots from the shared table."""
+        return await asyncio.to_thread(self.queue.list_jobs)
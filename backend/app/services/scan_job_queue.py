@@ -0,0 +1,415 @@
+"""
+Purpose:
+    Durable scan job queue stored in the `scan_jobs` table and shared by API and worker processes.
+Inputs:
+    Queued job snapshots from the API and status updates from `app.worker` processes.
+Outputs:
+    Claimed jobs for workers, job/report snapshots readable from any process, and the
+    `scan_indicators` inverted index used by retro-hunts.
+Dependencies:
+    SQLAlchemy session factory, scan/report ORM models, and scan/report schemas.
+TODO Checklist:
+    - [ ] Add a reaper job that archives completed rows once job history retention is agreed.
+    - [ ] Move job payload snapshots to dedicated columns if reporting queries need them.
+"""
+
+import hashlib
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.artifact_submission import ArtifactSubmission
+from app.models.scan_indicator import ScanIndicator
+from app.models.scan_job import ScanJob
+from app.models.threat_report import ThreatReport
+from app.schemas.report import ThreatReportResponse
+from app.schemas.scan import FileScanJobRequest, ScanJobCreateRequest, ScanJobResponse
+from app.services.ioc_extraction_service import IocExtractionService
+from app.utils.constants import SCAN_PRIORITY_RANKS
+from app.utils.enums import ArtifactType, IndicatorType, ScanJobStatus
+from app.utils.indicator_tools import classify_indicator
+from app.utils.url_tools import url_host
+
+logger = logging.getLogger(__name__)
+
+RUNNABLE_STATUSES = (
+    ScanJobStatus.QUEUED.value,
+    ScanJobStatus.NORMALIZING.value,
+    ScanJobStatus.ENRICHING.value,
+    ScanJobStatus.REPORTING.value,
+)
+FINAL_STATUSES = {ScanJobStatus.COMPLETED, ScanJobStatus.FAILED}
+CLAIM_ATTEMPTS = 3
+# Longer values (odd URLs) are not indexed; they would not fit a btree index entry anyway.
+MAX_INDEXED_INDICATOR_CHARS = 2048
+
+
+@dataclass(frozen=True)
+class ClaimedScanJob:
+    """A job leased to one worker until `lease_expires_at`; every saved snapshot extends the lease."""
+
+    job: ScanJobResponse
+    payload: ScanJobCreateRequest
+    lease_expires_at: datetime
+
+
+class DatabaseScanJobQueue:
+    """
+    Row-claiming queue on `scan_jobs`; expired leases are picked up by other workers.
+
+    With an `ioc_extraction_service`, every enqueued job also writes its indicators to
+    `scan_indicators`, so later intel can be matched against past scans (see `RetroHuntService`).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        lease_seconds: int,
+        max_attempts: int,
+        ioc_extraction_service: IocExtractionService | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.ioc_extraction_service = ioc_extraction_service
+
+    def enqueue(
+        self,
+        job: ScanJobResponse,
+        payload: ScanJobCreateRequest,
+        dedupe_key: str | None = None,
+    ) -> ScanJobResponse:
+        """
+        Persist the artifact submission and its queued job in one transaction.
+
+        When a job with the same `dedupe_key` is still queued or running, the new row is
+        stored as its follower: workers never claim it, and it reports the leader's progress.
+        """
+        return self.enqueue_many([(job, payload, dedupe_key)])[0]
+
+    def enqueue_many(
+        self,
+        items: list[tuple[ScanJobResponse, ScanJobCreateRequest, str | None]],
+    ) -> list[ScanJobResponse]:
+        """Persist several queued jobs (see `enqueue`) in a single transaction."""
+        stored: list[ScanJobResponse] = []
+        indicator_rows: list[dict[str, object]] = []
+        with self.session_factory() as db:
+            for job, payload, dedupe_key in items:
+                digest = hashlib.sha256(dedupe_key.encode("utf-8")).hexdigest() if dedupe_key else None
+                if digest is not None:
+                    leader = db.scalars(
+                        select(ScanJob)
+                        .where(
+                            ScanJob.dedupe_key == digest,
+                            ScanJob.leader_job_id.is_(None),
+                            ScanJob.status.in_(RUNNABLE_STATUSES),
+                        )
+                        .order_by(ScanJob.created_at)
+                        .limit(1)
+                    ).first()
+                    if leader is not None:
+                        job = self._follow(job, leader)
+                db.add(
+                    ArtifactSubmission(
+                        id=job.artifact.submission_id,
+                        workspace_id=job.artifact.workspace_id,
+                        artifact_type=job.artifact.artifact_type.value,
+                        raw_value=payload.artifact.artifact_value,
+                        normalized_value=job.artifact.normalized_value,
+                        file_name=payload.artifact.file_name,
+                        sha256=_file_sha256(job),
+                        status=job.status.value,
+                        created_at=job.artifact.created_at,
+                    )
+                )
+                db.flush()
+                db.add(
+                    ScanJob(
+                        id=job.scan_job_id,
+                        artifact_submission_id=job.artifact.submission_id,
+                        workspace_id=job.artifact.workspace_id,
+                        status=job.status.value,
+                        ai_mode=job.ai_mode.value,
+                        priority=SCAN_PRIORITY_RANKS[payload.priority.value],
+                        created_at=job.created_at,
+                        request_payload=payload.model_dump(mode="json"),
+                        result_payload=job.model_dump(mode="json"),
+                        dedupe_key=digest,
+                        leader_job_id=job.coalesced_with,
+                    )
+                )
+                indicator_rows.extend(self._indicator_rows(job, payload))
+                stored.append(job)
+            if indicator_rows:
+                db.flush()
+                db.execute(ScanIndicator.__table__.insert(), indicator_rows)
+            db.commit()
+        return stored
+
+    def claim(self, worker_id: str) -> ClaimedScanJob | None:
+        """
+        Lease the best-priority, oldest runnable job to `worker_id`.
+
+        Postgres skips rows other workers have locked (`FOR UPDATE SKIP LOCKED`). Every
+        dialect then claims with a conditional UPDATE on the lease columns, so SQLite
+        workers racing for the same row cannot both win.
+        """
+        with self.session_factory() as db:
+            for _ in range(CLAIM_ATTEMPTS):
+                now = datetime.now(timezone.utc)
+                claimable = and_(
+                    ScanJob.status.in_(RUNNABLE_STATUSES),
+                    ScanJob.leader_job_id.is_(None),
+                    ScanJob.attempts < self.max_attempts,
+                    or_(ScanJob.lease_owner.is_(None), ScanJob.lease_expires_at < now),
+                )
+                query = (
+                    select(ScanJob.id)
+                    .where(claimable)
+                    .order_by(ScanJob.priority, ScanJob.created_at)
+                    .limit(1)
+                )
+                if db.get_bind().dialect.name == "postgresql":
+                    query = query.with_for_update(skip_locked=True)
+                scan_job_id = db.scalar(query)
+                if scan_job_id is None:
+                    db.rollback()
+                    return None
+
+                lease_expires_at = now + timedelta(seconds=self.lease_seconds)
+                result = db.execute(
+                    update(ScanJob)
+                    .where(ScanJob.id == scan_job_id, claimable)
+                    .values(
+                        lease_owner=worker_id,
+                        lease_expires_at=lease_expires_at,
+                        attempts=ScanJob.attempts + 1,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount != 1:
+                    db.rollback()
+                    continue
+
+                row = db.get(ScanJob, scan_job_id)
+                claimed = ClaimedScanJob(
+                    job=ScanJobResponse.model_validate(row.result_payload),
+                    payload=_request_payload(row.request_payload),
+                    lease_expires_at=lease_expires_at,
+                )
+                db.commit()
+                return claimed
+        return None
+
+    def fail_exhausted(self) -> int:
+        """Fail jobs (and their followers) whose lease expired after their last allowed attempt."""
+        now = datetime.now(timezone.utc)
+        with self.session_factory() as db:
+            exhausted = db.scalars(
+                select(ScanJob.id).where(
+                    ScanJob.status.in_(RUNNABLE_STATUSES),
+                    ScanJob.attempts >= self.max_attempts,
+                    ScanJob.lease_expires_at < now,
+                )
+            ).all()
+            if not exhausted:
+                db.rollback()
+                return 0
+            db.execute(
+                update(ScanJob)
+                .where(
+                    or_(ScanJob.id.in_(exhausted), ScanJob.leader_job_id.in_(exhausted)),
+                    ScanJob.status.in_(RUNNABLE_STATUSES),
+                )
+                .values(status=ScanJobStatus.FAILED.value, completed_at=now, lease_owner=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            return len(exhausted)
+
+    def save_snapshot(
+        self,
+        job: ScanJobResponse,
+        worker_id: str,
+        report: ThreatReportResponse | None = None,
+    ) -> bool:
+        """
+        Write a job snapshot (and its report) if `worker_id` still holds the lease.
+
+        Each intermediate snapshot also extends the lease, which doubles as a heartbeat. A final
+        snapshot releases the lease unless late source hits are still being backfilled.
+        Followers coalesced onto the job get the same status, report, and completion time.
+        Returns False when another worker has taken the job over.
+        """
+        values: dict[str, object] = {
+            "status": job.status.value,
+            "result_payload": job.model_dump(mode="json"),
+            "report_id": job.report_id,
+            "completed_at": job.completed_at,
+        }
+        if job.status in FINAL_STATUSES and not job.backfill_pending:
+            values.update(lease_owner=None, lease_expires_at=None)
+        else:
+            values["lease_expires_at"] = datetime.now(timezone.utc) + timedelta(seconds=self.lease_seconds)
+
+        with self.session_factory() as db:
+            if report is not None:
+                db.merge(
+                    ThreatReport(
+                        id=report.report_id,
+                        scan_job_id=report.scan_job_id,
+                        severity=report.severity.value,
+                        confidence=report.confidence,
+                        executive_summary=report.executive_summary,
+                        recommended_actions=report.recommended_actions,
+                        source_summary=report.source_summary,
+                        ai_summary=report.ai_summary,
+                        publish_status=report.publish_status.value,
+                        created_at=report.created_at,
+                    )
+                )
+            result = db.execute(
+                update(ScanJob)
+                .where(ScanJob.id == job.scan_job_id, ScanJob.lease_owner == worker_id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
+                db.rollback()
+                logger.warning("Worker %s lost the lease on scan job %s", worker_id, job.scan_job_id)
+                return False
+            db.execute(
+                update(ScanJob)
+                .where(ScanJob.leader_job_id == job.scan_job_id)
+                .values(status=job.status.value, report_id=job.report_id, completed_at=job.completed_at)
+                .execution_options(synchronize_session=False)
+            )
+            followers = select(ScanJob.artifact_submission_id).where(ScanJob.leader_job_id == job.scan_job_id)
+            db.execute(
+                update(ArtifactSubmission)
+                .where(
+                    or_(
+                        ArtifactSubmission.id == job.artifact.submission_id,
+                        ArtifactSubmission.id.in_(followers),
+                    )
+                )
+                .values(status=job.status.value)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            return True
+
+    def get_job(self, scan_job_id: str) -> ScanJobResponse | None:
+        """Return the latest snapshot written for one job."""
+        with self.session_factory() as db:
+            row = db.get(ScanJob, scan_job_id)
+            if row is None:
+                return None
+            return self._snapshot(db, row)
+
+    def list_jobs(self, limit: int = 200) -> list[ScanJobResponse]:
+        """Return the most recent job snapshots, oldest first."""
+        with self.session_factory() as db:
+            rows = db.scalars(select(ScanJob).order_by(ScanJob.created_at.desc()).limit(limit)).all()
+            return [self._snapshot(db, row) for row in reversed(rows)]
+
+    def get_report(self, report_id: str) -> ThreatReportResponse | None:
+        """Load a report written by any worker process."""
+        with self.session_factory() as db:
+            row = db.get(ThreatReport, report_id)
+            if row is None:
+                return None
+            return ThreatReportResponse(
+                report_id=row.id,
+                scan_job_id=row.scan_job_id,
+                severity=row.severity,
+                confidence=row.confidence,
+                executive_summary=row.executive_summary,
+                recommended_actions=row.recommended_actions,
+                source_summary=row.source_summary,
+                ai_summary=row.ai_summary,
+                publish_status=row.publish_status,
+                created_at=row.created_at,
+            )
+
+    def _indicator_rows(self, job: ScanJobResponse, payload: ScanJobCreateRequest) -> list[dict[str, object]]:
+        """Index rows for the artifact, its extracted IOCs, its child indicators, and URL hosts."""
+        if self.ioc_extraction_service is None:
+            return []
+        artifact = job.artifact
+        values = [
+            *self.ioc_extraction_service.extract(artifact.artifact_type, artifact.normalized_value),
+            *(payload.child_indicators if isinstance(payload, FileScanJobRequest) else []),
+        ]
+        typed: dict[tuple[str, str], None] = {}
+        for value in values:
+            indicator_type = classify_indicator(value)
+            if indicator_type is IndicatorType.TEXT or len(value) > MAX_INDEXED_INDICATOR_CHARS:
+                continue
+            if indicator_type is IndicatorType.FILE_HASH:
+                value = value.lower()
+            typed[(indicator_type.value, value)] = None
+            host = url_host(value) if indicator_type is IndicatorType.URL else None
+            if host and (host_type := classify_indicator(host)) in (IndicatorType.DOMAIN, IndicatorType.IP_ADDRESS):
+                typed[(host_type.value, host)] = None
+        return [
+            {
+                "value": value,
+                "indicator_type": indicator_type,
+                "scan_job_id": job.scan_job_id,
+                "workspace_id": artifact.workspace_id,
+                "created_at": job.created_at,
+            }
+            for indicator_type, value in typed
+        ]
+
+    @staticmethod
+    def _follow(job: ScanJobResponse, leader: ScanJob) -> ScanJobResponse:
+        leader_job = ScanJobResponse.model_validate(leader.result_payload)
+        return job.model_copy(
+            update={
+                "status": leader_job.status,
+                "sources": leader_job.sources,
+                "coalesced_with": leader.id,
+            }
+        )
+
+    @staticmethod
+    def _snapshot(db: Session, row: ScanJob) -> ScanJobResponse:
+        """Build a job response, reading progress from the leader for coalesced rows."""
+        job = ScanJobResponse.model_validate(row.result_payload)
+        if row.leader_job_id is None:
+            return job
+        leader = db.get(ScanJob, row.leader_job_id)
+        if leader is None:
+            return job
+        leader_job = ScanJobResponse.model_validate(leader.result_payload)
+        return job.model_copy(
+            update={
+                "status": leader_job.status,
+                "sources": leader_job.sources,
+                "report_id": leader_job.report_id,
+                "completed_at": leader_job.completed_at,
+                "backfill_pending": leader_job.backfill_pending,
+            }
+        )
+
+
+def _request_payload(stored: dict[str, object]) -> ScanJobCreateRequest:
+    """Rebuild the submitted payload; only internal upload payloads were stored with child indicators."""
+    if "child_indicators" in stored:
+        return FileScanJobRequest.model_validate(stored)
+    return ScanJobCreateRequest.model_validate(stored)
+
+
+def _file_sha256(job: ScanJobResponse) -> str | None:
+    """File artifacts submitted by hash (such as streamed uploads) keep their SHA-256 on the submission."""
+    value = job.artifact.normalized_value
+    if job.artifact.artifact_type is not ArtifactType.FILE or len(value) != 64:
+        return None
+    return value if classify_indicator(value) is IndicatorType.FILE_HASH else None
@@ -5,31 +5,58 @@ Owner:
     Primary: 220042711 - OMAR ABDURASHEED
     Coordinate with: 220053973 - FARIS BIN SUMAYDI for pipeline entry assumptions
 Inputs:
-    Scan job creation requests from API routes.
+    Scan job creation requests from API routes and the scan job engine.
 Outputs:
     Scan job responses and stored report artifacts for later retrieval.
 Dependencies:
     Artifact, normalization, extraction, cache, enrichment, AI, and report services.
 TODO Checklist:
-    - [ ] Move long-running execution to a real background worker.
     - [ ] Persist job state to the database instead of process memory.
-    - [ ] Add retry/error handling per adapter when integrations are implemented.
+    - [ ] Add retry handling per adapter when integrations are implemented.
     - [ ] Keep this file orchestration-focused; do not bury route or UI logic here.
 """
 
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from app.schemas.scan import ScanJobCreateRequest, ScanJobResponse, SourceHit
+from app.schemas.scan import FileScanJobRequest, ScanJobCreateRequest, ScanJobResponse, SourceHit
 from app.services.artifact_service import ArtifactService
 from app.services.caching_service import CachingService
+from app.services.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from app.services.enrichment.routing import route_indicators
 from app.services.ioc_extraction_service import IocExtractionService
+from app.services.micro_batcher import MicroBatcher
 from app.services.normalization_service import NormalizationService
+from app.services.rate_limiter import EnrichmentRateLimiter
 from app.services.report_service import ReportService
+from app.utils.enums import ScanJobStatus, ScanPriority
+
+logger = logging.getLogger(__name__)
+
+# Job fields a coalesced follower copies from its leader.
+MIRRORED_FIELDS = ("status", "sources", "report_id", "completed_at", "backfill_pending")
+
+# Higher ranks win when one source answers for several indicators; unlisted verdicts rank lowest.
+_VERDICT_RANKS = {"clean": 1, "suspicious": 2, "malicious": 3}
+
+
+@dataclass
+class _EnrichmentOutcome:
+    """Source hits in adapter order plus adapters still running after an early exit."""
+
+    source_hits: list[SourceHit]
+    adapters: list[object] = field(default_factory=list)
+    stragglers: dict[int, asyncio.Task[SourceHit]] = field(default_factory=dict)
+    deadline: float = 0.0
 
 
 class ScanOrchestrator:
-    """Scaffold orchestrator for async-style scan jobs."""
+    """Scaffold orchestrator for async scan jobs driven by `ScanJobEngine` workers."""
 
     def __init__(
         self,
@@ -40,6 +67,15 @@ class ScanOrchestrator:
         enrichment_adapters: list[object],
         ai_services: dict[str, object],
         report_service: ReportService,
+        adapter_timeout_seconds: float = 20.0,
+        enrichment_deadline_seconds: float = 30.0,
+        adapter_timeouts: dict[str, float] | None = None,
+        rate_limiter: EnrichmentRateLimiter | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        early_exit_min_sources: int = 0,
+        early_exit_min_confidence: int = 85,
+        batch_window_seconds: float = 0.005,
+        batch_max_size: int = 100,
     ) -> None:
         self.artifact_service = artifact_service
         self.normalization_service = normalization_service
@@ -48,57 +84,509 @@ class ScanOrchestrator:
         self.enrichment_adapters = enrichment_adapters
         self.ai_services = ai_services
         self.report_service = report_service
+        self.adapter_timeout_seconds = adapter_timeout_seconds
+        self.enrichment_deadline_seconds = enrichment_deadline_seconds
+        self.adapter_timeouts = adapter_timeouts or {}
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        self.early_exit_min_sources = early_exit_min_sources
+        self.early_exit_min_confidence = early_exit_min_confidence
+        self.batch_window_seconds = batch_window_seconds
+        self.batch_max_size = batch_max_size
+        self.job_observers: list[Callable[[ScanJobResponse], None]] = []
         self._jobs: dict[str, ScanJobResponse] = {}
+        self._leaders: dict[str, str] = {}
+        self._followers: dict[str, list[str]] = {}
+        self._backfills: dict[str, asyncio.Task[None]] = {}
+        self._batchers: dict[str, MicroBatcher] = {}
 
-    async def start_scan(self, payload: ScanJobCreateRequest) -> ScanJobResponse:
-        """Execute the scaffold pipeline synchronously while exposing async job semantics."""
-        normalized_value = self.normalization_service.normalize(
+    def normalize_payload(self, payload: ScanJobCreateRequest) -> str:
+        """Return the normalized artifact value used for caching and dedupe."""
+        return self.normalization_service.normalize(
             payload.artifact.artifact_type,
             payload.artifact.artifact_value,
         )
-        cache_key = f"{payload.artifact.artifact_type.value}:{normalized_value}:{payload.ai_mode.value}"
+
+    def create_job(self, payload: ScanJobCreateRequest, normalized_value: str | None = None) -> ScanJobResponse:
+        """
+        Normalize the artifact and register a queued job, or return a cached result.
+
+        If an identical scan is already queued or running, the new job is coalesced onto it:
+        it gets its own record (with `coalesced_with` set) but is never executed, and it
+        mirrors the leader's status, sources, and report as the leader progresses.
+        """
+        if normalized_value is None:
+            normalized_value = self.normalize_payload(payload)
+        cache_key = self._cache_key(payload, normalized_value)
         cached = self.caching_service.get_scan(cache_key)
         if cached is not None:
             return cached
 
         artifact = self.artifact_service.prepare_submission(payload.artifact, normalized_value)
-        indicators = self.ioc_extraction_service.extract(payload.artifact.artifact_type, normalized_value)
-
-        source_hits: list[SourceHit] = []
-        for adapter in self.enrichment_adapters:
-            result = await adapter.enrich(indicators=indicators, artifact_value=normalized_value)
-            source_hits.append(SourceHit(**result))
-
-        ai_summary = None
-        if payload.ai_mode.value in self.ai_services:
-            ai_summary = await self.ai_services[payload.ai_mode.value].analyze(
-                artifact_value=normalized_value,
-                indicators=indicators,
-                source_hits=source_hits,
-            )
-
-        scan_job_id = str(uuid4())
-        report = await self.report_service.build_report(
-            scan_job_id=scan_job_id,
+        job = ScanJobResponse(
+            scan_job_id=str(uuid4()),
+            status=ScanJobStatus.QUEUED,
             artifact=artifact,
-            source_hits=source_hits,
-            ai_summary=ai_summary,
+            ai_mode=payload.ai_mode,
+            sources=[],
+            created_at=datetime.now(timezone.utc),
         )
+        leader_id = self._leaders.get(cache_key)
+        if leader_id is not None:
+            leader = self._jobs[leader_id]
+            job = job.model_copy(
+                update={**{name: getattr(leader, name) for name in MIRRORED_FIELDS}, "coalesced_with": leader_id}
+            )
+            self._followers[leader_id].append(job.scan_job_id)
+        else:
+            self._leaders[cache_key] = job.scan_job_id
+            self._followers[job.scan_job_id] = []
+        self._jobs[job.scan_job_id] = job
+        return job
 
-        response = ScanJobResponse(
-            scan_job_id=scan_job_id,
-            status="completed",
-            artifact=artifact,
-            ai_mode=payload.ai_mode,
-            sources=source_hits,
+    async def execute_job(self, scan_job_id: str, payload: ScanJobCreateRequest) -> ScanJobResponse:
+        """
+        Run the pipeline for a queued job, publishing each stage on the job record.
+
+        After an early exit the job completes with `backfill_pending` set, and a background
+        task later replaces the placeholder hits with the late results.
+        """
+        job = self._jobs[scan_job_id]
+        artifact = job.artifact
+        normalized_value = artifact.normalized_value
+        outcome = _EnrichmentOutcome(source_hits=[])
+        try:
+            self._update_job(scan_job_id, status=ScanJobStatus.NORMALIZING)
+            indicators = self.ioc_extraction_service.extract(artifact.artifact_type, normalized_value)
+            if isinstance(payload, FileScanJobRequest) and payload.child_indicators:
+                indicators = list(dict.fromkeys([*indicators, *payload.child_indicators]))
+
+            self._update_job(scan_job_id, status=ScanJobStatus.ENRICHING)
+            outcome = await self._run_enrichment(indicators, normalized_value, payload.priority)
+            source_hits = outcome.source_hits
+
+            self._update_job(scan_job_id, status=ScanJobStatus.REPORTING, sources=source_hits)
+            ai_summary = None
+            if payload.ai_mode.value in self.ai_services:
+                ai_summary = await self.ai_services[payload.ai_mode.value].analyze(
+                    artifact_value=normalized_value,
+                    indicators=indicators,
+                    source_hits=source_hits,
+                )
+            report = await self.report_service.build_report(
+                scan_job_id=scan_job_id,
+                artifact=artifact,
+                source_hits=source_hits,
+                ai_summary=ai_summary,
+            )
+        except asyncio.CancelledError:
+            self._cancel_stragglers(outcome)
+            self._update_job(scan_job_id, status=ScanJobStatus.FAILED, completed_at=datetime.now(timezone.utc))
+            raise
+        except Exception:
+            logger.exception("Scan job %s failed", scan_job_id)
+            self._cancel_stragglers(outcome)
+            return self._update_job(
+                scan_job_id,
+                status=ScanJobStatus.FAILED,
+                completed_at=datetime.now(timezone.utc),
+            )
+
+        response = self._update_job(
+            scan_job_id,
+            status=ScanJobStatus.COMPLETED,
             report_id=report.report_id,
-            created_at=datetime.now(timezone.utc),
             completed_at=datetime.now(timezone.utc),
+            backfill_pending=bool(outcome.stragglers),
         )
-        self._jobs[scan_job_id] = response
-        self.caching_service.set_scan(cache_key, response)
+        self.caching_service.set_scan(self._cache_key(payload, normalized_value), response)
+        if outcome.stragglers:
+            task = asyncio.create_task(self._backfill(scan_job_id, payload, outcome))
+            self._backfills[scan_job_id] = task
+            task.add_done_callback(lambda _: self._backfills.pop(scan_job_id, None))
         return response
 
+    async def wait_for_backfill(self, scan_job_id: str) -> None:
+        """Wait until late source hits of an early-exit job have been written back."""
+        task = self._backfills.get(scan_job_id)
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+
+    @staticmethod
+    def coalesce_key(job: ScanJobResponse) -> str:
+        """Key shared by jobs that would produce the same result; matches the scan cache key."""
+        return f"{job.artifact.artifact_type.value}:{job.artifact.normalized_value}:{job.ai_mode.value}"
+
+    async def start_scan(self, payload: ScanJobCreateRequest) -> ScanJobResponse:
+        """Create and execute a job inline; used where the caller needs the final result."""
+        job = self.create_job(payload)
+        if job.status is not ScanJobStatus.QUEUED:
+            return job
+        return await self.execute_job(job.scan_job_id, payload)
+
+    def fail_job(self, scan_job_id: str) -> None:
+        """Mark a job that will never run (for example after worker shutdown) as failed."""
+        if scan_job_id in self._jobs:
+            self._update_job(scan_job_id, status=ScanJobStatus.FAILED, completed_at=datetime.now(timezone.utc))
+
+    def register_job(self, job: ScanJobResponse) -> None:
+        """Adopt a job created elsewhere, such as one claimed from the database queue."""
+        self._jobs[job.scan_job_id] = job
+
+    def discard_job(self, scan_job_id: str) -> None:
+        """Forget a job that was registered but could not be queued."""
+        job = self._jobs.pop(scan_job_id, None)
+        if job is not None:
+            self._release_leader(job)
+
+    def _update_job(self, scan_job_id: str, **changes: object) -> ScanJobResponse:
+        """Replace the stored job snapshot so readers never see a half-updated record."""
+        job = self._jobs[scan_job_id].model_copy(update=changes)
+        self._jobs[scan_job_id] = job
+        self._notify(job)
+        for follower_id in self._followers.get(scan_job_id, ()):
+            follower = self._jobs.get(follower_id)
+            if follower is None:
+                continue
+            follower = follower.model_copy(update={name: getattr(job, name) for name in MIRRORED_FIELDS})
+            self._jobs[follower_id] = follower
+            self._notify(follower)
+        if job.status in (ScanJobStatus.COMPLETED, ScanJobStatus.FAILED) and not job.backfill_pending:
+            self._release_leader(job)
+        return job
+
+    def _notify(self, job: ScanJobResponse) -> None:
+        for observer in self.job_observers:
+            observer(job)
+
+    def _release_leader(self, job: ScanJobResponse) -> None:
+        """Stop coalescing onto a job once it has finished or was never queued."""
+        self._followers.pop(job.scan_job_id, None)
+        key = self.coalesce_key(job)
+        if self._leaders.get(key) == job.scan_job_id:
+            del self._leaders[key]
+
+    @staticmethod
+    def _cache_key(payload: ScanJobCreateRequest, normalized_value: str) -> str:
+        """Cache key shared by duplicate submissions of the same artifact and AI mode."""
+        return f"{payload.artifact.artifact_type.value}:{normalized_value}:{payload.ai_mode.value}"
+
+    async def _run_enrichment(
+        self,
+        indicators: list[str],
+        normalized_value: str,
+        priority: ScanPriority = ScanPriority.INTERACTIVE,
+    ) -> _EnrichmentOutcome:
+        """
+        Query every applicable adapter concurrently and keep adapter order in the results.
+
+        Each adapter only receives the indicator types it declares support for; adapters with
+        nothing applicable are not called and get no source hit.
+
+        Interactive scans stop waiting once `early_exit_min_sources` adapters report a malicious
+        verdict at `early_exit_min_confidence` or above. Adapters still running are returned as
+        stragglers with "pending" placeholder hits and keep the original scan deadline.
+        """
+        routes = route_indicators(self.enrichment_adapters, indicators or [normalized_value])
+        if not routes:
+            return _EnrichmentOutcome(source_hits=[])
+
+        adapters = [adapter for adapter, _ in routes]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.enrichment_deadline_seconds
+        tasks = [
+            asyncio.create_task(self._enrich_with_adapter(adapter, routed, priority))
+            for adapter, routed in routes
+        ]
+        pending = set(tasks)
+        early_exit = False
+        try:
+            while pending and not early_exit:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                _, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                early_exit = bool(pending) and self._verdict_settled(tasks, priority)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if early_exit:
+            return _EnrichmentOutcome(
+                source_hits=[
+                    task.result() if task.done() else self._pending_hit(adapter)
+                    for adapter, task in zip(adapters, tasks)
+                ],
+                adapters=adapters,
+                stragglers={index: task for index, task in enumerate(tasks) if not task.done()},
+                deadline=deadline,
+            )
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        return _EnrichmentOutcome(
+            source_hits=[self._finished_hit(adapter, task) for adapter, task in zip(adapters, tasks)],
+            adapters=adapters,
+        )
+
+    def _verdict_settled(self, tasks: list[asyncio.Task[SourceHit]], priority: ScanPriority) -> bool:
+        """Return True once enough finished sources agree the artifact is malicious."""
+        if priority is not ScanPriority.INTERACTIVE or self.early_exit_min_sources <= 0:
+            return False
+        confident = 0
+        for task in tasks:
+            if not task.done() or task.cancelled():
+                continue
+            hit = task.result()
+            if hit.verdict == "malicious" and hit.confidence_score >= self.early_exit_min_confidence:
+                confident += 1
+        return confident >= self.early_exit_min_sources
+
+    async def _backfill(self, scan_job_id: str, payload: ScanJobCreateRequest, outcome: _EnrichmentOutcome) -> None:
+        """Wait for stragglers until the scan deadline, then publish the complete source list."""
+        stragglers = list(outcome.stragglers.values())
+        try:
+            _, pending = await asyncio.wait(
+                stragglers,
+                timeout=max(0.0, outcome.deadline - asyncio.get_running_loop().time()),
+            )
+        except asyncio.CancelledError:
+            self._cancel_stragglers(outcome)
+            raise
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        source_hits = list(outcome.source_hits)
+        for index, task in outcome.stragglers.items():
+            source_hits[index] = self._finished_hit(outcome.adapters[index], task)
+        job = self._jobs.get(scan_job_id)
+        if job is None:
+            return
+        if job.report_id is not None:
+            self.report_service.refresh_sources(job.report_id, source_hits)
+        response = self._update_job(scan_job_id, sources=source_hits, backfill_pending=False)
+        self.caching_service.set_scan(self._cache_key(payload, job.artifact.normalized_value), response)
+
+    @staticmethod
+    def _cancel_stragglers(outcome: _EnrichmentOutcome) -> None:
+        for task in outcome.stragglers.values():
+            task.cancel()
+
+    def _finished_hit(self, adapter: object, task: asyncio.Task[SourceHit]) -> SourceHit:
+        """Result of a finished adapter task, or a degraded hit if the deadline cut it off."""
+        if task.done() and not task.cancelled():
+            return task.result()
+        return self._degraded_hit(
+            adapter,
+            f"did not finish within the {self.enrichment_deadline_seconds:g}s scan deadline",
+        )
+
+    async def _enrich_with_adapter(
+        self,
+        adapter: object,
+        indicators: list[str],
+        priority: ScanPriority = ScanPriority.INTERACTIVE,
+    ) -> SourceHit:
+        """Run one adapter under its own timeout and turn failures into degraded hits."""
+        timeout = self._adapter_timeout(adapter)
+        try:
+            return await self._query_adapter(adapter, indicators, priority, timeout)
+        except CircuitOpenError:
+            return self._degraded_hit(adapter, "is unavailable (circuit open after repeated failures)")
+        except asyncio.TimeoutError:
+            logger.warning("Enrichment adapter %s timed out after %ss", adapter.name, timeout)
+            return self._degraded_hit(adapter, f"timed out after {timeout:g}s")
+        except Exception:
+            logger.exception("Enrichment adapter %s failed", adapter.name)
+            return self._degraded_hit(adapter, "failed with an unexpected error")
+
+    async def _query_adapter(
+        self,
+        adapter: object,
+        indicators: list[str],
+        priority: ScanPriority,
+        timeout: float,
+    ) -> SourceHit:
+        """
+        Look each indicator up in the enrichment cache and only call the adapter for misses.
+
+        Misses first wait for the adapter's rate limiter; that wait counts against the scan
+        deadline but not the adapter timeout, which only covers the upstream calls. Fresh
+        results are cached even when a sibling lookup fails, so a retry only pays for the
+        indicators that are still missing. With several indicators, the most severe verdict
+        wins and confidence only breaks ties.
+        """
+        results: dict[str, dict[str, object]] = {}
+        missing: list[str] = []
+        for indicator in dict.fromkeys(indicators):
+            cached = self.caching_service.get_enrichment(adapter.name, indicator)
+            if cached is None:
+                missing.append(indicator)
+            else:
+                results[indicator] = cached
+
+        if missing:
+            fresh = await self._call_adapter(adapter, missing, priority, timeout)
+            errors: list[BaseException] = []
+            for indicator, result in zip(missing, fresh):
+                if isinstance(result, BaseException):
+                    errors.append(result)
+                    continue
+                self.caching_service.set_enrichment(adapter.name, indicator, result)
+                results[indicator] = result
+            if errors:
+                raise errors[0]
+
+        hits = [SourceHit(**results[indicator]) for indicator in dict.fromkeys(indicators)]
+        if len(hits) == 1:
+            return hits[0]
+        strongest = max(hits, key=lambda hit: (_VERDICT_RANKS.get(hit.verdict, 0), hit.confidence_score))
+        return strongest.model_copy(
+            update={"summary": f"{strongest.summary} (strongest of {len(hits)} indicators)"}
+        )
+
+    async def _call_adapter(
+        self,
+        adapter: object,
+        indicators: list[str],
+        priority: ScanPriority,
+        timeout: float,
+    ) -> list[dict[str, object] | BaseException]:
+        """
+        Look indicators up behind the adapter's circuit breaker and rate limiter.
+
+        Adapters with `enrich_many` go through a shared micro-batcher, which takes one quota
+        token per bulk call; that quota wait falls inside the adapter timeout. Other adapters
+        are called once per indicator after taking one token each.
+
+        The breaker only sees upstream calls: a timeout or any failed lookup counts as a failed
+        call, recorded with the time the calls took. Batched calls are recorded once per bulk
+        call by the batcher's dispatch, so neither the collection window nor quota waits are
+        timed. A lookup the orchestrator cancels (scan deadline, early exit) is not recorded.
+        """
+        breaker = self.circuit_breakers.for_adapter(adapter.name) if self.circuit_breakers else None
+        if breaker is not None and not breaker.allow_request():
+            raise CircuitOpenError(adapter.name)
+        batcher = self._batcher_for(adapter)
+        if batcher is not None:
+            try:
+                return await asyncio.wait_for(batcher.lookup(indicators, priority), timeout=timeout)
+            except asyncio.CancelledError:
+                if breaker is not None:
+                    breaker.release_probe()
+                raise
+
+        started: float | None = None
+        succeeded = False
+        try:
+            if self.rate_limiter is not None:
+                for _ in indicators:
+                    await self.rate_limiter.acquire(adapter.name, priority)
+            started = time.monotonic()
+            fresh = await asyncio.wait_for(self._enrich_each(adapter, indicators), timeout=timeout)
+            succeeded = not any(isinstance(result, BaseException) for result in fresh)
+            return fresh
+        except asyncio.CancelledError:
+            started = None
+            raise
+        finally:
+            if breaker is not None:
+                if started is None:
+                    breaker.release_probe()
+                else:
+                    breaker.record(succeeded, time.monotonic() - started)
+
+    @staticmethod
+    async def _enrich_each(adapter: object, indicators: list[str]) -> list[dict[str, object] | BaseException]:
+        """
+        Call `enrich` once per indicator.
+
+        Kept as a coroutine so `wait_for` wraps it in a task and a timeout or cancellation
+        leaves no unretrieved gather exception behind.
+        """
+        return await asyncio.gather(
+            *(adapter.enrich(indicators=[indicator], artifact_value=indicator) for indicator in indicators),
+            return_exceptions=True,
+        )
+
+    def _batcher_for(self, adapter: object) -> MicroBatcher | None:
+        """Return the shared micro-batcher for adapters with a bulk lookup API."""
+        if self.batch_window_seconds <= 0 or not hasattr(adapter, "enrich_many"):
+            return None
+        batcher = self._batchers.get(adapter.name)
+        if batcher is None:
+
+            async def dispatch(indicators: list[str], priority: ScanPriority) -> dict[str, dict[str, object]]:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(adapter.name, priority)
+                return await self._timed_bulk_call(adapter, indicators)
+
+            batcher = MicroBatcher(
+                adapter.name,
+                dispatch,
+                window_seconds=self.batch_window_seconds,
+                max_batch_size=self.batch_max_size,
+            )
+            self._batchers[adapter.name] = batcher
+        return batcher
+
+    async def _timed_bulk_call(self, adapter: object, indicators: list[str]) -> dict[str, dict[str, object]]:
+        """Make one `enrich_many` call under the adapter timeout and record it on the breaker."""
+        breaker = self.circuit_breakers.for_adapter(adapter.name) if self.circuit_breakers else None
+        started: float | None = time.monotonic()
+        succeeded = False
+        try:
+            results = await asyncio.wait_for(adapter.enrich_many(indicators), timeout=self._adapter_timeout(adapter))
+            succeeded = True
+            return results
+        except asyncio.CancelledError:
+            started = None
+            raise
+        finally:
+            if breaker is not None and started is not None:
+                breaker.record(succeeded, time.monotonic() - started)
+
+    def _adapter_timeout(self, adapter: object) -> float:
+        """
+        Prefer configured overrides, then the adapter's own timeout, then the shared default.
+
+        With circuit breakers enabled the result is tightened towards the adapter's observed p99.
+        """
+        if adapter.name in self.adapter_timeouts:
+            timeout = self.adapter_timeouts[adapter.name]
+        else:
+            timeout = getattr(adapter, "timeout_seconds", None) or self.adapter_timeout_seconds
+        if self.circuit_breakers is not None:
+            return self.circuit_breakers.for_adapter(adapter.name).timeout_seconds(timeout)
+        return timeout
+
+    @staticmethod
+    def _pending_hit(adapter: object) -> SourceHit:
+        """Placeholder for a source still running when an interactive scan exited early."""
+        return SourceHit(
+            source_name=adapter.name,
+            verdict="pending",
+            confidence_score=0,
+            summary=f"Source {adapter.name} is still running; its result will be backfilled.",
+            degraded=True,
+        )
+
+    @staticmethod
+    def _degraded_hit(adapter: object, reason: str) -> SourceHit:
+        """Placeholder hit recorded when a source could not contribute to the scan."""
+        return SourceHit(
+            source_name=adapter.name,
+            verdict="unavailable",
+            confidence_score=0,
+            summary=f"Source {adapter.name} {reason}.",
+            degraded=True,
+        )
+
     def get_job(self, scan_job_id: str) -> ScanJobResponse | None:
         """Return a single job response if the scaffold already built it."""
         return self._jobs.get(scan_job_id)
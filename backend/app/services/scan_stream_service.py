@@ -0,0 +1,135 @@
+"""
+Purpose:
+    Ingest NDJSON artifact uploads of any size and stream back one job record per line.
+Inputs:
+    Raw request body chunks (one `ArtifactSubmissionRequest` JSON object per line) and an AI mode.
+Outputs:
+    NDJSON lines carrying the line number plus either the queued job or a validation error.
+Dependencies:
+    Pydantic validation, scan schemas, and the active scan job engine.
+TODO Checklist:
+    - [ ] Accept gzip-compressed uploads if hunt tooling starts sending them.
+"""
+
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+from app.schemas.artifact import ArtifactSubmissionRequest
+from app.schemas.scan import ScanJobCreateRequest
+from app.services.scan_job_engine import DatabaseScanJobEngine, ScanJobEngine
+from app.utils.enums import AiMode, ScanPriority
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int,
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """
+    Split a byte stream into `(line_number, line)` pairs without buffering more than one line.
+
+    Lines longer than `max_line_bytes` are dropped while they stream in and reported as `None`.
+    Blank lines are skipped but still counted.
+    """
+    buffer = bytearray()
+    oversized = False
+    line_number = 0
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            piece = chunk[start:] if end == -1 else chunk[start:end]
+            if not oversized:
+                buffer += piece
+                if len(buffer) > max_line_bytes:
+                    oversized = True
+                    buffer.clear()
+            if end == -1:
+                break
+            line_number += 1
+            if oversized:
+                yield line_number, None
+            elif buffer.strip():
+                yield line_number, bytes(buffer)
+            buffer.clear()
+            oversized = False
+            start = end + 1
+    if oversized or buffer.strip():
+        yield line_number + 1, None if oversized else bytes(buffer)
+
+
+class ScanStreamService:
+    """Feed NDJSON artifacts to the scan engine at bulk priority in small batches so memory stays flat."""
+
+    def __init__(
+        self,
+        engine: ScanJobEngine | DatabaseScanJobEngine,
+        batch_size: int = 500,
+        max_line_bytes: int = 64 * 1024,
+    ) -> None:
+        self.engine = engine
+        self.batch_size = batch_size
+        self.max_line_bytes = max_line_bytes
+
+    def ensure_ready(self) -> None:
+        """Fail before the response starts streaming if jobs cannot be accepted."""
+        if not self.engine.running:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Scan job engine is not running.",
+            )
+
+    async def ingest(self, chunks: AsyncIterator[bytes], ai_mode: AiMode) -> AsyncIterator[bytes]:
+        """
+        Yield one NDJSON result line per non-blank input line, in input order.
+
+        Artifacts are submitted `batch_size` at a time; the engine's batch submission applies
+        backpressure, so reading the upload slows down when the scan queue is full.
+        """
+        pending: list[tuple[int, ScanJobCreateRequest]] = []
+        async for line_number, line in iter_ndjson_lines(chunks, self.max_line_bytes):
+            if line is None:
+                if pending:
+                    yield await self._flush(pending)
+                yield _encode({"line": line_number, "error": f"Line exceeds {self.max_line_bytes} bytes."})
+                continue
+            try:
+                artifact = ArtifactSubmissionRequest.model_validate_json(line)
+            except ValidationError as exc:
+                if pending:
+                    yield await self._flush(pending)
+                yield _encode({"line": line_number, "error": exc.errors()[0]["msg"]})
+                continue
+            pending.append(
+                (
+                    line_number,
+                    ScanJobCreateRequest(artifact=artifact, ai_mode=ai_mode, priority=ScanPriority.BULK),
+                )
+            )
+            if len(pending) >= self.batch_size:
+                yield await self._flush(pending)
+        if pending:
+            yield await self._flush(pending)
+
+    async def _flush(self, pending: list[tuple[int, ScanJobCreateRequest]]) -> bytes:
+        """Submit buffered artifacts as one batch and encode their results."""
+        batch = await self.engine.submit_batch([payload for _, payload in pending])
+        lines = b"".join(
+            _encode(
+                {
+                    "line": line_number,
+                    "scan_job_id": job.scan_job_id,
+                    "status": job.status.value,
+                    "coalesced_with": job.coalesced_with,
+                }
+            )
+            for (line_number, _), job in zip(pending, batch.jobs)
+        )
+        pending.clear()
+        return lines
+
+
+def _encode(record: dict[str, object]) -> bytes:
+    return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
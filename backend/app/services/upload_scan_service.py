@@ -0,0 +1,311 @@
+"""
+Purpose:
+    Accept multipart file uploads as a stream: hash while receiving, spool large files to disk, queue a scan.
+Inputs:
+    Request content headers, raw body chunks, the target workspace, and an AI mode.
+Outputs:
+    The queued file-hash scan job, MD5/SHA-1/SHA-256 digests, IOCs, and archive members when it is one.
+Dependencies:
+    python-multipart's streaming parser, hashing helpers, IOC extraction, archive walking, and the scan job engine.
+TODO Checklist:
+    - [ ] Hand spooled files to object storage once reports need the original bytes.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from tempfile import SpooledTemporaryFile
+
+from fastapi import HTTPException, status
+from python_multipart.multipart import MultipartParseError, MultipartParser, parse_options_header
+
+from app.schemas.artifact import ArtifactSubmissionRequest
+from app.schemas.scan import (
+    ArchiveMemberResponse,
+    ExtractedIndicatorResponse,
+    FileScanJobRequest,
+    FileUploadScanResponse,
+)
+from app.services.archive_service import ArchiveInspection, ArchiveService, archive_kind
+from app.services.ioc_extraction_service import IocExtractionService
+from app.services.scan_job_engine import DatabaseScanJobEngine, ScanJobEngine
+from app.utils.constants import MAX_CHILD_INDICATORS
+from app.utils.enums import AiMode, ArtifactType
+from app.utils.hashing import MultiDigest
+
+# Multipart framing (boundaries and part headers) allowed on top of the file size limit.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+MAX_PART_HEADER_BYTES = 16 * 1024
+ARCHIVE_SNIFF_BYTES = 512
+
+
+class _MultipartEvents:
+    """
+    Collect python-multipart callbacks so the async reader can act on them after each write.
+
+    Only part boundaries and file bytes are kept; data of non-file fields is ignored.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, object]] = []
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._header_bytes = 0
+        self._in_file = False
+
+    def callbacks(self) -> dict[str, object]:
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+
+    def drain(self) -> list[tuple[str, object]]:
+        events, self.events = self.events, []
+        return events
+
+    def _on_part_begin(self) -> None:
+        self._disposition = b""
+        self._header_bytes = 0
+        self._in_file = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+        self._count_header_bytes(end - start)
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+        self._count_header_bytes(end - start)
+
+    def _on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        if b"filename" in options:
+            self._in_file = True
+            self.events.append(("file_start", options[b"filename"].decode("utf-8", errors="replace")))
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self.events.append(("data", data[start:end]))
+
+    def _on_part_end(self) -> None:
+        if self._in_file:
+            self.events.append(("file_end", None))
+
+    def _count_header_bytes(self, size: int) -> None:
+        self._header_bytes += size
+        if self._header_bytes > MAX_PART_HEADER_BYTES:
+            raise MultipartParseError("Multipart part headers are too large.")
+
+
+class UploadScanService:
+    """
+    Turn one uploaded file into a file-hash scan without holding the whole file in memory.
+
+    Bytes are hashed as they arrive and spooled to a temporary file once they pass
+    `spool_threshold_bytes`, and IOCs are extracted in the same pass. The size limit is
+    enforced mid-stream, and the scan is queued as soon as the file part ends.
+
+    Archives are the exception: their members are walked first, and the scan is queued
+    with each member's SHA-256 and IOCs as child indicators so they are enriched with it.
+    """
+
+    def __init__(
+        self,
+        engine: ScanJobEngine | DatabaseScanJobEngine,
+        ioc_extraction_service: IocExtractionService,
+        max_upload_bytes: int = 20 * 1024 * 1024,
+        spool_threshold_bytes: int = 1024 * 1024,
+        archive_service: ArchiveService | None = None,
+    ) -> None:
+        self.engine = engine
+        self.archive_service = archive_service
+        self.ioc_extraction_service = ioc_extraction_service
+        self.max_upload_bytes = max_upload_bytes
+        self.spool_threshold_bytes = spool_threshold_bytes
+
+    def ensure_ready(self) -> None:
+        """Fail before reading the body if jobs cannot be accepted."""
+        if not self.engine.running:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Scan job engine is not running.",
+            )
+
+    async def scan_upload(
+        self,
+        content_type: str | None,
+        content_length: str | None,
+        chunks: AsyncIterator[bytes],
+        workspace_id: str,
+        ai_mode: AiMode,
+    ) -> FileUploadScanResponse:
+        """Read a multipart body carrying exactly one file and queue a scan of its SHA-256."""
+        boundary = self._boundary(content_type)
+        if content_length and content_length.isdigit():
+            if int(content_length) > self.max_upload_bytes + MULTIPART_OVERHEAD_BYTES:
+                raise self._too_large()
+
+        collector = _MultipartEvents()
+        parser = MultipartParser(boundary, callbacks=collector.callbacks())
+        digest = MultiDigest()
+        extractor = self.ioc_extraction_service.streaming_extractor()
+        spool = SpooledTemporaryFile(max_size=self.spool_threshold_bytes)
+        file_name: str | None = None
+        file_parts = 0
+        head = bytearray()
+        job = None
+        archive_pending = False
+        try:
+            async for chunk in chunks:
+                try:
+                    parser.write(chunk)
+                except MultipartParseError as exc:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+                for event, value in collector.drain():
+                    if event == "file_start":
+                        file_parts += 1
+                        if file_parts > 1:
+                            raise HTTPException(
+                                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                detail="Upload exactly one file per request.",
+                            )
+                        file_name = value[:255] or None
+                    elif event == "data":
+                        digest.update(value)
+                        if digest.size_bytes > self.max_upload_bytes:
+                            raise self._too_large()
+                        if len(head) < ARCHIVE_SNIFF_BYTES:
+                            head += value[: ARCHIVE_SNIFF_BYTES - len(head)]
+                            if self.archive_service is not None and archive_kind(bytes(head)):
+                                extractor = None
+                        if extractor is not None:
+                            extractor.feed(value)
+                        await self._write(spool, value)
+                    elif event == "file_end":
+                        if self.archive_service is not None and archive_kind(bytes(head)):
+                            archive_pending = True
+                            continue
+                        job = await self.engine.submit(
+                            self._scan_request(digest.hexdigests()["sha256"], file_name, workspace_id, ai_mode)
+                        )
+            parser.finalize()
+            inspection = None
+            if archive_pending:
+                inspection = await asyncio.to_thread(self.archive_service.inspect, spool, file_name)
+                job = await self.engine.submit(
+                    self._scan_request(
+                        digest.hexdigests()["sha256"],
+                        file_name,
+                        workspace_id,
+                        ai_mode,
+                        _child_indicators(inspection),
+                    )
+                )
+            if job is None:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Multipart body must contain one file part.",
+                )
+            spooled_to_disk = bool(getattr(spool, "_rolled", False))
+            if inspection is None:
+                indicators, truncated = extractor.close(), extractor.truncated
+            else:
+                indicators = list(
+                    {item.value: item for member in inspection.members for item in member.indicators}.values()
+                )
+                truncated = inspection.limit_reached is not None
+        finally:
+            spool.close()
+
+        hashes = digest.hexdigests()
+        return FileUploadScanResponse(
+            job=job,
+            file_name=file_name,
+            size_bytes=digest.size_bytes,
+            md5=hashes["md5"],
+            sha1=hashes["sha1"],
+            sha256=hashes["sha256"],
+            spooled_to_disk=spooled_to_disk,
+            indicators=[
+                ExtractedIndicatorResponse(value=indicator.value, indicator_type=indicator.indicator_type)
+                for indicator in indicators
+            ],
+            indicators_truncated=truncated,
+            archive_members=[
+                ArchiveMemberResponse(
+                    path=member.path,
+                    depth=member.depth,
+                    size_bytes=member.size_bytes,
+                    md5=member.md5,
+                    sha1=member.sha1,
+                    sha256=member.sha256,
+                    indicators=[
+                        ExtractedIndicatorResponse(value=item.value, indicator_type=item.indicator_type)
+                        for item in member.indicators
+                    ],
+                )
+                for member in (inspection.members if inspection else [])
+            ],
+            archive_limit_reached=inspection.limit_reached if inspection else None,
+            archive_errors=inspection.errors if inspection else [],
+        )
+
+    @staticmethod
+    async def _write(spool: SpooledTemporaryFile, data: bytes) -> None:
+        """Write in place while the spool is in memory; move disk writes off the event loop."""
+        if getattr(spool, "_rolled", False):
+            await asyncio.to_thread(spool.write, data)
+        else:
+            spool.write(data)
+
+    @staticmethod
+    def _scan_request(
+        sha256: str,
+        file_name: str | None,
+        workspace_id: str,
+        ai_mode: AiMode,
+        child_indicators: list[str] | None = None,
+    ) -> FileScanJobRequest:
+        return FileScanJobRequest(
+            artifact=ArtifactSubmissionRequest(
+                workspace_id=workspace_id,
+                artifact_type=ArtifactType.FILE,
+                artifact_value=sha256,
+                file_name=file_name,
+            ),
+            ai_mode=ai_mode,
+            child_indicators=child_indicators or [],
+        )
+
+    @staticmethod
+    def _boundary(content_type: str | None) -> bytes:
+        media_type, options = parse_options_header(content_type or "")
+        if media_type != b"multipart/form-data" or not options.get(b"boundary"):
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Upload must be multipart/form-data with a boundary.",
+            )
+        return options[b"boundary"]
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds the {self.max_upload_bytes // (1024 * 1024)} MB upload limit.",
+        )
+
+
+def _child_indicators(inspection: ArchiveInspection) -> list[str]:
+    """Member hashes first, then their IOCs, deduplicated and capped to what a scan request accepts."""
+    values = [member.sha256 for member in inspection.members]
+    values += [item.value for member in inspection.members for item in member.indicators]
+    return list(dict.fromkeys(values))[:MAX_CHILD_INDICATORS]
@@ -16,6 +16,16 @@ DEFAULT_ORGANIZATION_ID = "demo-org"
 DEFAULT_WORKSPACE_ID = "demo-workspace"
 DEFAULT_PUBLIC_FEED_TITLE = "Cyber Guard Public Threats"
 
+# Lower ranks are served first by the scan queues and the enrichment rate limiters.
+SCAN_PRIORITY_RANKS = {
+    "interactive": 0,
+    "bulk": 1,
+    "rescan": 2,
+}
+
+# Archive members and their IOCs ride along with the parent file's scan, up to this many.
+MAX_CHILD_INDICATORS = 1000
+
 PLANNED_THREAT_SOURCES = [
     "virustotal",
     "source_a",
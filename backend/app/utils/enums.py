@@ -22,6 +22,21 @@ class ArtifactType(str, Enum):
     EMAIL_SIGNAL = "email_signal"
 
 
+class IndicatorType(str, Enum):
+    URL = "url"
+    DOMAIN = "domain"
+    IP_ADDRESS = "ip_address"
+    EMAIL_ADDRESS = "email_address"
+    FILE_HASH = "file_hash"
+    TEXT = "text"
+
+
+class ScanPriority(str, Enum):
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+    RESCAN = "rescan"
+
+
 class AiMode(str, Enum):
     OFF = "off"
     LOCAL = "local"
@@ -37,6 +52,12 @@ class ScanJobStatus(str, Enum):
     FAILED = "failed"
 
 
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
 class WorkspaceRole(str, Enum):
     ORG_OWNER = "org_owner"
     ORG_ADMIN = "org_admin"
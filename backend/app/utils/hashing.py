@@ -2,18 +2,25 @@
 Purpose:
     Hashing helpers for artifact normalization, cache keys, and report fingerprints.
 Inputs:
-    File bytes, byte chunks, or normalized text values.
+    File bytes, byte chunks, on-disk file paths, or normalized text values.
 Outputs:
-    Hex digest strings safe to use as identifiers and dedupe keys.
+    Hex digest strings safe to use as identifiers and dedupe keys, including several digests per pass.
 Dependencies:
-    Standard library `hashlib`.
+    Standard library `hashlib`, `mmap`, and `concurrent.futures`.
 TODO Checklist:
-    - [ ] Add tests for stream/file object hashing helper.
+    - [x] Add tests for stream/file object hashing helper.
     - [ ] Add alternate algorithms only if a real requirement appears.
 """
 
 import hashlib
+import mmap
+import os
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# hashlib releases the GIL for updates above 2 KiB; large slices keep per-call overhead negligible.
+FILE_HASH_SLICE_BYTES = 4 * 1024 * 1024
 
 
 def sha256_bytes(data: bytes) -> str:
@@ -36,3 +43,58 @@ def sha256_chunks(chunks: Iterable[bytes]) -> str:
 def sha256_text(value: str) -> str:
     """Hash normalized text values such as URLs or pasted email signals."""
     return sha256_bytes(value.encode("utf-8"))
+
+
+class MultiDigest:
+    """
+    Compute several digests over one pass of the data, such as MD5/SHA-1/SHA-256 for uploads.
+
+    Threat-intel sources key files by different hashes, so uploads report all three.
+    """
+
+    ALGORITHMS = ("md5", "sha1", "sha256")
+
+    def __init__(self, algorithms: Iterable[str] = ALGORITHMS) -> None:
+        self._digests = {name: hashlib.new(name, usedforsecurity=False) for name in algorithms}
+        self.size_bytes = 0
+
+    def update(self, data: bytes) -> None:
+        for digest in self._digests.values():
+            digest.update(data)
+        self.size_bytes += len(data)
+
+    def hexdigests(self) -> dict[str, str]:
+        """Return `{algorithm: hex digest}` for everything fed so far."""
+        return {name: digest.hexdigest() for name, digest in self._digests.items()}
+
+
+def multi_digest_file(
+    path: str | os.PathLike[str],
+    algorithms: Iterable[str] = MultiDigest.ALGORITHMS,
+    slice_bytes: int = FILE_HASH_SLICE_BYTES,
+) -> dict[str, str]:
+    """
+    Hash an on-disk file with several algorithms while reading it only once.
+
+    The file is memory-mapped and walked slice by slice in a single loop. Every digest
+    consumes a slice while its pages are still hot; with more than one algorithm the
+    updates for a slice run on a small thread pool, and because hashlib drops the GIL
+    they use several cores at once.
+    """
+    names = tuple(algorithms)
+    digests = {name: hashlib.new(name, usedforsecurity=False) for name in names}
+    with Path(path).open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return {name: digest.hexdigest() for name, digest in digests.items()}
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            if len(names) == 1:
+                for start in range(0, len(view), slice_bytes):
+                    with view[start : start + slice_bytes] as part:
+                        digests[names[0]].update(part)
+            else:
+                with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="multi-digest") as pool:
+                    for start in range(0, len(view), slice_bytes):
+                        with view[start : start + slice_bytes] as part:
+                            for future in [pool.submit(digest.update, part) for digest in digests.values()]:
+                                future.result()
+    return {name: digest.hexdigest() for name, digest in digests.items()}
@@ -0,0 +1,41 @@
+"""
+Purpose:
+    Classify extracted indicators so enrichment calls only go to sources that can answer them.
+Inputs:
+    Single normalized indicator strings (URLs, domains, IPs, email addresses, hashes, free text).
+Outputs:
+    An `IndicatorType` for each indicator.
+Dependencies:
+    Standard library `ipaddress` and `re`, plus the shared enums.
+TODO Checklist:
+    - [ ] Accept punycode TLDs such as `xn--p1ai`; the domain pattern only allows letters there.
+"""
+
+import ipaddress
+import re
+
+from app.utils.enums import IndicatorType
+
+HASH_LENGTHS = {32, 40, 64}
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+_DOMAIN_PATTERN = re.compile(r"^(?=.{4,253}$)([a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}\.?$", re.IGNORECASE)
+
+
+def classify_indicator(value: str) -> IndicatorType:
+    """Return the indicator type; anything unrecognized is `TEXT`."""
+    value = value.strip()
+    if "://" in value:
+        return IndicatorType.URL
+    if len(value) in HASH_LENGTHS and all(char in _HEX_CHARS for char in value):
+        return IndicatorType.FILE_HASH
+    try:
+        ipaddress.ip_address(value)
+        return IndicatorType.IP_ADDRESS
+    except ValueError:
+        pass
+    local_part, at, domain = value.rpartition("@")
+    if at and local_part and _DOMAIN_PATTERN.match(domain):
+        return IndicatorType.EMAIL_ADDRESS
+    if _DOMAIN_PATTERN.match(value):
+        return IndicatorType.DOMAIN
+    return IndicatorType.TEXT
@@ -0,0 +1,162 @@
+"""
+Purpose:
+    Stream the items of selected arrays out of a large JSON document without loading it whole.
+Inputs:
+    A text stream and key paths such as `("objects",)` or `("Event", "Attribute")`.
+Outputs:
+    Each item of every matching array, decoded one at a time.
+Dependencies:
+    Standard library `json` and `re`.
+TODO Checklist:
+    - [ ] Swap in a C-backed incremental parser if feed imports become parse-bound.
+"""
+
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+# Path component that matches every element of an array.
+ANY_ITEM = "*"
+_EMIT = object()
+_WHITESPACE = " \t\r\n"
+_DELIMITER = re.compile(r"[\s,:\]}]")
+_DECODER = json.JSONDecoder()
+
+
+class _Reader:
+    """Chunked text buffer with just enough lookahead for `JSONDecoder.raw_decode`."""
+
+    def __init__(self, handle: TextIO, chunk_chars: int) -> None:
+        self._handle = handle
+        self._chunk_chars = chunk_chars
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._handle.read(self._chunk_chars)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it ('' at the end)."""
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected: str) -> None:
+        if self.peek() != expected:
+            raise ValueError(f"Malformed JSON: expected {expected!r} near offset {self._pos}.")
+        self._pos += 1
+
+    def value(self) -> object:
+        """Decode one complete value, reading more input until it is whole."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if not self._fill():
+                    raise ValueError(f"Malformed JSON: {exc.msg}.") from exc
+                continue
+            # A number cut by the chunk edge ("12" of "1234", "3.5" of "3.5e2") decodes as a shorter
+            # one, so a value only counts as whole once a delimiter or the end of input follows it.
+            if _DELIMITER.search(self._buffer, end) is None and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def _trie(paths: Iterable[tuple[str, ...]]) -> dict[object, object]:
+    root: dict[object, object] = {}
+    for path in paths:
+        node = root
+        for part in path:
+            node = node.setdefault(part, {})
+        node[_EMIT] = True
+    return root
+
+
+def iter_json_array_items(
+    handle: TextIO,
+    paths: Iterable[tuple[str, ...]],
+    chunk_chars: int = 1024 * 1024,
+) -> Iterator[object]:
+    """
+    Yield the items of every array found at one of `paths`, in document order.
+
+    Path components are object keys, or `ANY_ITEM` for each element of an array. Only the
+    items themselves are decoded as whole values; everything around them is walked token by
+    token, so memory stays bounded by one item plus one read chunk however large the file is.
+    """
+    reader = _Reader(handle, chunk_chars)
+    yield from _walk(reader, _trie(paths))
+    if reader.peek():
+        raise ValueError("Malformed JSON: unexpected data after the document.")
+
+
+def _walk(reader: _Reader, node: dict[object, object] | None) -> Iterator[object]:
+    char = reader.peek()
+    if char == "{":
+        reader.take("{")
+        if reader.peek() == "}":
+            reader.take("}")
+            return
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise ValueError("Malformed JSON: object keys must be strings.")
+            reader.take(":")
+            child = node.get(key) if node else None
+            if child and _EMIT in child and reader.peek() == "[":
+                yield from _items(reader)
+            else:
+                yield from _walk(reader, child)
+            if reader.peek() == ",":
+                reader.take(",")
+                continue
+            reader.take("}")
+            return
+    if char == "[":
+        reader.take("[")
+        child = node.get(ANY_ITEM) if node else None
+        if reader.peek() == "]":
+            reader.take("]")
+            return
+        while True:
+            yield from _walk(reader, child)
+            if reader.peek() == ",":
+                reader.take(",")
+                continue
+            reader.take("]")
+            return
+    if not char:
+        raise ValueError("Malformed JSON: unexpected end of input.")
+    reader.value()
+
+
+def _items(reader: _Reader) -> Iterator[object]:
+    reader.take("[")
+    if reader.peek() == "]":
+        reader.take("]")
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() == ",":
+            reader.take(",")
+            continue
+        reader.take("]")
+        return
@@ -23,3 +23,11 @@ def normalize_url(raw_url: str) -> str:
     path = parsed.path or "/"
     normalized = parsed._replace(scheme=scheme, netloc=netloc, path=path, fragment="")
     return urlunparse(normalized)
+
+
+def url_host(raw_url: str) -> str | None:
+    """Return the lowercase host of a URL after normalization, without port or credentials."""
+    try:
+        return urlparse(normalize_url(raw_url)).hostname
+    except ValueError:
+        return None
@@ -0,0 +1,206 @@
+"""
+Purpose:
+    Standalone scan worker entry point: `python -m app.worker [--processes N] [--concurrency M]`.
+Inputs:
+    Queued rows in `scan_jobs` written by the API when `SCAN_JOB_BACKEND=database`.
+Outputs:
+    Job status snapshots and threat reports written back to the database.
+Dependencies:
+    Durable scan job queue, scan orchestrator wiring from `app.api.deps`, and multiprocessing.
+TODO Checklist:
+    - [ ] Add graceful drain on SIGTERM so deploys do not rely on lease expiry.
+    - [ ] Export per-worker throughput metrics once monitoring exists.
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+
+from app.api.deps import get_http_client_pool, get_scan_job_queue, get_scan_orchestrator
+from app.core.config import get_settings
+from app.core.logging import configure_logging
+from app.db.session import create_tables
+from app.schemas.report import ThreatReportResponse
+from app.schemas.scan import ScanJobResponse
+from app.services.scan_job_queue import ClaimedScanJob, DatabaseScanJobQueue
+from app.services.scan_orchestrator import ScanOrchestrator
+
+logger = logging.getLogger(__name__)
+
+MAX_BACKOFF_SECONDS = 30.0
+
+
+class ScanWorker:
+    """Claim jobs from the database queue and run them through one orchestrator."""
+
+    def __init__(
+        self,
+        queue: DatabaseScanJobQueue,
+        orchestrator: ScanOrchestrator,
+        worker_id: str,
+        concurrency: int,
+        poll_seconds: float,
+    ) -> None:
+        self.queue = queue
+        self.orchestrator = orchestrator
+        self.worker_id = worker_id
+        self.concurrency = concurrency
+        self.poll_seconds = poll_seconds
+        self._running: dict[str, asyncio.Task[None]] = {}
+        self._writes: dict[str, asyncio.Task[None]] = {}
+        self._lost_leases: set[str] = set()
+        self.orchestrator.job_observers.append(self._persist_snapshot)
+
+    async def run(self) -> None:
+        """Run `concurrency` claim loops until cancelled."""
+        logger.info("Scan worker %s started with %s slots", self.worker_id, self.concurrency)
+        await asyncio.gather(*(self._claim_loop() for _ in range(self.concurrency)))
+
+    async def run_once(self) -> bool:
+        """Claim and execute a single job; returns False when the queue was empty."""
+        claimed = await asyncio.to_thread(self.queue.claim, self.worker_id)
+        if claimed is None:
+            return False
+        await self._execute(claimed)
+        return True
+
+    async def _claim_loop(self) -> None:
+        """Claim jobs forever; queue errors are logged and retried with a growing backoff."""
+        failures = 0
+        while True:
+            try:
+                if await self.run_once():
+                    failures = 0
+                    continue
+                await asyncio.to_thread(self.queue.fail_exhausted)
+                failures = 0
+                delay = self.poll_seconds
+            except Exception:
+                failures += 1
+                delay = min(self.poll_seconds * 2**failures, MAX_BACKOFF_SECONDS)
+                logger.exception("Scan worker %s queue call failed; retrying in %.1fs", self.worker_id, delay)
+            await asyncio.sleep(delay)
+
+    async def _execute(self, claimed: ClaimedScanJob) -> None:
+        """Run a claimed job; it is cancelled if another worker takes the lease over."""
+        scan_job_id = claimed.job.scan_job_id
+        self.orchestrator.register_job(claimed.job)
+        running = asyncio.create_task(self._run_job(scan_job_id, claimed))
+        self._running[scan_job_id] = running
+        try:
+            await running
+        except asyncio.CancelledError:
+            if scan_job_id not in self._lost_leases:
+                raise
+            logger.warning("Scan worker %s lost the lease on job %s; abandoned it", self.worker_id, scan_job_id)
+        finally:
+            del self._running[scan_job_id]
+            self.orchestrator.discard_job(scan_job_id)
+            pending = self._writes.pop(scan_job_id, None)
+            if pending is not None:
+                await pending
+            self._lost_leases.discard(scan_job_id)
+
+    async def _run_job(self, scan_job_id: str, claimed: ClaimedScanJob) -> None:
+        job = await self.orchestrator.execute_job(scan_job_id, claimed.payload)
+        await self.orchestrator.wait_for_backfill(scan_job_id)
+        if job.report_id is not None:
+            self.orchestrator.report_service.discard_report(job.report_id)
+
+    def _persist_snapshot(self, job: ScanJobResponse) -> None:
+        """
+        Orchestrator observer: queue a write of every stage change (and the finished report).
+
+        Writes run on a worker thread so the event loop never blocks on the database, and
+        each job's writes are chained so snapshots land in order.
+        """
+        report = None
+        if job.report_id is not None:
+            report = self.orchestrator.report_service.get_report(job.report_id)
+        previous = self._writes.get(job.scan_job_id)
+        self._writes[job.scan_job_id] = asyncio.create_task(self._save_snapshot(previous, job, report))
+
+    async def _save_snapshot(
+        self,
+        previous: asyncio.Task[None] | None,
+        job: ScanJobResponse,
+        report: ThreatReportResponse | None,
+    ) -> None:
+        if previous is not None:
+            await previous
+        try:
+            saved = await asyncio.to_thread(self.queue.save_snapshot, job, self.worker_id, report)
+        except Exception:
+            # Keep running; if the writes never recover, lease expiry hands the job to another worker.
+            logger.exception("Scan worker %s could not save job %s", self.worker_id, job.scan_job_id)
+            return
+        if saved:
+            return
+        # Another worker re-claimed the job after our lease expired; stop duplicating its work.
+        self._lost_leases.add(job.scan_job_id)
+        running = self._running.get(job.scan_job_id)
+        if running is not None:
+            running.cancel()
+
+
+async def _serve(worker: ScanWorker) -> None:
+    """Run the worker and close pooled HTTP connections on the same event loop."""
+    try:
+        await worker.run()
+    finally:
+        await get_http_client_pool().close()
+
+
+def run_worker_process(index: int, concurrency: int) -> None:
+    """Entry point for one worker process."""
+    configure_logging()
+    settings = get_settings()
+    worker = ScanWorker(
+        queue=get_scan_job_queue(),
+        orchestrator=get_scan_orchestrator(),
+        worker_id=f"{socket.gethostname()}:{os.getpid()}:{index}",
+        concurrency=concurrency,
+        poll_seconds=settings.scan_job_poll_seconds,
+    )
+    try:
+        asyncio.run(_serve(worker))
+    except KeyboardInterrupt:
+        logger.info("Scan worker %s stopped", worker.worker_id)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Start one or more worker processes against the shared `scan_jobs` queue."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run Cyber Guard scan workers.")
+    parser.add_argument("--processes", type=int, default=settings.scan_worker_processes)
+    parser.add_argument("--concurrency", type=int, default=settings.scan_worker_count)
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    create_tables()
+    if args.processes <= 1:
+        run_worker_process(0, args.concurrency)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=run_worker_process, args=(index, args.concurrency), name=f"scan-worker-{index}")
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Purpose:
+    Measure IOC extraction throughput on large synthetic email bodies.
+Inputs:
+    Optional body size in megabytes, repeat count, and stream chunk size on the command line.
+Outputs:
+    Best-of-N MB/s and the number of indicators found, printed to stdout.
+Dependencies:
+    The backend `app` package; run from `backend/` as `python -m benchmarks.bench_ioc_extraction`.
+TODO Checklist:
+    - [ ] Add a corpus of real (sanitized) phishing emails once one is approved for the repo.
+"""
+
+import argparse
+import random
+import time
+
+from app.services.ioc_extraction_service import IocExtractionService
+
+FILLER_WORDS = (
+    "please review the attached invoice before friday regards accounts team thanks "
+    "your mailbox is almost full click below to verify password reset meeting notes"
+).split()
+IOC_SAMPLES = (
+    "https://login.example-bank.com/verify?id={n}",
+    "hxxp://malicious[.]example/payload{n}.exe",
+    "support{n}@phish.example",
+    "198.51.100.{octet}",
+    "2001:db8::{n:x}",
+    "{n:064x}",
+    "cdn{n}.tracking.example",
+    "invoice{n}.pdf",
+)
+
+
+def build_email_body(size_bytes: int, seed: int = 7) -> str:
+    """Mostly prose with an IOC roughly every 25 words, like a long forwarded phishing thread."""
+    rng = random.Random(seed)
+    parts: list[str] = []
+    total = 0
+    n = 0
+    while total < size_bytes:
+        if rng.random() < 0.04:
+            n += 1
+            token = rng.choice(IOC_SAMPLES).format(n=n, octet=n % 255)
+        else:
+            token = rng.choice(FILLER_WORDS)
+        parts.append(token)
+        total += len(token) + 1
+    return " ".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1].strip())
+    parser.add_argument("--megabytes", type=float, default=8.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--stream-chunk-kb", type=int, default=0, help="hash and extract from UTF-8 chunks")
+    args = parser.parse_args()
+
+    body = build_email_body(int(args.megabytes * 1024 * 1024))
+    encoded = body.encode("utf-8")
+    chunk_size = args.stream_chunk_kb * 1024
+    service = IocExtractionService(max_indicators=10_000_000)
+    best = float("inf")
+    indicators = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        if chunk_size:
+            chunks = (encoded[offset : offset + chunk_size] for offset in range(0, len(encoded), chunk_size))
+            indicators = service.extract_stream(chunks).indicators
+        else:
+            indicators = service.extract_typed(body)
+        best = min(best, time.perf_counter() - started)
+
+    megabytes = len(body) / (1024 * 1024)
+    print(f"body: {megabytes:.1f} MB, indicators: {len(indicators)}")
+    print(f"best of {args.repeat}: {best:.3f}s ({megabytes / best:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
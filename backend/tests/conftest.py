@@ -2,28 +2,40 @@
 Purpose:
     Shared pytest fixtures for the refreshed Cyber Guard scaffold.
 Inputs:
-    FastAPI app and JWT helper utilities.
+    FastAPI app, JWT helper utilities, SQLAlchemy models, and scan orchestration services.
 Outputs:
-    Test client plus authenticated headers for org and admin roles.
+    Test client, authenticated headers for org and admin roles, an in-memory database,
+    and a scan orchestrator factory.
 Dependencies:
-    pytest, fastapi.testclient, backend app package.
+    pytest, fastapi.testclient, SQLAlchemy, backend app package.
 TODO Checklist:
-    - [ ] Add DB session fixtures once routes persist real data.
     - [ ] Add seeded organization/workspace fixtures when model tests begin.
 """
 
 import sys
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from app.core.security import create_access_token
+from app.db.base import Base
 from app.main import app
+from app.services.artifact_service import ArtifactService
+from app.services.caching_service import CachingService
+from app.services.enrichment.source_b_client import SourceBClient
+from app.services.ioc_extraction_service import IocExtractionService
+from app.services.normalization_service import NormalizationService
+from app.services.report_service import ReportService
+from app.services.scan_orchestrator import ScanOrchestrator
 
 
 @pytest.fixture()
@@ -61,3 +73,32 @@ def admin_auth_header() -> dict[str, str]:
         }
     )
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture()
+def session_factory() -> Iterator[sessionmaker]:
+    """Session factory over a fresh in-memory SQLite database with every table created."""
+    # StaticPool keeps one connection, so worker threads see the same in-memory database.
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+
+@pytest.fixture()
+def build_orchestrator() -> Callable[..., ScanOrchestrator]:
+    """Factory for scan orchestrators on in-memory services; adapters default to the offline source B."""
+
+    def build(adapters: list[object] | None = None, **kwargs: object) -> ScanOrchestrator:
+        return ScanOrchestrator(
+            artifact_service=ArtifactService(),
+            normalization_service=NormalizationService(),
+            ioc_extraction_service=IocExtractionService(),
+            caching_service=CachingService(),
+            enrichment_adapters=[SourceBClient()] if adapters is None else adapters,
+            ai_services={},
+            report_service=ReportService(),
+            **kwargs,
+        )
+
+    return build
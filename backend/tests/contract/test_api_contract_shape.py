@@ -6,9 +6,14 @@ EXPECTED_PATHS = {
     "/api/v1/orgs",
     "/api/v1/workspaces",
     "/api/v1/scan-jobs",
+    "/api/v1/scan-jobs/batch",
+    "/api/v1/scan-jobs/stream",
+    "/api/v1/scan-jobs/upload",
     "/api/v1/reports/{report_id}",
     "/api/v1/public-threats",
     "/api/v1/admin-reviews/queue",
+    "/api/v1/admin-feeds/import",
+    "/api/v1/admin-feeds/retro-hunt/{import_id}",
     "/api/v1/dashboard/overview",
     "/api/v1/integrations/public-threats-api",
 }
@@ -0,0 +1,21 @@
+from app.api.deps import get_feed_import_service
+from app.main import app
+from app.services.feed_import_service import FeedImportService
+from app.services.normalization_service import NormalizationService
+
+
+def test_memory_backend_import_does_not_claim_a_retro_hunt(client, admin_auth_header, session_factory) -> None:
+    service = FeedImportService(session_factory, NormalizationService())
+    app.dependency_overrides[get_feed_import_service] = lambda: service
+    try:
+        response = client.post(
+            "/api/v1/admin-feeds/import?source=vendor-x&file_name=feed.csv",
+            headers=admin_auth_header,
+            content=b"indicator,type\nevil.example,domain\n",
+        )
+    finally:
+        app.dependency_overrides.pop(get_feed_import_service, None)
+
+    assert response.status_code == 200
+    assert response.json()["inserted"] == 1
+    assert response.json()["retro_hunt_scheduled"] is False
@@ -1,19 +1,42 @@
+import asyncio
+import hashlib
+import json
+import time
+
+from starlette.background import BackgroundTask
+
+from app.api.routes.scan_jobs import _FullDuplexStreamingResponse
+
+
+def scan_payload(url: str) -> dict[str, object]:
+    return {
+        "artifact": {
+            "workspace_id": "demo-workspace",
+            "artifact_type": "url",
+            "artifact_value": url,
+        },
+        "ai_mode": "local",
+    }
+
+
+def wait_for_job(client, headers: dict[str, str], scan_job_id: str, timeout: float = 5.0) -> dict[str, object]:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/api/v1/scan-jobs/{scan_job_id}", headers=headers).json()
+        if job["status"] in {"completed", "failed"} or time.monotonic() > deadline:
+            return job
+        time.sleep(0.02)
+
+
 def test_scan_job_flow_returns_report(client, org_auth_header) -> None:
     response = client.post(
         "/api/v1/scan-jobs",
         headers=org_auth_header,
-        json={
-            "artifact": {
-                "workspace_id": "demo-workspace",
-                "artifact_type": "url",
-                "artifact_value": "https://example.org/login",
-            },
-            "ai_mode": "local",
-        },
+        json=scan_payload("https://example.org/login"),
     )
 
-    assert response.status_code == 200
-    job = response.json()
+    assert response.status_code == 202
+    job = wait_for_job(client, org_auth_header, response.json()["scan_job_id"])
     assert job["status"] == "completed"
     assert len(job["sources"]) >= 2
 
@@ -22,19 +45,110 @@ def test_scan_job_flow_returns_report(client, org_auth_header) -> None:
     assert report_response.json()["scan_job_id"] == job["scan_job_id"]
 
 
+def test_new_scan_job_is_queued_before_pipeline_runs(client, org_auth_header) -> None:
+    response = client.post(
+        "/api/v1/scan-jobs",
+        headers=org_auth_header,
+        json=scan_payload("https://queued.example.org/landing"),
+    )
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["status"] == "queued"
+    assert body["report_id"] is None
+    assert wait_for_job(client, org_auth_header, body["scan_job_id"])["status"] == "completed"
+
+
 def test_duplicate_submission_returns_cached_job(client, org_auth_header) -> None:
-    payload = {
-        "artifact": {
-            "workspace_id": "demo-workspace",
-            "artifact_type": "url",
-            "artifact_value": "https://example.org/login",
-        },
-        "ai_mode": "local",
-    }
+    payload = scan_payload("https://example.org/login")
 
     first = client.post("/api/v1/scan-jobs", headers=org_auth_header, json=payload)
+    wait_for_job(client, org_auth_header, first.json()["scan_job_id"])
     second = client.post("/api/v1/scan-jobs", headers=org_auth_header, json=payload)
 
-    assert first.status_code == 200
-    assert second.status_code == 200
+    assert first.status_code == 202
+    assert second.status_code == 202
+    assert second.json()["status"] == "completed"
     assert first.json()["scan_job_id"] == second.json()["scan_job_id"]
+
+
+def test_batch_submission_dedupes_normalized_values(client, org_auth_header) -> None:
+    response = client.post(
+        "/api/v1/scan-jobs/batch",
+        headers=org_auth_header,
+        json={
+            "scans": [
+                scan_payload("https://batch.example.org/a"),
+                scan_payload("HTTPS://BATCH.example.org/a"),
+                scan_payload("https://batch.example.org/b"),
+            ]
+        },
+    )
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["unique_count"] == 2
+    first, duplicate, other = body["jobs"]
+    assert first["scan_job_id"] == duplicate["scan_job_id"]
+    assert other["scan_job_id"] != first["scan_job_id"]
+    assert wait_for_job(client, org_auth_header, other["scan_job_id"])["status"] == "completed"
+
+
+def test_empty_batch_is_rejected(client, org_auth_header) -> None:
+    response = client.post("/api/v1/scan-jobs/batch", headers=org_auth_header, json={"scans": []})
+
+    assert response.status_code == 422
+
+
+def test_ndjson_stream_returns_job_per_line(client, org_auth_header) -> None:
+    lines = [
+        json.dumps({"workspace_id": "demo-workspace", "artifact_type": "url", "artifact_value": url})
+        for url in ("https://stream.example.org/a", "https://stream.example.org/b")
+    ]
+
+    response = client.post(
+        "/api/v1/scan-jobs/stream?ai_mode=off",
+        headers={**org_auth_header, "Content-Type": "application/x-ndjson"},
+        content="\n".join(lines) + "\n",
+    )
+
+    assert response.status_code == 202
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [result["line"] for result in results] == [1, 2]
+    assert wait_for_job(client, org_auth_header, results[1]["scan_job_id"])["status"] == "completed"
+
+
+def test_duplex_stream_response_runs_background_after_body() -> None:
+    events: list[str] = []
+
+    async def send(message: dict[str, object]) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            events.append("body")
+
+    async def receive() -> dict[str, object]:
+        raise AssertionError("the response must not read the request body")
+
+    response = _FullDuplexStreamingResponse(
+        iter([b"line\n"]),
+        background=BackgroundTask(lambda: events.append("background")),
+    )
+    asyncio.run(response({"type": "http"}, receive, send))
+
+    assert events == ["body", "background"]
+
+
+def test_file_upload_queues_hash_scan(client, org_auth_header) -> None:
+    file_bytes = b"From: billing@invoices.example.net\nPay at hxxps://pay[.]example.net/now\n"
+
+    response = client.post(
+        "/api/v1/scan-jobs/upload?workspace_id=demo-workspace&ai_mode=off",
+        headers=org_auth_header,
+        files={"file": ("invoice.eml", file_bytes, "message/rfc822")},
+    )
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["sha256"] == hashlib.sha256(file_bytes).hexdigest()
+    assert body["job"]["artifact"]["artifact_type"] == "file"
+    assert {indicator["value"] for indicator in body["indicators"]} >= {"https://pay.example.net/now"}
+    assert wait_for_job(client, org_auth_header, body["job"]["scan_job_id"])["status"] == "completed"
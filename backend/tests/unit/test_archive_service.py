@@ -0,0 +1,89 @@
+import gzip
+import hashlib
+import io
+import tarfile
+import zipfile
+
+from app.services.archive_service import ArchiveService
+from app.services.ioc_extraction_service import IocExtractionService
+
+
+def zip_bytes(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def tar_gz_bytes(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def inspect(data: bytes, **limits: int):
+    return ArchiveService(IocExtractionService(), **limits).inspect(io.BytesIO(data), "attachment.zip")
+
+
+def test_zip_members_are_hashed_and_scanned_including_nested_archives() -> None:
+    payload = b"beacon to hxxp://c2[.]example/gate every 60s"
+    nested = tar_gz_bytes({"drop/readme.txt": payload})
+    data = zip_bytes({"invoice.txt": b"pay at 198.51.100.23", "bundle.tgz": nested})
+
+    inspection = inspect(data)
+
+    by_path = {member.path: member for member in inspection.members}
+    assert set(by_path) == {
+        "attachment.zip/invoice.txt",
+        "attachment.zip/bundle.tgz",
+        "attachment.zip/bundle.tgz/bundle",
+        "attachment.zip/bundle.tgz/bundle/drop/readme.txt",
+    }
+    leaf = by_path["attachment.zip/bundle.tgz/bundle/drop/readme.txt"]
+    assert leaf.depth == 3
+    assert leaf.sha256 == hashlib.sha256(payload).hexdigest()
+    assert [item.value for item in leaf.indicators] == ["http://c2.example/gate"]
+    assert by_path["attachment.zip/bundle.tgz"].sha256 == hashlib.sha256(nested).hexdigest()
+    assert by_path["attachment.zip/bundle.tgz"].indicators == []
+    assert [item.value for item in by_path["attachment.zip/invoice.txt"].indicators] == ["198.51.100.23"]
+    assert inspection.limit_reached is None
+
+
+def test_nested_archives_past_max_depth_are_hashed_but_not_opened() -> None:
+    data = zip_bytes({"inner.zip": zip_bytes({"deep.txt": b"evil.example"})})
+
+    inspection = inspect(data, max_depth=1)
+
+    assert [member.path for member in inspection.members] == ["attachment.zip/inner.zip"]
+
+
+def test_decompression_bomb_stops_at_total_byte_limit() -> None:
+    data = zip_bytes({"zeros.bin": b"\0" * (8 * 1024 * 1024)})
+
+    inspection = inspect(data, max_total_bytes=1024 * 1024)
+
+    assert len(data) < 64 * 1024
+    assert inspection.members == []
+    assert inspection.limit_reached.startswith("decompressed size")
+
+
+def test_member_count_limit_keeps_members_seen_so_far() -> None:
+    data = zip_bytes({f"file{index}.txt": b"x" for index in range(10)})
+
+    inspection = inspect(data, max_members=3)
+
+    assert len(inspection.members) == 3
+    assert inspection.limit_reached == "member count over 3"
+
+
+def test_gzip_and_corrupt_archives() -> None:
+    gzipped = ArchiveService(IocExtractionService()).inspect(io.BytesIO(gzip.compress(b"ping 203.0.113.9")), "log.gz")
+    corrupt = inspect(b"PK\x03\x04" + b"\0" * 100)
+
+    assert [member.path for member in gzipped.members] == ["log.gz/log"]
+    assert corrupt.members == [] and corrupt.errors
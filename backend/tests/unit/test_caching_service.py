@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+
+from app.schemas.artifact import ArtifactSubmissionResponse
+from app.schemas.scan import ScanJobResponse, SourceHit
+from app.services.caching_service import BoundedTtlCache, CachingService
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def scan_response(verdict: str) -> ScanJobResponse:
+    return ScanJobResponse(
+        scan_job_id="job-1",
+        status="completed",
+        artifact=ArtifactSubmissionResponse(
+            submission_id="submission-1",
+            workspace_id="demo-workspace",
+            artifact_type="url",
+            normalized_value="https://example.org/",
+            created_at=datetime.now(timezone.utc),
+        ),
+        ai_mode="off",
+        sources=[SourceHit(source_name="source_a", verdict=verdict, confidence_score=50, summary="s")],
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_lru_eviction_respects_entry_and_byte_limits() -> None:
+    cache: BoundedTtlCache[str] = BoundedTtlCache("test", max_entries=2, max_bytes=100)
+
+    cache.set("a", "A", ttl_seconds=60, size_bytes=10)
+    cache.set("b", "B", ttl_seconds=60, size_bytes=10)
+    assert cache.get("a") == "A"
+    cache.set("c", "C", ttl_seconds=60, size_bytes=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+
+    cache.set("big", "BIG", ttl_seconds=60, size_bytes=95)
+    assert len(cache) == 1
+    assert cache.size_bytes == 95
+    assert cache.stats()["evictions"] == 3
+
+
+def test_clean_verdicts_expire_before_malicious_ones() -> None:
+    clock = FakeClock()
+    service = CachingService(clean_ttl_seconds=10, malicious_ttl_seconds=100, clock=clock)
+    service.set_scan("clean", scan_response("clean"))
+    service.set_scan("bad", scan_response("malicious"))
+
+    clock.now = 50
+
+    assert service.get_scan("clean") is None
+    assert service.get_scan("bad") is not None
+    stats = service.stats()[0]
+    assert stats["hits"] == 1
+    assert stats["expirations"] == 1
+    assert service.flush("scan") == 1
@@ -0,0 +1,55 @@
+from app.services.circuit_breaker import AdapterCircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_then_half_opens_a_single_probe() -> None:
+    clock = FakeClock()
+    breaker = AdapterCircuitBreaker("virustotal", min_calls=4, open_seconds=30, clock=clock)
+    for success in (True, False, False, True):
+        breaker.record(success, 0.1)
+
+    assert breaker.state == "open"
+    assert breaker.allow_request() is False
+
+    clock.now = 31
+    assert breaker.allow_request() is True
+    assert breaker.state == "half_open"
+    assert breaker.allow_request() is False
+
+    breaker.record(True, 0.1)
+    assert breaker.state == "closed"
+    assert breaker.allow_request() is True
+
+
+def test_failed_probe_restarts_the_open_period() -> None:
+    clock = FakeClock()
+    breaker = AdapterCircuitBreaker("virustotal", min_calls=2, open_seconds=30, clock=clock)
+    breaker.record(False, 1.0)
+    breaker.record(False, 1.0)
+    clock.now = 31
+    assert breaker.allow_request() is True
+
+    breaker.record(False, 1.0)
+
+    assert breaker.state == "open"
+    clock.now = 50
+    assert breaker.allow_request() is False
+
+
+def test_timeout_tracks_observed_p99_within_bounds() -> None:
+    breaker = AdapterCircuitBreaker("virustotal", window_size=100, min_calls=10, min_timeout_seconds=1.0)
+    assert breaker.timeout_seconds(20.0) == 20.0
+
+    for _ in range(99):
+        breaker.record(True, 1.0)
+    breaker.record(True, 4.0)
+
+    assert breaker.timeout_seconds(20.0) == 1.5
+    assert breaker.timeout_seconds(1.2) == 1.2
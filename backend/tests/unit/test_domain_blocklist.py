@@ -0,0 +1,86 @@
+import asyncio
+import os
+
+from app.cli.build_domain_blocklist import main
+from app.services.domain_blocklist_index import (
+    DomainBlocklistIndex,
+    build_domain_blocklist,
+    normalize_blocklist_entry,
+)
+from app.services.enrichment.domain_blocklist_client import DomainBlocklistClient
+from app.services.index_reloader import ReloadingIndex
+
+FEED = """
+# hosts-file export
+0.0.0.0 tracker.example
+127.0.0.1 localhost
+evil.example.org
+*.phish.example
+||ads.example.net^
+deep.evil.example.org
+bücher-phish.example
+"""
+
+
+def test_host_and_parent_domains_match(tmp_path) -> None:
+    stats = build_domain_blocklist(FEED.splitlines(), tmp_path / "block.idx")
+    index = DomainBlocklistIndex(tmp_path / "block.idx")
+
+    assert stats.domains == len(index) == 5
+    assert index.match("evil.example.org") == "evil.example.org"
+    assert index.match("a.b.deep.evil.example.org.") == "evil.example.org"
+    assert index.match("login.phish.example") == "phish.example"
+    assert index.match("xn--bcher-phish-thb.example") == "xn--bcher-phish-thb.example"
+    assert index.match("bücher-phish.example") == "xn--bcher-phish-thb.example"
+    assert index.match("example.org") is None
+    assert index.match("notevil.example.org") is None
+    assert index.match("localhost") is None
+
+
+def test_csv_rows_take_the_first_hostname_field() -> None:
+    assert normalize_blocklist_entry("domain,category") is None
+    assert normalize_blocklist_entry("evil.com,phishing") == "evil.com"
+    assert normalize_blocklist_entry('"evil.com","malware"') == "evil.com"
+    assert normalize_blocklist_entry("2026-01-01,malware,Evil.Com.") == "evil.com"
+
+
+def test_urls_ports_and_adblock_rules_are_reduced_to_hosts() -> None:
+    assert normalize_blocklist_entry("||evil.com^$third-party") == "evil.com"
+    assert normalize_blocklist_entry("https://evil.com/x?y=1") == "evil.com"
+    assert normalize_blocklist_entry("evil.com:443") == "evil.com"
+    for junk in ("ev_il.com", "evil!.com", "-evil.com", "@@||good.example^", "example.com##.ad", "! title", "10.0.0.1"):
+        assert normalize_blocklist_entry(junk) is None
+
+
+def test_client_checks_url_hosts_and_email_domains(tmp_path) -> None:
+    build_domain_blocklist(FEED.splitlines(), tmp_path / "block.idx")
+    client = DomainBlocklistClient(ReloadingIndex(tmp_path / "block.idx", DomainBlocklistIndex))
+
+    hit = asyncio.run(
+        client.enrich(["https://user@Login.Phish.Example:8443/x", "ceo@tracker.example"], "signal")
+    )
+    miss = asyncio.run(client.enrich(["https://example.com/"], "https://example.com/"))
+
+    assert hit["verdict"] == "malicious"
+    assert "2 of 2" in hit["summary"]
+    assert miss["verdict"] == "unknown"
+
+
+def test_rebuilt_blocklist_is_swapped_in(tmp_path, capsys) -> None:
+    feed = tmp_path / "feed.txt"
+    feed.write_text("old.example\n")
+    path = tmp_path / "block.idx"
+    main([str(feed), "-o", str(path)])
+    now = [0.0]
+    reloading = ReloadingIndex(path, DomainBlocklistIndex, check_interval_seconds=10, clock=lambda: now[0])
+
+    feed.write_text("new.example\n")
+    main([str(feed), "-o", str(path)])
+    os.utime(path, ns=(1, 1))
+    assert reloading.current.match("old.example") == "old.example"
+    now[0] = 11.0
+
+    assert reloading.current.match("new.example") == "new.example"
+    assert reloading.current.match("old.example") is None
+    assert reloading.reloads == 1
+    assert "1 domains" in capsys.readouterr().out
@@ -0,0 +1,154 @@
+import asyncio
+import io
+import json
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import LocalIndicator
+from app.services.feed_import_service import FeedImportService
+from app.services.feed_parsers import detect_feed_format
+from app.services.normalization_service import NormalizationService
+from app.utils.json_stream import ANY_ITEM, iter_json_array_items
+
+STIX_BUNDLE = {
+    "type": "bundle",
+    "id": "bundle--1",
+    "objects": [
+        {
+            "type": "indicator",
+            "spec_version": "2.1",
+            "pattern": "[ipv4-addr:value = '203.0.113.7'] OR [domain-name:value = 'Evil.Example.']",
+            "pattern_type": "stix",
+            "indicator_types": ["malicious-activity"],
+            "confidence": 90,
+            "labels": ["c2"],
+        },
+        {
+            "type": "indicator",
+            "pattern": "[file:hashes.'SHA-256' = '" + "AB" * 32 + "']",
+            "pattern_type": "stix",
+        },
+        {"type": "indicator", "pattern": "[url:value = 'http://revoked.example/x']", "revoked": True},
+        {"type": "indicator", "pattern": "alert tcp any any", "pattern_type": "snort"},
+        {"type": "url", "value": "HTTP://Phish.Example/login"},
+        {"type": "malware", "name": "not an indicator"},
+    ],
+}
+MISP_EXPORT = {
+    "response": [
+        {
+            "Event": {
+                "info": "campaign",
+                "Attribute": [
+                    {"type": "ip-dst|port", "value": "198.51.100.4|443", "to_ids": True},
+                    {"type": "url", "value": "https://drop.example/a", "to_ids": False},
+                    {"type": "comment", "value": "free text"},
+                    {"type": "domain", "value": "deleted.example", "deleted": True},
+                ],
+                "Object": [
+                    {
+                        "name": "file",
+                        "Attribute": [
+                            {"type": "filename|md5", "value": "x.exe|" + "c" * 32, "Tag": [{"name": "tlp:amber"}]}
+                        ],
+                    }
+                ],
+            }
+        }
+    ]
+}
+
+
+@pytest.fixture()
+def service(session_factory: sessionmaker) -> FeedImportService:
+    return FeedImportService(session_factory, NormalizationService(), batch_size=2)
+
+
+def stored(session_factory: sessionmaker) -> dict[tuple[str, str], LocalIndicator]:
+    with session_factory() as db:
+        return {(row.indicator_type, row.value): row for row in db.scalars(select(LocalIndicator))}
+
+
+def test_json_stream_yields_items_across_chunk_boundaries() -> None:
+    document = '{"n": 12345, "skip": [1, {"objects": [0]}], "objects": [{"a": "]"}, 3.5e2, -12, true]}'
+    for chunk_chars in (1, 3, 1024):
+        items = list(iter_json_array_items(io.StringIO(document), [("objects",)], chunk_chars=chunk_chars))
+        assert items == [{"a": "]"}, 350.0, -12, True]
+
+    nested = '[{"Event": {"Attribute": [1], "Object": [{"Attribute": [2]}]}}]'
+    paths = [(ANY_ITEM, "Event", "Attribute"), (ANY_ITEM, "Event", "Object", ANY_ITEM, "Attribute")]
+    assert list(iter_json_array_items(io.StringIO(nested), paths, chunk_chars=2)) == [1, 2]
+
+    with pytest.raises(ValueError):
+        list(iter_json_array_items(io.StringIO('{"objects": [1, 2'), [("objects",)]))
+
+
+def test_detect_feed_format() -> None:
+    assert detect_feed_format("feed.csv", b"{}") == "csv"
+    assert detect_feed_format(None, b'{"type": "bundle", "objects": []}') == "stix"
+    assert detect_feed_format(None, b'  {"Event": {}}') == "misp"
+    assert detect_feed_format(None, b"value,type\n1.2.3.4,ip\n") == "csv"
+    with pytest.raises(ValueError):
+        detect_feed_format(None, b'{"data": []}')
+
+
+def test_stix_bundle_import_normalizes_and_skips_revoked(service, session_factory) -> None:
+    result = service.import_feed(io.BytesIO(json.dumps(STIX_BUNDLE).encode()), "stix-feed")
+
+    assert result.feed_format == "stix"
+    assert (result.parsed, result.inserted, result.skipped) == (4, 4, 0)
+    rows = stored(session_factory)
+    assert set(rows) == {
+        ("ip_address", "203.0.113.7"),
+        ("domain", "evil.example"),
+        ("file_hash", "ab" * 32),
+        ("url", "http://phish.example/login"),
+    }
+    assert rows[("domain", "evil.example")].confidence == 90
+    assert rows[("domain", "evil.example")].tags == ["c2"]
+
+
+def test_misp_import_splits_composite_attributes(service, session_factory) -> None:
+    result = service.import_feed(io.BytesIO(json.dumps(MISP_EXPORT).encode()), "misp-feed")
+
+    assert result.feed_format == "misp"
+    rows = stored(session_factory)
+    assert set(rows) == {("ip_address", "198.51.100.4"), ("url", "https://drop.example/a"), ("file_hash", "c" * 32)}
+    assert rows[("url", "https://drop.example/a")].verdict == "suspicious"
+    assert rows[("file_hash", "c" * 32)].tags == ["tlp:amber"]
+
+
+def test_reimport_only_writes_changed_indicators(service, session_factory) -> None:
+    feed = "indicator,type,verdict,confidence\nevil.example,domain,malicious,90\n203.0.113.7,ip,,\nnot an ioc,,,\n"
+    first = service.import_feed(io.BytesIO(feed.encode()), "daily", file_name="daily.csv")
+    assert (first.inserted, first.updated, first.unchanged, first.skipped) == (2, 0, 0, 1)
+    assert first.indicators_per_second > 0
+
+    changed = feed.replace("malicious,90", "suspicious,60") + "https://new.example/,url,,\n"
+    second = service.import_feed(io.BytesIO(changed.encode()), "daily", file_name="daily.csv")
+    assert (second.inserted, second.updated, second.unchanged) == (1, 1, 1)
+
+    rows = stored(session_factory)
+    assert rows[("domain", "evil.example")].verdict == "suspicious"
+    assert rows[("domain", "evil.example")].import_id == second.import_id
+    assert rows[("ip_address", "203.0.113.7")].import_id == first.import_id
+
+    other_source = service.import_feed(io.BytesIO(feed.encode()), "weekly", file_name="weekly.csv")
+    assert other_source.inserted == 2
+
+
+def test_upload_import_enforces_size_limit(service) -> None:
+    service.max_feed_bytes = 16
+
+    async def body(*chunks: bytes):
+        for chunk in chunks:
+            yield chunk
+
+    result = asyncio.run(service.import_upload(body(b"198.51.100.9\n"), None, "upload"))
+    assert result.inserted == 1
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(service.import_upload(body(b"198.51.100.9\n", b"198.51.100.10\n"), None, "upload"))
+    assert exc_info.value.status_code == 413
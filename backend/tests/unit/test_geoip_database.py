@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.cli.build_geoip_db import iter_geoip_rows, main
+from app.services.enrichment.geoip_client import GeoIpClient
+from app.services.geoip_database import GeoIpDatabase, GeoIpRecord
+from app.services.index_reloader import ReloadingIndex
+
+ASN_CSV = """network,autonomous_system_number,autonomous_system_organization,country_iso_code
+198.51.100.0/24,64500,Example Transit,DE
+198.51.100.128/25,64501,Example Hosting,NL
+2001:db8::/32,64502,Example v6,US
+bogus,1,Broken,XX
+"""
+
+
+@pytest.fixture
+def database_path(tmp_path, capsys):
+    feed = tmp_path / "asn.csv"
+    feed.write_text(ASN_CSV)
+    path = tmp_path / "geo.db"
+    main([str(feed), "-o", str(path)])
+    assert "3 networks" in capsys.readouterr().out
+    return path
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_lookups_resolve_most_specific_network(database_path, use_numpy: bool) -> None:
+    database = GeoIpDatabase(database_path, use_numpy=use_numpy)
+    addresses = ["198.51.100.7", "198.51.100.200", "2001:db8:1::5", "203.0.113.1", "not-an-ip"]
+
+    batch = database.lookup_many(addresses)
+
+    assert (database._np_starts is not None) is use_numpy
+    assert batch == [
+        GeoIpRecord("DE", 64500, "Example Transit"),
+        GeoIpRecord("NL", 64501, "Example Hosting"),
+        GeoIpRecord("US", 64502, "Example v6"),
+        None,
+        None,
+    ]
+    assert [database.lookup(address) for address in addresses] == batch
+
+
+def test_csv_columns_are_matched_by_alias(tmp_path) -> None:
+    feed = tmp_path / "custom.csv"
+    feed.write_text("CIDR,Country,ASN,Org\n192.0.2.0/24,fr,AS64510,Example Labs\n")
+
+    rows = list(iter_geoip_rows([str(feed)]))
+
+    assert [(str(row[0]), *row[1:]) for row in rows] == [("192.0.2.0/24", "fr", 64510, "Example Labs")]
+
+
+def test_client_adds_context_for_each_address(database_path) -> None:
+    client = GeoIpClient(ReloadingIndex(database_path, GeoIpDatabase))
+
+    hit = asyncio.run(client.enrich(["198.51.100.7", "203.0.113.1"], "signal"))
+    batch = asyncio.run(client.enrich_many(["198.51.100.200", "203.0.113.1"]))
+
+    assert hit["verdict"] == "informational"
+    assert hit["summary"] == "198.51.100.7: DE, AS64500 (Example Transit)"
+    assert batch["198.51.100.200"]["summary"] == "198.51.100.200: NL, AS64501 (Example Hosting)"
+    assert batch["203.0.113.1"]["verdict"] == "unknown"
@@ -0,0 +1,24 @@
+import hashlib
+
+from app.utils.hashing import multi_digest_file, sha256_chunks
+
+
+def expected_digests(data: bytes) -> dict[str, str]:
+    return {name: hashlib.new(name, data).hexdigest() for name in ("md5", "sha1", "sha256")}
+
+
+def test_multi_digest_file_matches_hashlib_across_slices(tmp_path) -> None:
+    data = bytes(range(256)) * 1000
+    path = tmp_path / "sample.bin"
+    path.write_bytes(data)
+
+    assert multi_digest_file(path, slice_bytes=4096) == expected_digests(data)
+    assert multi_digest_file(path, ["sha256"]) == {"sha256": sha256_chunks([data])}
+
+
+def test_multi_digest_file_handles_empty_files(tmp_path) -> None:
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    assert multi_digest_file(path) == expected_digests(b"")
+
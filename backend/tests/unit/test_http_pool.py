@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import respx
+
+from app.schemas.artifact import ArtifactSubmissionResponse
+from app.schemas.report import ThreatReportResponse
+from app.schemas.scan import SourceHit
+from app.services.enrichment.virustotal_client import VirusTotalClient
+from app.services.http_pool import HttpClientPool
+from app.services.report_service import ReportService
+from app.utils.enums import ArtifactType, ThreatSeverity
+
+VT_BASE_URL = "https://vt.example.test/api/v3"
+
+
+def test_pool_reuses_one_client_per_host_and_counts_requests() -> None:
+    async def run() -> tuple[bool, bool, list[dict[str, object]]]:
+        pool = HttpClientPool(http2_enabled=False)
+        with respx.mock:
+            respx.get("https://a.example.test/one").mock(return_value=httpx.Response(200))
+            respx.get("https://a.example.test/two").mock(side_effect=httpx.ConnectError("down"))
+            await pool.request("source_a", "GET", "https://a.example.test/one")
+            try:
+                await pool.request("source_a", "GET", "https://a.example.test/two")
+            except httpx.ConnectError:
+                pass
+            same_host = pool.client_for("https://a.example.test/x") is pool.client_for("https://a.example.test/y")
+            other_host = pool.client_for("https://a.example.test") is pool.client_for("https://b.example.test")
+            stats = pool.stats()
+        await pool.close()
+        return same_host, other_host, stats
+
+    same_host, other_host, stats = asyncio.run(run())
+
+    assert same_host is True
+    assert other_host is False
+    assert stats[0]["name"] == "source_a"
+    assert stats[0]["host"] == "https://a.example.test"
+    assert (stats[0]["requests"], stats[0]["errors"], stats[0]["in_flight"]) == (2, 1, 0)
+
+
+def test_virustotal_client_queries_through_pool() -> None:
+    async def run() -> tuple[dict[str, object], str]:
+        pool = HttpClientPool(http2_enabled=False)
+        client = VirusTotalClient(api_key="secret", base_url=VT_BASE_URL, timeout_seconds=5, http_pool=pool)
+        with respx.mock:
+            route = respx.get(f"{VT_BASE_URL}/domains/evil.example").mock(
+                return_value=httpx.Response(
+                    200,
+                    json={
+                        "data": {
+                            "attributes": {
+                                "last_analysis_stats": {"malicious": 6, "suspicious": 2, "harmless": 2}
+                            }
+                        }
+                    },
+                )
+            )
+            result = await client.enrich(["help@evil.example"], "help@evil.example")
+            api_key = route.calls.last.request.headers["x-apikey"]
+        await pool.close()
+        return result, api_key
+
+    result, api_key = asyncio.run(run())
+
+    assert api_key == "secret"
+    assert result["verdict"] == "malicious"
+    assert result["confidence_score"] == 80
+
+
+def test_clean_virustotal_hit_does_not_produce_high_report() -> None:
+    async def run() -> tuple[dict[str, object], ThreatReportResponse]:
+        pool = HttpClientPool(http2_enabled=False)
+        client = VirusTotalClient(api_key="secret", base_url=VT_BASE_URL, timeout_seconds=5, http_pool=pool)
+        with respx.mock:
+            respx.get(f"{VT_BASE_URL}/domains/clean.example").mock(
+                return_value=httpx.Response(
+                    200,
+                    json={"data": {"attributes": {"last_analysis_stats": {"harmless": 70, "undetected": 20}}}},
+                )
+            )
+            result = await client.enrich(["clean.example"], "clean.example")
+        await pool.close()
+        artifact = ArtifactSubmissionResponse(
+            submission_id="submission-1",
+            workspace_id="demo-workspace",
+            artifact_type=ArtifactType.URL,
+            normalized_value="https://clean.example/",
+            created_at=datetime.now(timezone.utc),
+        )
+        report = await ReportService().build_report("scan-1", artifact, [SourceHit(**result)], None)
+        return result, report
+
+    result, report = asyncio.run(run())
+
+    assert result["verdict"] == "clean"
+    assert result["confidence_score"] == 0
+    assert report.severity is ThreatSeverity.LOW
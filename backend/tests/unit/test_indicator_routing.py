@@ -0,0 +1,36 @@
+from app.services.enrichment.routing import route_indicators
+from app.services.enrichment.source_a_client import SourceAClient
+from app.services.enrichment.source_b_client import SourceBClient
+from app.services.enrichment.virustotal_client import VirusTotalClient
+from app.utils.enums import IndicatorType
+from app.utils.indicator_tools import classify_indicator
+
+
+def test_classify_indicator() -> None:
+    assert classify_indicator("https://example.org/login") is IndicatorType.URL
+    assert classify_indicator("44d88612fea8a8f36de82e1278abb02f") is IndicatorType.FILE_HASH
+    assert classify_indicator("203.0.113.7") is IndicatorType.IP_ADDRESS
+    assert classify_indicator("help@evil.example") is IndicatorType.EMAIL_ADDRESS
+    assert classify_indicator("evil.example") is IndicatorType.DOMAIN
+    assert classify_indicator("urgent invoice") is IndicatorType.TEXT
+
+
+def test_email_signal_indicators_are_split_by_source_capability() -> None:
+    virustotal = VirusTotalClient(api_key="", base_url="https://example.test", timeout_seconds=5)
+    source_a = SourceAClient()
+    source_b = SourceBClient()
+    indicators = ["evil.example", "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"]
+
+    routes = route_indicators([virustotal, source_a, source_b], indicators)
+
+    assert [(adapter.name, routed) for adapter, routed in routes] == [
+        ("virustotal", indicators),
+        ("source_a", indicators[:1]),
+        ("source_b", indicators[1:]),
+    ]
+
+
+def test_adapters_without_applicable_indicators_are_skipped() -> None:
+    routes = route_indicators([SourceAClient(), SourceBClient()], ["urgent invoice"])
+
+    assert routes == []
@@ -0,0 +1,95 @@
+import hashlib
+import time
+
+from app.services.ioc_extraction_service import IocExtractionService
+from app.utils.enums import ArtifactType, IndicatorType
+
+
+def test_extracts_typed_indicators_in_first_seen_order() -> None:
+    text = (
+        "Reset at https://example.org/login, or mail help@evil.example. "
+        "Hash 44D88612FEA8A8F36DE82E1278ABB02F from 203.0.113.7 and 2001:db8::1; "
+        "again https://example.org/login and cdn.evil.example."
+    )
+
+    indicators = IocExtractionService().extract_typed(text)
+
+    assert [(indicator.value, indicator.indicator_type) for indicator in indicators] == [
+        ("https://example.org/login", IndicatorType.URL),
+        ("help@evil.example", IndicatorType.EMAIL_ADDRESS),
+        ("44d88612fea8a8f36de82e1278abb02f", IndicatorType.FILE_HASH),
+        ("203.0.113.7", IndicatorType.IP_ADDRESS),
+        ("2001:db8::1", IndicatorType.IP_ADDRESS),
+        ("cdn.evil.example", IndicatorType.DOMAIN),
+    ]
+
+
+def test_defanged_indicators_are_refanged() -> None:
+    text = "Do not open hxxps://bad[.]example/x or mail ops[at]bad[.]example from 198[.]51[.]100[.]4"
+
+    values = [indicator.value for indicator in IocExtractionService().extract_typed(text)]
+
+    assert values == ["https://bad.example/x", "ops@bad.example", "198.51.100.4"]
+
+
+def test_ignores_lookalikes() -> None:
+    text = "See invoice.pdf at 12:30:45, version 1.2.3.4.5, i.e. nothing, and 0.0.0.0/0."
+
+    assert IocExtractionService().extract_typed(text) == []
+
+
+def test_single_value_artifacts_are_their_own_indicator() -> None:
+    service = IocExtractionService()
+
+    assert service.extract(ArtifactType.URL, "https://example.org/") == ["https://example.org/"]
+    assert service.extract(ArtifactType.EMAIL_SIGNAL, "urgent wire transfer") == []
+
+
+def test_extraction_stays_linear_on_large_bodies() -> None:
+    service = IocExtractionService()
+    small = "lorem ipsum dolor sit amet visit evil.example today " * 2_000
+    large = small * 10
+
+    started = time.perf_counter()
+    service.extract_typed(small)
+    small_elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    service.extract_typed(large)
+    large_elapsed = time.perf_counter() - started
+
+    assert large_elapsed < small_elapsed * 30
+
+
+def test_stream_extraction_handles_chunk_boundaries_and_hashes_once() -> None:
+    body = "Forwarded: hxxps://bad[.]example/login from ops@evil.example at 203.0.113.7 — ünïcode\n".encode() * 50
+    expected = hashlib.sha256(body).hexdigest()
+
+    for chunk_size in (1, 7, 4096):
+        result = IocExtractionService().extract_stream(
+            body[offset : offset + chunk_size] for offset in range(0, len(body), chunk_size)
+        )
+
+        assert result.sha256 == expected
+        assert result.size_bytes == len(body)
+        assert [indicator.value for indicator in result.indicators] == [
+            "https://bad.example/login",
+            "ops@evil.example",
+            "203.0.113.7",
+        ]
+
+
+def test_stream_extraction_bounds_memory() -> None:
+    service = IocExtractionService(max_token_chars=64, max_indicators=3)
+    extractor = service.streaming_extractor()
+
+    extractor.feed(b"x" * 1000)
+    assert extractor._tail == ""
+    for index in range(10):
+        extractor.feed(f" host{index}.evil.example".encode())
+
+    assert [indicator.value for indicator in extractor.close()] == [
+        "host0.evil.example",
+        "host1.evil.example",
+        "host2.evil.example",
+    ]
+    assert extractor.truncated is True
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.services.enrichment.ip_range_client import IpRangeClient
+from app.services.ip_range_index import IpRangeIndex
+
+FEEDS = [
+    ("203.0.113.0/24", "cheap-hosting", "informational"),
+    ("203.0.113.64/26", "bulletproof", "suspicious"),
+    ("203.0.113.77/32", "c2", "malicious"),
+    ("2001:db8:abcd::/48", "tor-exit", "suspicious"),
+    ("not-a-network", "junk", "malicious"),
+]
+ADDRESSES = [
+    "203.0.113.5",
+    "203.0.113.70",
+    "203.0.113.77",
+    "203.0.113.78",
+    "203.0.113.200",
+    "198.51.100.1",
+    "2001:db8:abcd:12::1",
+    "::ffff:203.0.113.77",
+    "example.org",
+]
+EXPECTED = [
+    "cheap-hosting",
+    "bulletproof",
+    "c2",
+    "bulletproof",
+    "cheap-hosting",
+    None,
+    "tor-exit",
+    "c2",
+    None,
+]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_most_specific_range_wins_for_single_and_batch_lookups(use_numpy: bool) -> None:
+    index = IpRangeIndex(FEEDS, use_numpy=use_numpy)
+
+    batch = index.lookup_many(ADDRESSES)
+
+    assert (index._np_starts is not None) is use_numpy
+    assert index.networks == 4 and index.skipped == 1
+    assert [match.label if match else None for match in batch] == EXPECTED
+    assert [index.lookup(address) for address in ADDRESSES] == batch
+
+
+def test_csv_feeds_and_batch_adapter(tmp_path) -> None:
+    feed = tmp_path / "c2_ranges.csv"
+    feed.write_text("network,label,verdict\n# weekly export\n192.0.2.0/28,,malicious\n10.0.0.0/8,rfc1918,bogus\n")
+    client = IpRangeClient(IpRangeIndex.from_csv([feed]))
+
+    results = asyncio.run(client.enrich_many(["192.0.2.9", "10.1.2.3", "8.8.8.8"]))
+    single = asyncio.run(client.enrich(["8.8.8.8", "192.0.2.1"], "signal"))
+
+    assert results["192.0.2.9"]["verdict"] == "malicious"
+    assert "c2_ranges.csv" in results["192.0.2.9"]["summary"]
+    assert results["10.1.2.3"]["verdict"] == "suspicious"
+    assert results["8.8.8.8"]["verdict"] == "unknown"
+    assert single["verdict"] == "malicious"
+    assert "1 of 2" in single["summary"]
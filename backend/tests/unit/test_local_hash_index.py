@@ -0,0 +1,85 @@
+import asyncio
+import hashlib
+import io
+import os
+
+import pytest
+
+from app.cli.build_hash_index import iter_hashes, main
+from app.services.enrichment.local_hash_client import LocalHashClient
+from app.services.index_reloader import ReloadingIndex
+from app.services.local_hash_index import LocalHashIndex, build_local_hash_index
+
+
+def corpus(count: int) -> list[str]:
+    return [hashlib.sha256(str(index).encode()).hexdigest() for index in range(count)]
+
+
+def test_index_confirms_members_and_rejects_others(tmp_path) -> None:
+    hashes = corpus(5000) + [hashlib.md5(b"eicar").hexdigest(), hashlib.sha1(b"eicar").hexdigest()]
+    stats = build_local_hash_index(hashes + hashes[:10] + ["not-a-hash"], tmp_path / "bad.idx")
+    index = LocalHashIndex(tmp_path / "bad.idx")
+
+    assert stats.digests == len(index) == 5002
+    assert all(value in index for value in hashes)
+    assert hashes[0].upper() in index
+    misses = [hashlib.sha256(f"clean-{n}".encode()).hexdigest() for n in range(2000)]
+    assert not any(value in index for value in misses)
+    assert index.stats()["bloom_rejections"] >= 1990
+    assert "example.org" not in index
+    index.close()
+
+
+def test_empty_index_and_bad_files(tmp_path) -> None:
+    build_local_hash_index([], tmp_path / "empty.idx")
+    (tmp_path / "junk.idx").write_bytes(b"\0" * 128)
+
+    assert hashlib.sha256(b"x").hexdigest() not in LocalHashIndex(tmp_path / "empty.idx")
+    with pytest.raises(ValueError):
+        LocalHashIndex(tmp_path / "junk.idx")
+
+
+def test_csv_column_selection_and_cli(tmp_path, capsys) -> None:
+    known = corpus(3)
+    feed = tmp_path / "feed.csv"
+    feed.write_text("# exported feed\nfirst_seen,sha256,family\n" + "".join(f"2026-01-01,{value},emotet\n" for value in known))
+
+    assert list(iter_hashes(io.StringIO(feed.read_text()), "sha256")) == known
+    assert list(iter_hashes(io.StringIO(feed.read_text()))) == known
+    main([str(feed), "--column", "sha256", "-o", str(tmp_path / "feed.idx")])
+
+    assert "3 digests" in capsys.readouterr().out
+    client = LocalHashClient(ReloadingIndex(tmp_path / "feed.idx", LocalHashIndex))
+    hit = asyncio.run(client.enrich([known[1]], known[1]))
+    miss = asyncio.run(client.enrich([corpus(4)[3]], corpus(4)[3]))
+    assert (hit["verdict"], miss["verdict"]) == ("malicious", "unknown")
+
+
+def test_cli_indexes_every_digest_of_sample_files(tmp_path, capsys) -> None:
+    samples = tmp_path / "quarantine"
+    (samples / "nested").mkdir(parents=True)
+    (samples / "dropper.exe").write_bytes(b"MZ dropper")
+    (samples / "nested" / "loader.dll").write_bytes(b"MZ loader")
+    main(["--samples", str(samples), "-o", str(tmp_path / "samples.idx")])
+
+    assert "6 digests" in capsys.readouterr().out
+    index = LocalHashIndex(tmp_path / "samples.idx")
+    for data in (b"MZ dropper", b"MZ loader"):
+        assert all(hashlib.new(name, data).hexdigest() in index for name in ("md5", "sha1", "sha256"))
+    index.close()
+
+
+def test_client_picks_up_a_rebuilt_corpus(tmp_path) -> None:
+    old, new = corpus(2)
+    path = tmp_path / "bad.idx"
+    build_local_hash_index([old], path)
+    now = [0.0]
+    client = LocalHashClient(ReloadingIndex(path, LocalHashIndex, check_interval_seconds=10, clock=lambda: now[0]))
+
+    build_local_hash_index([new], path)
+    os.utime(path, ns=(1, 1))
+    assert asyncio.run(client.enrich([new], new))["verdict"] == "unknown"
+    now[0] = 11.0
+
+    assert asyncio.run(client.enrich([new], new))["verdict"] == "malicious"
+    assert asyncio.run(client.enrich([old], old))["verdict"] == "unknown"
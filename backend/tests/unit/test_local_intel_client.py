@@ -0,0 +1,39 @@
+import asyncio
+import io
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.services.enrichment.local_intel_client import LocalIntelClient
+from app.services.feed_import_service import FeedImportService
+from app.services.normalization_service import NormalizationService
+
+FEED_A = "indicator,type,verdict,confidence\nEvil.Example.,domain,suspicious,60\n203.0.113.7,ip,malicious,90\n"
+FEED_B = "indicator,type,verdict,confidence\nevil.example,domain,malicious,85\nbenign.example,domain,informational,10\n"
+
+
+@pytest.fixture()
+def intel_client(session_factory: sessionmaker) -> LocalIntelClient:
+    importer = FeedImportService(session_factory, NormalizationService())
+    importer.import_feed(io.BytesIO(FEED_A.encode()), "vendor-a", file_name="a.csv")
+    importer.import_feed(io.BytesIO(FEED_B.encode()), "vendor-b", file_name="b.csv")
+    return LocalIntelClient(session_factory, NormalizationService())
+
+
+def test_batch_lookup_returns_strongest_listing_per_indicator(intel_client) -> None:
+    results = asyncio.run(intel_client.enrich_many(["EVIL.example", "203.0.113.7", "benign.example", "other.example"]))
+
+    assert (results["EVIL.example"]["verdict"], results["EVIL.example"]["confidence_score"]) == ("malicious", 85)
+    assert "vendor-a, vendor-b" in results["EVIL.example"]["summary"]
+    assert results["203.0.113.7"]["verdict"] == "malicious"
+    assert results["benign.example"]["verdict"] == "unknown"
+    assert results["other.example"]["verdict"] == "unknown"
+
+
+def test_enrich_summarizes_several_indicators(intel_client) -> None:
+    hit = asyncio.run(intel_client.enrich(["help@other.example", "203.0.113.7"], "help@other.example"))
+    miss = asyncio.run(intel_client.enrich(["other.example"], "other.example"))
+
+    assert (hit["verdict"], hit["confidence_score"]) == ("malicious", 90)
+    assert hit["summary"] == "1 of 2 indicators are listed by local feeds."
+    assert miss["verdict"] == "unknown"
@@ -0,0 +1,57 @@
+import asyncio
+
+from app.services.micro_batcher import MicroBatcher
+from app.utils.enums import ScanPriority
+
+
+class RecordingDispatch:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[tuple[list[str], ScanPriority]] = []
+        self.fail = fail
+
+    async def __call__(self, indicators: list[str], priority: ScanPriority) -> dict[str, dict[str, object]]:
+        self.calls.append((indicators, priority))
+        if self.fail:
+            raise RuntimeError("bulk endpoint down")
+        return {indicator: {"indicator": indicator} for indicator in indicators if indicator != "missing.example"}
+
+
+def test_concurrent_lookups_share_one_bulk_call() -> None:
+    dispatch = RecordingDispatch()
+    batcher = MicroBatcher("source_a", dispatch, window_seconds=0.01)
+
+    async def run() -> list[list[object]]:
+        return await asyncio.gather(
+            batcher.lookup(["a.example", "b.example"], ScanPriority.BULK),
+            batcher.lookup(["b.example", "c.example"], ScanPriority.INTERACTIVE),
+            batcher.lookup(["missing.example"], ScanPriority.BULK),
+        )
+
+    first, second, third = asyncio.run(run())
+
+    assert dispatch.calls == [(["a.example", "b.example", "c.example", "missing.example"], ScanPriority.INTERACTIVE)]
+    assert first == [{"indicator": "a.example"}, {"indicator": "b.example"}]
+    assert second == [{"indicator": "b.example"}, {"indicator": "c.example"}]
+    assert isinstance(third[0], LookupError)
+
+
+def test_full_batches_flush_without_waiting_for_the_window() -> None:
+    dispatch = RecordingDispatch()
+    batcher = MicroBatcher("source_a", dispatch, window_seconds=10, max_batch_size=2)
+
+    results = asyncio.run(asyncio.wait_for(batcher.lookup(["a", "b", "c"]), timeout=1))
+
+    assert [indicators for indicators, _ in dispatch.calls] == [["a", "b"], ["c"]]
+    assert len(results) == 3
+    assert batcher.stats()["batches"] == 2
+
+
+def test_bulk_failures_reach_every_waiting_scan() -> None:
+    batcher = MicroBatcher("source_a", RecordingDispatch(fail=True), window_seconds=0.0)
+
+    async def run() -> list[list[object]]:
+        return await asyncio.gather(batcher.lookup(["a"]), batcher.lookup(["b"]))
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result[0], RuntimeError) for result in results)
@@ -0,0 +1,50 @@
+import asyncio
+
+from app.services.rate_limiter import EnrichmentRateLimiter, SourceRateLimiter
+from app.utils.enums import ScanPriority
+
+
+def test_interactive_calls_jump_ahead_of_queued_bulk_calls() -> None:
+    async def run() -> tuple[list[str], dict[str, object]]:
+        limiter = SourceRateLimiter("virustotal", requests_per_minute=600, requests_per_day=None)
+        for _ in range(600):
+            await limiter.acquire(ScanPriority.BULK)
+
+        order: list[str] = []
+
+        async def call(label: str, priority: ScanPriority) -> None:
+            await limiter.acquire(priority)
+            order.append(label)
+
+        bulk = [asyncio.create_task(call(f"bulk-{index}", ScanPriority.BULK)) for index in range(2)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(call("interactive", ScanPriority.INTERACTIVE))
+        await asyncio.gather(*bulk, interactive)
+        return order, limiter.stats()
+
+    order, stats = asyncio.run(run())
+
+    assert order[0] == "interactive"
+    assert stats["waiting"] == 0
+    assert stats["priorities"]["bulk"]["granted"] == 602
+    assert stats["priorities"]["interactive"]["wait_seconds_max"] > 0
+
+
+def test_daily_quota_limits_even_when_minute_bucket_is_full() -> None:
+    async def run() -> bool:
+        limiter = EnrichmentRateLimiter({"virustotal": (None, 2)})
+        await limiter.acquire("virustotal")
+        await limiter.acquire("virustotal")
+        try:
+            await asyncio.wait_for(limiter.acquire("virustotal"), timeout=0.1)
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    assert asyncio.run(run()) is True
+
+
+def test_sources_without_limits_are_never_delayed() -> None:
+    limiter = EnrichmentRateLimiter({})
+
+    assert asyncio.run(limiter.acquire("source_a")) == 0.0
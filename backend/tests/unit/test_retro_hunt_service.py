@@ -0,0 +1,105 @@
+import asyncio
+import io
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import RetroHuntMatch, ScanIndicator
+from app.schemas.scan import ScanJobCreateRequest
+from app.services.feed_import_service import FeedImportService
+from app.services.ioc_extraction_service import IocExtractionService
+from app.services.normalization_service import NormalizationService
+from app.services.retro_hunt_service import RetroHuntService
+from app.services.scan_job_queue import DatabaseScanJobQueue
+from app.worker import ScanWorker
+
+
+@pytest.fixture()
+def queue(session_factory: sessionmaker) -> DatabaseScanJobQueue:
+    return DatabaseScanJobQueue(
+        session_factory,
+        lease_seconds=60,
+        max_attempts=2,
+        ioc_extraction_service=IocExtractionService(),
+    )
+
+
+@pytest.fixture()
+def importer(session_factory: sessionmaker) -> FeedImportService:
+    return FeedImportService(session_factory, NormalizationService(), batch_size=2)
+
+
+@pytest.fixture()
+def retro_hunt(session_factory: sessionmaker) -> RetroHuntService:
+    return RetroHuntService(session_factory, batch_size=2)
+
+
+@pytest.fixture()
+def scan(queue: DatabaseScanJobQueue, build_orchestrator) -> Callable[[str, str], str]:
+    """Queue one artifact and run it through a worker so its report and index rows exist."""
+
+    def run(artifact_type: str, value: str) -> str:
+        payload = ScanJobCreateRequest.model_validate(
+            {"artifact": {"workspace_id": "demo-workspace", "artifact_type": artifact_type, "artifact_value": value}}
+        )
+        orchestrator = build_orchestrator()
+        job = orchestrator.create_job(payload)
+        scan_job_id = queue.enqueue(job, payload, orchestrator.coalesce_key(job)).scan_job_id
+        worker = ScanWorker(queue, build_orchestrator(), worker_id="worker-a", concurrency=1, poll_seconds=0.01)
+        assert asyncio.run(worker.run_once()) is True
+        return scan_job_id
+
+    return run
+
+
+def import_csv(importer: FeedImportService, text: str) -> str:
+    return importer.import_feed(io.BytesIO(text.encode()), "vendor-x", "csv").import_id
+
+
+def test_enqueue_indexes_artifact_iocs_and_url_hosts(scan, session_factory) -> None:
+    url_job = scan("url", "https://Login.Phish.example/verify")
+    email_job = scan("email_signal", "Reply to billing@pay.example or visit 198.51.100.23 today")
+
+    with session_factory() as db:
+        indexed = {(row.scan_job_id, row.indicator_type, row.value) for row in db.scalars(select(ScanIndicator))}
+    assert (url_job, "url", "https://login.phish.example/verify") in indexed
+    assert (url_job, "domain", "login.phish.example") in indexed
+    assert (email_job, "email_address", "billing@pay.example") in indexed
+    assert (email_job, "ip_address", "198.51.100.23") in indexed
+
+
+def test_new_intel_flags_matching_past_reports_once(scan, importer, queue, retro_hunt) -> None:
+    url_job = scan("url", "https://login.phish.example/verify")
+    clean_job = scan("url", "https://docs.example.org/")
+    report_before = queue.get_report(queue.get_job(url_job).report_id)
+
+    import_id = import_csv(importer, "value,verdict,confidence\nlogin.phish.example,malicious,95\n203.0.113.9,,\n")
+    result = retro_hunt.hunt(import_id)
+    assert (result.indicators_checked, result.matched_scans, result.flagged_reports) == (2, 1, 1)
+
+    report = queue.get_report(queue.get_job(url_job).report_id)
+    assert report.severity == "high"
+    assert report.confidence == max(report_before.confidence, 95)
+    assert report.source_summary[-1] == "Retro-hunt: login.phish.example is now listed as malicious by vendor-x."
+    clean_report = queue.get_report(queue.get_job(clean_job).report_id)
+    assert not any(line.startswith("Retro-hunt") for line in clean_report.source_summary)
+
+    assert retro_hunt.hunt(import_id).matched_scans == 0
+    assert len(queue.get_report(queue.get_job(url_job).report_id).source_summary) == len(report.source_summary)
+
+
+def test_hunt_only_reads_the_import_delta(scan, importer, retro_hunt, session_factory) -> None:
+    scan("url", "https://login.phish.example/verify")
+    feed = "value,verdict\nlogin.phish.example,suspicious\n"
+    first = import_csv(importer, feed)
+    assert retro_hunt.hunt(first).matched_scans == 1
+
+    unchanged = import_csv(importer, feed)
+    assert retro_hunt.hunt(unchanged).indicators_checked == 0
+
+    informational = import_csv(importer, "value,verdict\nlogin.phish.example,informational\n")
+    assert retro_hunt.hunt(informational).indicators_checked == 0
+    with session_factory() as db:
+        assert len(db.scalars(select(RetroHuntMatch)).all()) == 1
@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.scan import ScanJobCreateRequest, ScanJobResponse
+from app.services.scan_job_engine import ScanJobEngine
+from app.utils.enums import ScanPriority
+
+
+class SlowAdapter:
+    name = "source_a"
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.calls = 0
+
+    async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"source_name": self.name, "verdict": "clean", "confidence_score": 10, "summary": "ok"}
+
+
+@pytest.fixture()
+def build_engine(build_orchestrator) -> Callable[[float, int, int], ScanJobEngine]:
+    def build(delay: float, worker_count: int, queue_max_size: int) -> ScanJobEngine:
+        orchestrator = build_orchestrator([SlowAdapter(delay)])
+        return ScanJobEngine(orchestrator, worker_count=worker_count, queue_max_size=queue_max_size)
+
+    return build
+
+
+def url_payload(url: str = "https://example.org/login") -> ScanJobCreateRequest:
+    return ScanJobCreateRequest.model_validate(
+        {"artifact": {"workspace_id": "demo-workspace", "artifact_type": "url", "artifact_value": url}}
+    )
+
+
+def test_engine_drains_queue_through_status_transitions(build_engine) -> None:
+    async def run() -> tuple[str, str]:
+        engine = build_engine(0.05, worker_count=2, queue_max_size=10)
+        await engine.start()
+        queued = await engine.submit(url_payload())
+        await asyncio.sleep(0.01)
+        in_flight = (await engine.get_job(queued.scan_job_id)).status
+        await asyncio.sleep(0.2)
+        finished = (await engine.get_job(queued.scan_job_id)).status
+        await engine.stop()
+        return in_flight, finished
+
+    in_flight, finished = asyncio.run(run())
+
+    assert in_flight == "enriching"
+    assert finished == "completed"
+
+
+def test_full_queue_rejects_submission_and_stop_fails_waiting_jobs(build_engine) -> None:
+    async def run() -> tuple[int, list[str]]:
+        engine = build_engine(5.0, worker_count=1, queue_max_size=1)
+        await engine.start()
+        await engine.submit(url_payload("https://one.example.org"))
+        await asyncio.sleep(0.01)
+        await engine.submit(url_payload("https://two.example.org"))
+        try:
+            await engine.submit(url_payload("https://three.example.org"))
+        except HTTPException as exc:
+            status_code = exc.status_code
+        else:
+            raise AssertionError("Expected the full queue to reject the submission.")
+        await engine.stop()
+        return status_code, [job.status for job in await engine.list_jobs()]
+
+    status_code, statuses = asyncio.run(run())
+
+    assert status_code == 503
+    assert statuses == ["failed", "failed"]
+
+
+def test_identical_in_flight_submissions_share_one_pipeline(build_engine) -> None:
+    async def run() -> tuple[ScanJobEngine, list[ScanJobResponse]]:
+        engine = build_engine(0.05, worker_count=4, queue_max_size=10)
+        await engine.start()
+        submitted = [await engine.submit(url_payload("https://campaign.example.org")) for _ in range(50)]
+        await asyncio.sleep(0.2)
+        jobs = [await engine.get_job(job.scan_job_id) for job in submitted]
+        await engine.stop()
+        return engine, jobs
+
+    engine, jobs = asyncio.run(run())
+
+    assert engine.orchestrator.enrichment_adapters[0].calls == 1
+    assert len({job.scan_job_id for job in jobs}) == 50
+    assert {job.status for job in jobs} == {"completed"}
+    assert len({job.report_id for job in jobs}) == 1
+    assert {job.coalesced_with for job in jobs[1:]} == {jobs[0].scan_job_id}
+
+
+def test_batch_larger_than_queue_waits_for_space(build_engine) -> None:
+    async def run() -> tuple[int, list[str]]:
+        engine = build_engine(0.0, worker_count=2, queue_max_size=2)
+        await engine.start()
+        batch = await engine.submit_batch([url_payload(f"https://ioc-{index}.example.org") for index in range(10)])
+        await asyncio.sleep(0.1)
+        statuses = [(await engine.get_job(job.scan_job_id)).status for job in batch.jobs]
+        await engine.stop()
+        return batch.unique_count, statuses
+
+    unique_count, statuses = asyncio.run(run())
+
+    assert unique_count == 10
+    assert set(statuses) == {"completed"}
+
+
+def test_interactive_jobs_are_dequeued_before_bulk_jobs(build_engine) -> None:
+    async def run() -> tuple[list[str], list[str]]:
+        engine = build_engine(0.05, worker_count=1, queue_max_size=10)
+        await engine.start()
+        await engine.submit(url_payload("https://busy.example.org"))
+        await asyncio.sleep(0.01)
+        bulk = await engine.submit(
+            url_payload("https://bulk.example.org").model_copy(update={"priority": ScanPriority.BULK})
+        )
+        interactive = await engine.submit(url_payload("https://interactive.example.org"))
+        await asyncio.sleep(0.3)
+        finished = sorted(
+            [await engine.get_job(bulk.scan_job_id), await engine.get_job(interactive.scan_job_id)],
+            key=lambda job: job.completed_at,
+        )
+        await engine.stop()
+        return [job.scan_job_id for job in finished], [bulk.scan_job_id, interactive.scan_job_id]
+
+    finished, (bulk_id, interactive_id) = asyncio.run(run())
+
+    assert finished == [interactive_id, bulk_id]
@@ -0,0 +1,196 @@
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.models import ScanJob
+from app.schemas.scan import FileScanJobRequest, ScanJobCreateRequest
+from app.services.scan_job_queue import ClaimedScanJob, DatabaseScanJobQueue
+from app.worker import ScanWorker
+
+
+@pytest.fixture()
+def queue(session_factory: sessionmaker) -> DatabaseScanJobQueue:
+    return DatabaseScanJobQueue(session_factory, lease_seconds=60, max_attempts=2)
+
+
+@pytest.fixture()
+def enqueue_url(queue: DatabaseScanJobQueue, build_orchestrator) -> Callable[[str], str]:
+    def enqueue(url: str) -> str:
+        payload = ScanJobCreateRequest.model_validate(
+            {"artifact": {"workspace_id": "demo-workspace", "artifact_type": "url", "artifact_value": url}}
+        )
+        orchestrator = build_orchestrator()
+        job = orchestrator.create_job(payload)
+        return queue.enqueue(job, payload, orchestrator.coalesce_key(job)).scan_job_id
+
+    return enqueue
+
+
+def test_claimed_job_is_invisible_to_other_workers_until_lease_expires(enqueue_url, queue, session_factory) -> None:
+    scan_job_id = enqueue_url("https://claim.example.org")
+
+    first = queue.claim("worker-a")
+    assert first is not None
+    assert first.job.scan_job_id == scan_job_id
+    assert queue.claim("worker-b") is None
+
+    with session_factory() as db:
+        db.execute(
+            update(ScanJob).values(lease_expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        db.commit()
+
+    second = queue.claim("worker-b")
+    assert second is not None
+    assert queue.save_snapshot(first.job, "worker-a") is False
+    assert queue.save_snapshot(second.job, "worker-b") is True
+
+
+def test_claim_restores_child_indicators_only_for_upload_payloads(build_orchestrator, enqueue_url, queue) -> None:
+    enqueue_url("https://plain.example.org")
+    payload = FileScanJobRequest.model_validate(
+        {
+            "artifact": {"workspace_id": "demo-workspace", "artifact_type": "file", "artifact_value": "c" * 64},
+            "child_indicators": ["d" * 64],
+        }
+    )
+    orchestrator = build_orchestrator()
+    job = orchestrator.create_job(payload)
+    queue.enqueue(job, payload, orchestrator.coalesce_key(job))
+
+    plain = queue.claim("worker-a")
+    upload = queue.claim("worker-a")
+
+    assert type(plain.payload) is ScanJobCreateRequest
+    assert isinstance(upload.payload, FileScanJobRequest)
+    assert upload.payload.child_indicators == ["d" * 64]
+
+
+def test_worker_runs_claimed_job_and_persists_report(build_orchestrator, enqueue_url, queue) -> None:
+    scan_job_id = enqueue_url("https://worker.example.org")
+    worker = ScanWorker(
+        queue=queue,
+        orchestrator=build_orchestrator(),
+        worker_id="worker-a",
+        concurrency=1,
+        poll_seconds=0.01,
+    )
+
+    assert asyncio.run(worker.run_once()) is True
+    assert asyncio.run(worker.run_once()) is False
+
+    job = queue.get_job(scan_job_id)
+    assert job.status == "completed"
+    assert [hit.source_name for hit in job.sources] == ["source_b"]
+    report = queue.get_report(job.report_id)
+    assert report is not None
+    assert report.scan_job_id == scan_job_id
+
+
+def test_identical_jobs_share_one_claim_and_one_report(build_orchestrator, enqueue_url, queue) -> None:
+    leader_id = enqueue_url("https://campaign.example.org")
+    follower_id = enqueue_url("https://campaign.example.org")
+    assert queue.get_job(follower_id).coalesced_with == leader_id
+
+    worker = ScanWorker(
+        queue=queue,
+        orchestrator=build_orchestrator(),
+        worker_id="worker-a",
+        concurrency=1,
+        poll_seconds=0.01,
+    )
+    assert asyncio.run(worker.run_once()) is True
+    assert asyncio.run(worker.run_once()) is False
+
+    leader = queue.get_job(leader_id)
+    follower = queue.get_job(follower_id)
+    assert follower.status == "completed"
+    assert follower.report_id == leader.report_id
+    assert follower.sources == leader.sources
+
+
+class HangingAdapter:
+    name = "source_b"
+
+    async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
+        await asyncio.sleep(5)
+        return {"source_name": self.name, "verdict": "clean", "confidence_score": 0, "summary": "Late."}
+
+
+def test_worker_abandons_job_when_its_lease_is_taken_over(
+    build_orchestrator, enqueue_url, queue, session_factory
+) -> None:
+    scan_job_id = enqueue_url("https://stolen.example.org")
+    orchestrator = build_orchestrator()
+    orchestrator.enrichment_adapters = [HangingAdapter()]
+    worker = ScanWorker(queue=queue, orchestrator=orchestrator, worker_id="worker-a", concurrency=1, poll_seconds=0.01)
+
+    async def run() -> None:
+        claimed = await asyncio.to_thread(queue.claim, "worker-a")
+        assert claimed is not None
+        with session_factory() as db:
+            db.execute(update(ScanJob).values(lease_owner="worker-b"))
+            db.commit()
+        await worker._execute(claimed)
+
+    started = time.perf_counter()
+    asyncio.run(run())
+
+    assert time.perf_counter() - started < 1.0
+    assert queue.get_job(scan_job_id).status == "queued"
+    with session_factory() as db:
+        assert db.get(ScanJob, scan_job_id).lease_owner == "worker-b"
+
+
+class FlakyQueue(DatabaseScanJobQueue):
+    """Database queue whose first claim and first snapshot write fail like a dropped connection."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.claim_failures = 1
+        self.save_failures = 1
+        self.idle_polls = 0
+
+    def claim(self, worker_id: str) -> ClaimedScanJob | None:
+        if self.claim_failures:
+            self.claim_failures -= 1
+            raise OperationalError("SELECT", {}, Exception("connection reset"))
+        return super().claim(worker_id)
+
+    def save_snapshot(self, *args: object, **kwargs: object) -> bool:
+        if self.save_failures:
+            self.save_failures -= 1
+            raise OperationalError("UPDATE", {}, Exception("connection reset"))
+        return super().save_snapshot(*args, **kwargs)
+
+    def fail_exhausted(self) -> int:
+        self.idle_polls += 1
+        return super().fail_exhausted()
+
+
+def test_worker_survives_transient_queue_errors(build_orchestrator, enqueue_url, session_factory) -> None:
+    scan_job_id = enqueue_url("https://flaky.example.org")
+    flaky = FlakyQueue(session_factory, lease_seconds=60, max_attempts=2)
+    worker = ScanWorker(flaky, build_orchestrator(), worker_id="worker-a", concurrency=1, poll_seconds=0.01)
+
+    async def run() -> None:
+        loop = asyncio.create_task(worker._claim_loop())
+        # The loop only polls an empty queue once the job and its snapshot writes have finished.
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if flaky.idle_polls:
+                break
+        assert not loop.done()
+        loop.cancel()
+
+    asyncio.run(run())
+
+    assert flaky.claim_failures == 0
+    assert flaky.save_failures == 0
+    assert flaky.get_job(scan_job_id).status == "completed"
@@ -0,0 +1,346 @@
+import asyncio
+import time
+
+from app.schemas.scan import FileScanJobRequest, ScanJobCreateRequest
+from app.services.circuit_breaker import CircuitBreakerRegistry
+from app.utils.enums import IndicatorType, ScanPriority
+
+
+class SleepyAdapter:
+    def __init__(self, name: str, delay: float, fail: bool = False) -> None:
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+
+    async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream exploded")
+        return {
+            "source_name": self.name,
+            "verdict": "suspicious",
+            "confidence_score": 70,
+            "summary": f"{self.name} answered.",
+        }
+
+
+def url_payload(
+    url: str = "https://example.org/login",
+    ai_mode: str = "off",
+    artifact_type: str = "url",
+) -> ScanJobCreateRequest:
+    return ScanJobCreateRequest.model_validate(
+        {
+            "artifact": {
+                "workspace_id": "demo-workspace",
+                "artifact_type": artifact_type,
+                "artifact_value": url,
+            },
+            "ai_mode": ai_mode,
+        }
+    )
+
+
+def test_adapters_run_concurrently(build_orchestrator) -> None:
+    orchestrator = build_orchestrator([SleepyAdapter(f"source_{index}", 0.2) for index in range(4)])
+
+    started = time.perf_counter()
+    job = asyncio.run(orchestrator.start_scan(url_payload()))
+    elapsed = time.perf_counter() - started
+
+    assert [hit.source_name for hit in job.sources] == ["source_0", "source_1", "source_2", "source_3"]
+    assert elapsed < 0.6
+
+
+def test_slow_and_failing_adapters_become_degraded_hits(build_orchestrator) -> None:
+    orchestrator = build_orchestrator(
+        [
+            SleepyAdapter("fast", 0.0),
+            SleepyAdapter("slow", 5.0),
+            SleepyAdapter("broken", 0.0, fail=True),
+        ],
+        adapter_timeouts={"slow": 0.1},
+    )
+
+    job = asyncio.run(orchestrator.start_scan(url_payload()))
+    hits = {hit.source_name: hit for hit in job.sources}
+
+    assert job.status == "completed"
+    assert hits["fast"].degraded is False
+    assert hits["slow"].degraded is True
+    assert hits["slow"].verdict == "unavailable"
+    assert hits["broken"].degraded is True
+
+
+def test_scan_deadline_caps_total_enrichment_time(build_orchestrator) -> None:
+    orchestrator = build_orchestrator(
+        [SleepyAdapter("fast", 0.0), SleepyAdapter("slow", 5.0)],
+        enrichment_deadline_seconds=0.1,
+    )
+
+    started = time.perf_counter()
+    job = asyncio.run(orchestrator.start_scan(url_payload()))
+
+    assert time.perf_counter() - started < 1.0
+    assert [hit.degraded for hit in job.sources] == [False, True]
+
+
+class CountingAdapter:
+    name = "virustotal"
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
+        self.calls.extend(indicators)
+        return {
+            "source_name": self.name,
+            "verdict": "observed",
+            "confidence_score": 40 + len(self.calls),
+            "summary": f"Looked up {artifact_value}.",
+        }
+
+
+def test_enrichment_cache_is_shared_across_ai_modes(build_orchestrator) -> None:
+    adapter = CountingAdapter()
+    orchestrator = build_orchestrator([adapter])
+
+    first = asyncio.run(orchestrator.start_scan(url_payload(ai_mode="local")))
+    second = asyncio.run(orchestrator.start_scan(url_payload(ai_mode="api")))
+
+    assert first.scan_job_id != second.scan_job_id
+    assert adapter.calls == ["https://example.org/login"]
+    assert second.sources[0].summary == first.sources[0].summary
+
+
+def test_email_signal_only_queries_new_indicators(build_orchestrator) -> None:
+    adapter = CountingAdapter()
+    orchestrator = build_orchestrator([adapter])
+    asyncio.run(orchestrator.start_scan(url_payload()))
+
+    job = asyncio.run(
+        orchestrator.start_scan(
+            url_payload(
+                "Reset at https://example.org/login or mail help@evil.example",
+                artifact_type="email_signal",
+            )
+        )
+    )
+
+    assert adapter.calls == ["https://example.org/login", "help@evil.example"]
+    assert "strongest of 2 indicators" in job.sources[0].summary
+
+
+class MixedVerdictAdapter:
+    name = "source_a"
+
+    async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
+        if "evil.example" in artifact_value:
+            return {"source_name": self.name, "verdict": "malicious", "confidence_score": 60, "summary": "Bad."}
+        return {"source_name": self.name, "verdict": "clean", "confidence_score": 95, "summary": "Fine."}
+
+
+def test_most_severe_verdict_wins_over_higher_confidence(build_orchestrator) -> None:
+    orchestrator = build_orchestrator([MixedVerdictAdapter()])
+
+    job = asyncio.run(
+        orchestrator.start_scan(
+            url_payload(
+                "Reset at https://example.org/login or mail help@evil.example",
+                artifact_type="email_signal",
+            )
+        )
+    )
+
+    assert job.sources[0].verdict == "malicious"
+    assert job.sources[0].confidence_score == 60
+
+
+def test_failed_lookups_are_not_cached(build_orchestrator) -> None:
+    broken = SleepyAdapter("broken", 0.0, fail=True)
+    orchestrator = build_orchestrator([broken])
+
+    asyncio.run(orchestrator.start_scan(url_payload()))
+
+    assert orchestrator.caching_service.get_enrichment("broken", "https://example.org/login") is None
+
+
+def test_open_circuit_skips_adapter_until_probe_window(build_orchestrator) -> None:
+    broken = SleepyAdapter("broken", 0.0, fail=True)
+    orchestrator = build_orchestrator(
+        [broken],
+        circuit_breakers=CircuitBreakerRegistry(min_calls=2, open_seconds=60),
+    )
+
+    for index in range(3):
+        job = asyncio.run(orchestrator.start_scan(url_payload(f"https://outage-{index}.example.org")))
+
+    assert job.sources[0].degraded is True
+    assert "circuit open" in job.sources[0].summary
+    assert orchestrator.circuit_breakers.for_adapter("broken").state == "open"
+
+
+class VerdictAdapter:
+    def __init__(self, name: str, delay: float, verdict: str, confidence_score: int) -> None:
+        self.name = name
+        self.delay = delay
+        self.verdict = verdict
+        self.confidence_score = confidence_score
+
+    async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
+        await asyncio.sleep(self.delay)
+        return {
+            "source_name": self.name,
+            "verdict": self.verdict,
+            "confidence_score": self.confidence_score,
+            "summary": f"{self.name} says {self.verdict}.",
+        }
+
+
+def test_confident_verdicts_exit_early_and_backfill_late_sources(build_orchestrator) -> None:
+    orchestrator = build_orchestrator(
+        [
+            VerdictAdapter("first", 0.0, "malicious", 95),
+            VerdictAdapter("second", 0.0, "malicious", 90),
+            VerdictAdapter("slow", 0.3, "clean", 10),
+        ],
+        early_exit_min_sources=2,
+    )
+
+    async def scenario() -> tuple[object, object, float]:
+        started = time.perf_counter()
+        job = await orchestrator.start_scan(url_payload())
+        elapsed = time.perf_counter() - started
+        await orchestrator.wait_for_backfill(job.scan_job_id)
+        return job, orchestrator.get_job(job.scan_job_id), elapsed
+
+    job, backfilled, elapsed = asyncio.run(scenario())
+
+    assert elapsed < 0.2
+    assert job.backfill_pending is True
+    assert [hit.verdict for hit in job.sources] == ["malicious", "malicious", "pending"]
+    assert backfilled.backfill_pending is False
+    assert [hit.verdict for hit in backfilled.sources] == ["malicious", "malicious", "clean"]
+    report = orchestrator.report_service.get_report(backfilled.report_id)
+    assert report.source_summary[-1] == "slow says clean."
+
+
+def test_bulk_scans_wait_for_every_source(build_orchestrator) -> None:
+    orchestrator = build_orchestrator(
+        [VerdictAdapter("first", 0.0, "malicious", 95), VerdictAdapter("slow", 0.1, "clean", 10)],
+        early_exit_min_sources=1,
+    )
+    payload = url_payload().model_copy(update={"priority": ScanPriority.BULK})
+
+    job = asyncio.run(orchestrator.start_scan(payload))
+
+    assert job.backfill_pending is False
+    assert [hit.verdict for hit in job.sources] == ["malicious", "clean"]
+
+
+def test_hash_scans_skip_adapters_that_cannot_look_up_hashes(build_orchestrator) -> None:
+    hash_only = CountingAdapter()
+    hash_only.supported_indicator_types = frozenset({IndicatorType.FILE_HASH})
+    domains_only = CountingAdapter()
+    domains_only.name = "domains"
+    domains_only.supported_indicator_types = frozenset({IndicatorType.DOMAIN})
+    orchestrator = build_orchestrator([hash_only, domains_only])
+
+    job = asyncio.run(
+        orchestrator.start_scan(url_payload("44d88612fea8a8f36de82e1278abb02f", artifact_type="hash"))
+    )
+
+    assert [hit.source_name for hit in job.sources] == ["virustotal"]
+    assert domains_only.calls == []
+
+
+def test_child_indicators_are_enriched_with_the_parent_file(build_orchestrator) -> None:
+    adapter = CountingAdapter()
+    orchestrator = build_orchestrator([adapter])
+    member_hash = "a" * 64
+    payload = FileScanJobRequest(
+        **url_payload("b" * 64, artifact_type="file").model_dump(),
+        child_indicators=[member_hash, "evil.example"],
+    )
+
+    asyncio.run(orchestrator.start_scan(payload))
+
+    assert adapter.calls == ["b" * 64, member_hash, "evil.example"]
+
+
+def test_public_scan_request_drops_client_sent_child_indicators(build_orchestrator) -> None:
+    adapter = CountingAdapter()
+    orchestrator = build_orchestrator([adapter])
+    payload = ScanJobCreateRequest.model_validate(
+        {**url_payload("b" * 64, artifact_type="file").model_dump(), "child_indicators": ["evil.example"]}
+    )
+
+    asyncio.run(orchestrator.start_scan(payload))
+
+    assert not hasattr(payload, "child_indicators")
+    assert adapter.calls == ["b" * 64]
+
+
+class BulkAdapter:
+    name = "bulk_source"
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def enrich(self, indicators: list[str], artifact_value: str) -> dict[str, object]:
+        raise AssertionError("bulk adapters should be called through enrich_many")
+
+    async def enrich_many(self, indicators: list[str]) -> dict[str, dict[str, object]]:
+        self.batches.append(indicators)
+        return {
+            indicator: {
+                "source_name": self.name,
+                "verdict": "observed",
+                "confidence_score": 50,
+                "summary": f"Bulk lookup of {indicator}.",
+            }
+            for indicator in indicators
+        }
+
+
+def test_concurrent_scans_share_bulk_lookups(build_orchestrator) -> None:
+    adapter = BulkAdapter()
+    orchestrator = build_orchestrator([adapter], batch_window_seconds=0.02)
+
+    async def run() -> list[object]:
+        return await asyncio.gather(
+            *(orchestrator.start_scan(url_payload(f"https://example.org/{index}")) for index in range(10))
+        )
+
+    jobs = asyncio.run(run())
+
+    assert len(adapter.batches) == 1
+    assert len(adapter.batches[0]) == 10
+    assert all(job.sources[0].summary.startswith("Bulk lookup of https://example.org/") for job in jobs)
+
+
+def test_breaker_times_bulk_calls_without_the_batch_window(build_orchestrator) -> None:
+    orchestrator = build_orchestrator(
+        [BulkAdapter()],
+        batch_window_seconds=0.2,
+        circuit_breakers=CircuitBreakerRegistry(),
+    )
+
+    asyncio.run(orchestrator.start_scan(url_payload()))
+
+    breaker = orchestrator.circuit_breakers.for_adapter("bulk_source")
+    assert breaker.stats()["calls"] == 1
+    assert breaker.latency_percentile(0.99) < 0.1
+
+
+def test_deadline_cancellation_is_not_an_adapter_failure(build_orchestrator) -> None:
+    orchestrator = build_orchestrator(
+        [SleepyAdapter("slow", 5.0)],
+        enrichment_deadline_seconds=0.05,
+        circuit_breakers=CircuitBreakerRegistry(),
+    )
+
+    job = asyncio.run(orchestrator.start_scan(url_payload()))
+
+    assert job.sources[0].degraded is True
+    assert orchestrator.circuit_breakers.for_adapter("slow").stats()["calls"] == 0
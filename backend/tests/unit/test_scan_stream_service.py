@@ -0,0 +1,50 @@
+import asyncio
+import json
+
+from app.services.scan_job_engine import ScanJobEngine
+from app.services.scan_stream_service import ScanStreamService, iter_ndjson_lines
+from app.utils.enums import AiMode
+
+
+async def chunked(parts: list[bytes]):
+    for part in parts:
+        yield part
+
+
+def collect_lines(parts: list[bytes], max_line_bytes: int) -> list[tuple[int, bytes | None]]:
+    async def run() -> list[tuple[int, bytes | None]]:
+        return [item async for item in iter_ndjson_lines(chunked(parts), max_line_bytes)]
+
+    return asyncio.run(run())
+
+
+def test_lines_split_across_chunks_and_oversized_lines_are_dropped() -> None:
+    lines = collect_lines([b"ab", b"c\n\nde", b"f\n0123456789abc\nxy"], max_line_bytes=10)
+
+    assert lines == [(1, b"abc"), (3, b"def"), (4, None), (5, b"xy")]
+
+
+def test_ingest_streams_one_result_per_artifact_line(build_orchestrator) -> None:
+    artifact = {"workspace_id": "demo-workspace", "artifact_type": "url"}
+    body = b"".join(
+        [
+            json.dumps({**artifact, "artifact_value": "https://one.example.org"}).encode() + b"\n",
+            b"not json\n",
+            json.dumps({**artifact, "artifact_value": "https://two.example.org"}).encode() + b"\n",
+        ]
+    )
+
+    async def run() -> list[dict[str, object]]:
+        engine = ScanJobEngine(build_orchestrator([]), worker_count=1, queue_max_size=1)
+        await engine.start()
+        service = ScanStreamService(engine, batch_size=1)
+        output = b"".join([chunk async for chunk in service.ingest(chunked([body[:30], body[30:]]), AiMode.OFF)])
+        await engine.stop()
+        return [json.loads(line) for line in output.splitlines()]
+
+    results = asyncio.run(run())
+
+    assert [result["line"] for result in results] == [1, 2, 3]
+    assert "scan_job_id" in results[0]
+    assert "error" in results[1]
+    assert "scan_job_id" in results[2]
@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+import io
+import zipfile
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.archive_service import ArchiveService
+from app.services.ioc_extraction_service import IocExtractionService
+from app.services.scan_job_engine import ScanJobEngine
+from app.services.upload_scan_service import UploadScanService
+from app.utils.enums import AiMode, ArtifactType
+from app.utils.hashing import MultiDigest
+
+BOUNDARY = "cyberguardboundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def multipart_body(file_bytes: bytes, file_name: str = "mail.log") -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="note"\r\n\r\n'
+        "ignored field\r\n"
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{file_name}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode() + file_bytes + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+async def chunked(body: bytes, size: int, consumed: list[int] | None = None):
+    for offset in range(0, len(body), size):
+        if consumed is not None:
+            consumed.append(offset + size)
+        yield body[offset : offset + size]
+
+
+@pytest.fixture()
+def run_upload(build_orchestrator):
+    def upload(body: bytes, chunk_size: int, consumed: list[int] | None = None, **service_kwargs: object):
+        async def run():
+            engine = ScanJobEngine(build_orchestrator([]), worker_count=1, queue_max_size=10)
+            await engine.start()
+            service = UploadScanService(engine, IocExtractionService(), **service_kwargs)
+            try:
+                return await service.scan_upload(
+                    CONTENT_TYPE,
+                    None,
+                    chunked(body, chunk_size, consumed),
+                    "demo-workspace",
+                    AiMode.OFF,
+                )
+            finally:
+                await engine.stop()
+
+        return asyncio.run(run())
+
+    return upload
+
+
+def test_upload_is_hashed_while_received_and_spooled_to_disk(run_upload) -> None:
+    file_bytes = b"Received from 203.0.113.7 via hxxp://bad[.]example/drop\n" * 200
+
+    result = run_upload(multipart_body(file_bytes), chunk_size=333, spool_threshold_bytes=1024)
+
+    assert result.sha256 == hashlib.sha256(file_bytes).hexdigest()
+    assert result.md5 == hashlib.md5(file_bytes).hexdigest()
+    assert result.sha1 == hashlib.sha1(file_bytes).hexdigest()
+    assert result.size_bytes == len(file_bytes)
+    assert result.spooled_to_disk is True
+    assert result.file_name == "mail.log"
+    assert result.job.artifact.artifact_type is ArtifactType.FILE
+    assert result.job.artifact.normalized_value == result.sha256
+    assert [indicator.value for indicator in result.indicators] == ["203.0.113.7", "http://bad.example/drop"]
+
+
+def test_archive_upload_queues_scan_with_member_hashes_as_child_indicators(run_upload) -> None:
+    member = b"open hxxps://cdn[.]evil.example/a.js now"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("lure.html", member)
+
+    result = run_upload(
+        multipart_body(buffer.getvalue(), "lure.zip"),
+        chunk_size=100,
+        archive_service=ArchiveService(IocExtractionService()),
+    )
+
+    assert result.job.artifact.normalized_value == hashlib.sha256(buffer.getvalue()).hexdigest()
+    assert [item.path for item in result.archive_members] == ["lure.zip/lure.html"]
+    assert result.archive_members[0].sha256 == hashlib.sha256(member).hexdigest()
+    assert [item.value for item in result.indicators] == ["https://cdn.evil.example/a.js"]
+
+
+def test_size_limit_is_enforced_before_the_body_is_read(run_upload) -> None:
+    body = multipart_body(b"x" * 50_000)
+    consumed: list[int] = []
+
+    with pytest.raises(HTTPException) as error:
+        run_upload(body, chunk_size=1000, max_upload_bytes=10_000, consumed=consumed)
+
+    assert error.value.status_code == 413
+    assert consumed[-1] < len(body) // 2
+
+
+def test_non_multipart_bodies_are_rejected() -> None:
+    service = UploadScanService(engine=None, ioc_extraction_service=IocExtractionService())
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(service.scan_upload("application/json", None, chunked(b"{}", 2), "demo-workspace", AiMode.OFF))
+
+    assert error.value.status_code == 415
+
+
+def test_multi_digest_matches_hashlib() -> None:
+    digest = MultiDigest()
+    digest.update(b"abc")
+    digest.update(b"def")
+
+    assert digest.hexdigests() == {
+        "md5": hashlib.md5(b"abcdef").hexdigest(),
+        "sha1": hashlib.sha1(b"abcdef").hexdigest(),
+        "sha256": hashlib.sha256(b"abcdef").hexdigest(),
+    }
+    assert digest.size_bytes == 6